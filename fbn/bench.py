@@ -0,0 +1,461 @@
+"""Offline benchmarks for the scan, state, and delivery hot paths.
+
+``fbn bench`` times the DOM scan script, post extraction, timestamp parsing,
+state observation, pending-row loading, and digest rendering over recorded
+fixture pages and synthetic feeds of up to 5,000 items, and prints one JSON
+report that can be diffed between revisions. The report also compares the fast
+timestamp parser with the dateparser fallback it replaces on the common path,
+and times the CLI import with ``python -X importtime``. Nothing here opens
+Facebook, the user's browser profile or state file, or a network
+connection.
+"""
+
+from __future__ import annotations
+
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .config import BrowserSettings
+from .exceptions import BrowserUnavailableError
+from .extractor import (
+    _TimestampParser,
+    extract_posts,
+    parse_facebook_timestamp,
+    parse_group_ref,
+)
+from .models import PendingNotification, Post
+from .notifications import render_digest_chunks
+from .state import SQLiteStateRepository
+
+TIMESTAMP_SAMPLES = (
+    "Just now",
+    "41m",
+    "22h",
+    "3d",
+    "2 minutes ago",
+    "5 hours ago",
+    "1 week ago",
+    "Today at 09:30",
+    "Yesterday at 14:48",
+    "26 July at 14:48",
+    "3 Mar at 7:05",
+)
+# Dependencies that must load on first use, never when the CLI is imported.
+HEAVY_STARTUP_MODULES = frozenset({"apprise", "dateparser", "playwright"})
+FEED_SIZES = (10, 100, 1_000, 5_000)
+MAX_FEED_SIZE = 5_000
+# Recorded feed pages scanned by the DOM benchmark when they are present.
+FEED_FIXTURES = (
+    "feed.html",
+    "photo_feed.html",
+    "positioned_wrapper_feed.html",
+    "alias_feed.html",
+)
+REPORT_SCHEMA = 1
+_OBSERVED_AT = datetime(2026, 7, 28, 12, tzinfo=timezone.utc)
+_GROUP = parse_group_ref("test-group")
+_TIMEZONE = "America/New_York"
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """The best observed timing of one benchmark.
+
+    ``size`` is the number of feed items one call processes, and ``source``
+    names the fixture or synthetic input it ran against.
+    """
+
+    name: str
+    calls: int
+    seconds: float
+    size: int | None = None
+    source: str | None = None
+
+    @property
+    def microseconds_per_call(self) -> float:
+        return self.seconds / self.calls * 1_000_000
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "source": self.source,
+            "size": self.size,
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "microseconds_per_call": self.microseconds_per_call,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkReport:
+    """Every result of one ``fbn bench`` run and the benchmarks it skipped."""
+
+    results: tuple[BenchmarkResult, ...]
+    repeat: int
+    skipped: tuple[str, ...] = field(default=())
+
+    def as_dict(self) -> dict[str, object]:
+        """Return a JSON-ready report keyed for comparison across revisions."""
+
+        return {
+            "schema": REPORT_SCHEMA,
+            "fbn_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(terse=True),
+            "repeat": self.repeat,
+            "results": [result.as_dict() for result in self.results],
+            "skipped": list(self.skipped),
+        }
+
+
+def _best_of(
+    name: str,
+    function: Callable[[str], object],
+    samples: Sequence[str],
+    *,
+    rounds: int,
+    repeat: int,
+) -> BenchmarkResult:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for sample in samples:
+                function(sample)
+        best = min(best, time.perf_counter() - started)
+    return BenchmarkResult(
+        name=name,
+        calls=rounds * len(samples),
+        seconds=best,
+        source="corpus",
+    )
+
+
+def bench_timestamp_parsing(
+    *,
+    rounds: int = 20,
+    repeat: int = 3,
+    timezone_name: str = "America/New_York",
+) -> tuple[BenchmarkResult, BenchmarkResult]:
+    """Time the fast timestamp parser and the dateparser path on one corpus."""
+
+    parser = _TimestampParser(_OBSERVED_AT, timezone_name)
+    return (
+        _best_of(
+            "timestamp_fast_path",
+            parser,
+            TIMESTAMP_SAMPLES,
+            rounds=rounds,
+            repeat=repeat,
+        ),
+        _best_of(
+            "timestamp_dateparser",
+            parser._parse_with_dateparser,
+            TIMESTAMP_SAMPLES,
+            rounds=rounds,
+            repeat=repeat,
+        ),
+    )
+
+
+def _best_time(prepare: Callable[[], Callable[[], object]], *, repeat: int) -> float:
+    # ``prepare`` runs untimed before every repeat, so each timed call starts
+    # from the same state.
+    best = float("inf")
+    for _ in range(repeat):
+        operation = prepare()
+        started = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+_FEED_ITEM = """
+<div aria-posinset="{position}">
+  <article role="article">
+    <h2><a href="https://www.facebook.com/member{member}">{author}</a></h2>
+    <div>{text}</div>
+    <a href="{href}">{timestamp}</a>
+  </article>
+</div>"""
+
+
+def synthetic_payloads(count: int, *, first_post: int = 1) -> list[dict[str, Any]]:
+    """Return ``count`` DOM payloads shaped like ``DOM_SCAN_SCRIPT`` output."""
+
+    payloads: list[dict[str, Any]] = []
+    for index in range(count):
+        post_id = first_post + index
+        payloads.append(
+            {
+                "href": (
+                    f"https://www.facebook.com/groups/{_GROUP.key}/posts/"
+                    f"{post_id}/?__cft__=tracking"
+                ),
+                "text": " ".join([f"Synthetic post {post_id} body."] * (1 + index % 8)),
+                "author": f"Member {index % 97}",
+                "partial": index % 5 == 0,
+                "position": index,
+                "timestamp": TIMESTAMP_SAMPLES[index % len(TIMESTAMP_SAMPLES)],
+            }
+        )
+    return payloads
+
+
+def synthetic_feed_html(count: int) -> str:
+    """Return a rendered group feed page with ``count`` semantic feed items."""
+
+    items = "".join(
+        _FEED_ITEM.format(
+            position=payload["position"] + 1,
+            member=payload["position"] % 97,
+            author=payload["author"],
+            text=payload["text"],
+            href=payload["href"],
+            timestamp=payload["timestamp"],
+        )
+        for payload in synthetic_payloads(count)
+    )
+    return (
+        '<!doctype html><html lang="en"><body><main role="main">'
+        f'<div role="feed">{items}</div></main></body></html>'
+    )
+
+
+def _extract(payloads: Sequence[Mapping[str, Any]]) -> tuple[Post, ...]:
+    return extract_posts(
+        payloads,
+        _GROUP,
+        _OBSERVED_AT,
+        max(len(payloads), 1),
+        timezone_name=_TIMEZONE,
+    )
+
+
+def bench_extract_posts(size: int, *, repeat: int = 3) -> BenchmarkResult:
+    """Time converting ``size`` synthetic DOM payloads into posts."""
+
+    payloads = synthetic_payloads(size)
+    seconds = _best_time(lambda: lambda: _extract(payloads), repeat=repeat)
+    return BenchmarkResult(
+        "extract_posts",
+        calls=1,
+        seconds=seconds,
+        size=size,
+        source="synthetic",
+    )
+
+
+def bench_parse_facebook_timestamp(
+    *,
+    rounds: int = 20,
+    repeat: int = 3,
+) -> BenchmarkResult:
+    """Time the public timestamp parser over the rendered timestamp corpus."""
+
+    def parse_corpus() -> None:
+        for _ in range(rounds):
+            for sample in TIMESTAMP_SAMPLES:
+                parse_facebook_timestamp(
+                    sample,
+                    _OBSERVED_AT,
+                    timezone_name=_TIMEZONE,
+                )
+
+    return BenchmarkResult(
+        "parse_facebook_timestamp",
+        calls=rounds * len(TIMESTAMP_SAMPLES),
+        seconds=_best_time(lambda: parse_corpus, repeat=repeat),
+        source="corpus",
+    )
+
+
+def bench_state(size: int, *, repeat: int = 3) -> tuple[BenchmarkResult, ...]:
+    """Time observing, loading, and rendering ``size`` new posts.
+
+    Each repeat uses a fresh temporary state file holding a baseline scan of
+    ``size`` posts, then observes ``size`` unseen posts so every one of them
+    is queued, loads the pending rows, and renders them as digest chunks.
+    """
+
+    baseline = _extract(synthetic_payloads(size))
+    unseen = _extract(synthetic_payloads(size, first_post=size + 1))
+    timings: dict[str, float] = {}
+    with tempfile.TemporaryDirectory(prefix="fbn-bench-") as directory:
+        for run in range(repeat):
+            path = Path(directory) / f"state-{run}.sqlite3"
+            with SQLiteStateRepository(path, clock=lambda: _OBSERVED_AT) as state:
+                state.observe(_GROUP, baseline, observed_at=_OBSERVED_AT)
+                for name, operation in _state_operations(state, unseen):
+                    started = time.perf_counter()
+                    operation()
+                    elapsed = time.perf_counter() - started
+                    timings[name] = min(timings.get(name, float("inf")), elapsed)
+    return tuple(
+        BenchmarkResult(name, calls=1, seconds=seconds, size=size, source="synthetic")
+        for name, seconds in timings.items()
+    )
+
+
+def _state_operations(
+    state: SQLiteStateRepository,
+    unseen: Sequence[Post],
+) -> Iterator[tuple[str, Callable[[], object]]]:
+    yield (
+        "observe",
+        lambda: state.observe(
+            _GROUP,
+            unseen,
+            observed_at=_OBSERVED_AT,
+            load_pending=False,
+        ),
+    )
+    pending: list[PendingNotification] = []
+    connection = state._require_connection()
+    yield (
+        "_pending_rows",
+        lambda: pending.extend(state._pending_rows(connection, _GROUP.key)),
+    )
+    yield "render_digest_chunks", lambda: render_digest_chunks(_GROUP.key, pending)
+
+
+def feed_pages(
+    sizes: Iterable[int],
+    fixtures_dir: Path | None = None,
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(source, html)`` for present feed fixtures and synthetic feeds."""
+
+    if fixtures_dir is not None:
+        for name in FEED_FIXTURES:
+            path = fixtures_dir / name
+            if path.is_file():
+                yield name, path.read_text(encoding="utf-8")
+    for size in sizes:
+        yield "synthetic", synthetic_feed_html(size)
+
+
+def bench_dom_scan(
+    settings: BrowserSettings,
+    pages: Iterable[tuple[str, str]],
+    *,
+    repeat: int = 3,
+) -> tuple[BenchmarkResult, ...]:
+    """Time one ``DOM_SCAN_SCRIPT`` evaluation on each page in a headless browser.
+
+    The browser is temporary, like ``fbn doctor``'s: it never uses the profile,
+    and pages are set directly, so nothing is fetched.
+    """
+
+    # Imported lazily so the browser-free benchmarks never load Playwright.
+    from playwright.sync_api import Error as PlaywrightError
+    from playwright.sync_api import sync_playwright
+
+    from .browser import DOM_SCAN_SCRIPT
+    from .diagnostics import _launch_options
+
+    results: list[BenchmarkResult] = []
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(**_launch_options(settings))
+            try:
+                page = browser.new_page(
+                    viewport={"width": 1280, "height": 900},
+                    java_script_enabled=True,
+                )
+                for source, html in pages:
+                    page.set_content(html)
+                    best = float("inf")
+                    scanned: dict[str, Any] = {}
+                    for _ in range(repeat):
+                        started = time.perf_counter()
+                        scanned = page.evaluate(
+                            DOM_SCAN_SCRIPT,
+                            {"includeContent": True},
+                        )
+                        best = min(best, time.perf_counter() - started)
+                    results.append(
+                        BenchmarkResult(
+                            "dom_scan",
+                            calls=1,
+                            seconds=best,
+                            size=len(scanned.get("payloads") or ()),
+                            source=source,
+                        )
+                    )
+            finally:
+                browser.close()
+    except PlaywrightError as exc:
+        raise BrowserUnavailableError(
+            "The selected browser failed its local headless launch check."
+        ) from exc
+    return tuple(results)
+
+
+def run_benchmarks(
+    *,
+    sizes: Sequence[int] = FEED_SIZES,
+    repeat: int = 3,
+    fixtures_dir: Path | None = None,
+    browser: BrowserSettings | None = None,
+) -> BenchmarkReport:
+    """Run every benchmark; the DOM scan runs only when ``browser`` is set."""
+
+    if not sizes or any(
+        isinstance(size, bool) or not 1 <= size <= MAX_FEED_SIZE for size in sizes
+    ):
+        raise ValueError(f"benchmark sizes must be between 1 and {MAX_FEED_SIZE}")
+    if isinstance(repeat, bool) or repeat < 1:
+        raise ValueError("benchmark repeat must be positive")
+
+    results: list[BenchmarkResult] = []
+    skipped: list[str] = []
+    if browser is None:
+        skipped.append("dom_scan: disabled")
+    else:
+        try:
+            results.extend(
+                bench_dom_scan(browser, feed_pages(sizes, fixtures_dir), repeat=repeat)
+            )
+        except BrowserUnavailableError:
+            skipped.append("dom_scan: headless browser unavailable")
+    results.append(bench_parse_facebook_timestamp(repeat=repeat))
+    results.extend(bench_timestamp_parsing(repeat=repeat))
+    results.append(bench_cli_import(repeat=repeat))
+    for size in sizes:
+        results.append(bench_extract_posts(size, repeat=repeat))
+        results.extend(bench_state(size, repeat=repeat))
+    return BenchmarkReport(tuple(results), repeat=repeat, skipped=tuple(skipped))
+
+
+def import_times(module: str = "fbn.cli") -> dict[str, int]:
+    """Return cumulative microseconds per module from a fresh interpreter."""
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def bench_cli_import(*, repeat: int = 3) -> BenchmarkResult:
+    """Time a cold ``import fbn.cli`` in fresh interpreters."""
+
+    best = min(import_times("fbn.cli")["fbn.cli"] for _ in range(repeat))
+    return BenchmarkResult(name="cli_import", calls=1, seconds=best / 1_000_000)
@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import os
 import time
-from collections.abc import Callable, Iterator, Mapping, Sequence
+from collections import deque
+from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from collections.abc import Set as AbstractSet
 from contextlib import ExitStack, contextmanager, suppress
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from urllib.parse import urljoin, urlparse
 
 from filelock import FileLock
@@ -18,30 +27,51 @@ from filelock import Timeout as FileLockTimeout
 from playwright.sync_api import (
     BrowserContext,
     Page,
+    Response,
+    Route,
     sync_playwright,
 )
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from .config import BrowserSettings
+from .config import BrowserSettings, SessionSettings
 from .exceptions import (
     AccessDeniedError,
     AccountActionRequiredError,
     AuthenticationRequiredError,
     BrowserUnavailableError,
     ConfigurationError,
+    FbnError,
     LayoutChangedError,
     ProfileInUseError,
     TransientNavigationError,
 )
 from .extractor import chronological_group_url, extract_posts
 from .logging import get_logger
+from .metrics import MetricsRegistry
 from .models import GroupRef, Post, ScanPolicy, ScanResult
 
 FACEBOOK_HOME_URL = "https://www.facebook.com/"
+BLOCKED_RESOURCE_TYPES = frozenset({"font", "image", "media", "ping"})
 LOGGER = get_logger("browser")
+_T = TypeVar("_T")
+# Scan steps yield the seconds they would otherwise sleep, so one driver can
+# interleave several pages on Playwright's single-threaded sync API.
+_Steps = Generator[float, None, _T]
+# Returns which of a group's candidate post IDs are already recorded.
+KnownPostProbe = Callable[[GroupRef, Sequence[str]], AbstractSet[str]]
 DOM_SCAN_SCRIPT = """
-(includeContent) => {
+(options) => {
+  // A boolean argument selects content collection. An options object can also
+  // request incremental mode, which returns only feed items not returned
+  // unchanged by an earlier incremental call on this page.
+  const settings = options !== null && typeof options === 'object'
+    ? options
+    : { includeContent: Boolean(options) };
+  const includeContent = Boolean(settings.includeContent);
+  const returnedContainers = includeContent && settings.incremental
+    ? (window.__fbnReturnedContainers ||= new WeakMap())
+    : null;
   const linkSelector =
     'a[href*="/groups/"][href*="/posts/"],' +
     'a[href*="/groups/"][href*="/permalink/"],' +
@@ -145,6 +175,7 @@ DOM_SCAN_SCRIPT = """
   );
   const seenContainers = new Set();
   const payloads = [];
+  let postCount = 0;
 
   for (const anchor of anchors) {
     const feedRoot = anchor.closest(feedSelector);
@@ -200,6 +231,8 @@ DOM_SCAN_SCRIPT = """
       // identity of its outer feed item.
       continue;
     }
+    postCount += 1;
+    const href = selected.href || selected.getAttribute('href') || '';
     const authorElement = container.querySelector(
       'h2 a, h3 a, h4 a, strong a'
     );
@@ -216,36 +249,235 @@ DOM_SCAN_SCRIPT = """
       || (isTimestampText(selectedText) ? selected : null);
     const timestamp = timestampElement ? visualText(timestampElement) : '';
 
-    payloads.push(
-      includeContent
-        ? {
-            href: selected.href || selected.getAttribute('href') || '',
-            text: cleanContainerText(
-              container,
-              authorElement,
-              timestampElement
-            ),
-            author: authorElement
-              ? (authorElement.innerText || '').trim()
-              : null,
-            partial: collapsed,
-            position: payloads.length,
-            timestamp,
-          }
-        : null
-    );
+    if (!includeContent) {
+      payloads.push(null);
+      continue;
+    }
+    const payload = {
+      href,
+      text: cleanContainerText(container, authorElement, timestampElement),
+      author: authorElement ? (authorElement.innerText || '').trim() : null,
+      partial: collapsed,
+      position: payloads.length,
+      timestamp,
+    };
+    if (returnedContainers) {
+      // Key on the whole payload, not the element: a virtualized feed can
+      // recycle a container for a different post, and a container returned
+      // while still loading must be sent again once it has changed.
+      const signature = JSON.stringify([
+        href, payload.text, payload.author, collapsed, timestamp,
+      ]);
+      if (returnedContainers.get(container) === signature) {
+        continue;
+      }
+      if (href) {
+        returnedContainers.set(container, signature);
+      }
+    }
+    payloads.push(payload);
   }
 
   return {
     hasFeed: feedRoots.length > 0,
     itemCount: new Set(semanticItems).size,
-    postCount: payloads.length,
+    postCount,
     payloads: includeContent ? payloads : [],
   };
 }
 """
 
 
+# Install a feed observer, then scroll. Installing first means mutations caused
+# by the scroll itself cannot be missed.
+SCROLL_AND_OBSERVE_SCRIPT = """
+() => {
+  const itemSelector = '[aria-posinset],[data-pagelet*="FeedUnit"]';
+  const feedSelector = '[role="feed"],[data-pagelet*="GroupFeed"]';
+  if (window.__fbnSettle) {
+    window.__fbnSettle.observer.disconnect();
+  }
+  const state = {
+    addedItems: 0,
+    lastMutation: performance.now(),
+    observer: null,
+  };
+  state.observer = new MutationObserver((records) => {
+    state.lastMutation = performance.now();
+    for (const record of records) {
+      for (const node of record.addedNodes) {
+        if (
+          node.nodeType === Node.ELEMENT_NODE
+          && (node.matches(itemSelector) || node.querySelector(itemSelector))
+        ) {
+          state.addedItems += 1;
+        }
+      }
+    }
+  });
+  const roots = Array.from(document.querySelectorAll(feedSelector));
+  for (const root of roots.length ? roots : [document.body]) {
+    state.observer.observe(root, { childList: true, subtree: true });
+  }
+  window.__fbnSettle = state;
+  window.scrollBy(0, Math.max(window.innerHeight * 0.8, 600));
+}
+"""
+SETTLE_POLL_SCRIPT = """
+({ itemQuietMs, quietMs }) => {
+  const state = window.__fbnSettle;
+  if (!state) {
+    return { settled: true, addedItems: 0 };
+  }
+  const idle = performance.now() - state.lastMutation;
+  const settled = state.addedItems > 0 ? idle >= itemQuietMs : idle >= quietMs;
+  if (settled) {
+    state.observer.disconnect();
+    window.__fbnSettle = null;
+  }
+  return { settled, addedItems: state.addedItems };
+}
+"""
+SETTLE_POLL_SECONDS = 0.05
+# Once new feed items arrive, a short pause lets their siblings attach. Without
+# new items, a longer pause means the feed has stopped loading.
+SETTLE_ITEM_QUIET_SECONDS = 0.15
+SETTLE_QUIET_SECONDS = 0.6
+
+
+ACCOUNT_ACTION_PATH_MARKERS = (
+    "/checkpoint",
+    "/two_step_verification",
+    "/consent",
+    "/captcha",
+)
+LOGIN_PATH_PREFIXES = ("/login", "/recover")
+RATE_LIMIT_TEXT_MARKERS = (
+    "temporarily blocked",
+    "too many requests",
+    "try again later",
+)
+ACCESS_DENIED_TEXT_MARKERS = (
+    "content isn't available",
+    "content is not available",
+    "don't have permission",
+    "do not have permission",
+)
+EMPTY_FEED_TEXTS = ("No posts yet", "There are no posts")
+PAGE_SIGNALS_SCRIPT = (
+    """
+({
+  rateLimitMarkers,
+  accessDeniedMarkers,
+  emptyTexts,
+  feedOptions = false,
+  includeAliases = false,
+}) => {
+  const scanFeed = """
+    + DOM_SCAN_SCRIPT.strip()
+    + """;
+  // Mirrors Playwright's isVisible(): a non-empty box and not hidden.
+  const isVisible = (element) => {
+    const bounds = element.getBoundingClientRect();
+    return bounds.width > 0
+      && bounds.height > 0
+      && getComputedStyle(element).visibility !== 'hidden';
+  };
+  const firstIsVisible = (selector) => {
+    const element = document.querySelector(selector);
+    return Boolean(element && isVisible(element));
+  };
+  const guarded = (read, fallback) => {
+    try {
+      return read();
+    } catch (error) {
+      return fallback;
+    }
+  };
+
+  const surface = document.querySelector('[role="main"]') || document.body;
+  const mainText = guarded(
+    () => (surface ? surface.innerText || '' : '').slice(0, 50_000).toLowerCase(),
+    ''
+  );
+  const hasExplicitEmpty = guarded(() => {
+    if (firstIsVisible('[data-fbn-state="empty"]')) {
+      return true;
+    }
+    // Match exact, whitespace-normalized text outside any feed item, like
+    // get_by_text(exact=True), but walk text nodes instead of every element.
+    const walker = document.createTreeWalker(
+      document.body,
+      NodeFilter.SHOW_TEXT
+    );
+    let candidates = 0;
+    while (walker.nextNode() && candidates < 20 * emptyTexts.length) {
+      const text = walker.currentNode.nodeValue.replace(/\\s+/g, ' ').trim();
+      if (!emptyTexts.includes(text)) {
+        continue;
+      }
+      candidates += 1;
+      const element = walker.currentNode.parentElement;
+      if (
+        element
+        && isVisible(element)
+        && !element.closest(
+          '[role="article"],[aria-posinset],[data-pagelet*="FeedUnit"]'
+        )
+      ) {
+        return true;
+      }
+    }
+    return false;
+  }, false);
+  // One traversal yields the feed counts and, when requested, the content
+  // payloads for the same scroll pass.
+  const feed = scanFeed(feedOptions);
+  const aliasHrefs = includeAliases
+    ? guarded(
+        () => Array.from(
+          document.querySelectorAll(
+            '[role="main"] [role="tablist"] a[role="tab"][href*="/groups/"]'
+          )
+        )
+          .slice(0, 100)
+          .filter((link) => (
+            isVisible(link)
+            && !link.closest('[role="feed"],[data-pagelet*="GroupFeed"]')
+          ))
+          .map((link) => link.getAttribute('href'))
+          .filter(Boolean),
+        []
+      )
+    : [];
+
+  return {
+    hasFeed: feed.hasFeed,
+    itemCount: feed.itemCount,
+    postCount: feed.postCount,
+    payloads: feed.payloads,
+    aliasHrefs,
+    hasLoginForm: guarded(
+      () => firstIsVisible('input[name="email"]')
+        || firstIsVisible('input[name="pass"]'),
+      false
+    ),
+    hasAccountAction: guarded(
+      () => firstIsVisible('input[name="approvals_code"]')
+        || firstIsVisible('iframe[src*="captcha"]'),
+      false
+    ),
+    hasRateLimit: rateLimitMarkers.some((marker) => mainText.includes(marker)),
+    hasAccessDenied: accessDeniedMarkers.some(
+      (marker) => mainText.includes(marker)
+    ),
+    hasExplicitEmpty,
+  };
+}
+"""
+)
+
+
 class PageState(str, Enum):
     """Recognized safe page states."""
 
@@ -269,6 +501,15 @@ class PageSignals:
     has_explicit_empty: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class PageSnapshot:
+    """Page-state signals plus the extraction inputs read in the same pass."""
+
+    signals: PageSignals
+    alias_hrefs: tuple[str, ...] = ()
+    payloads: tuple[dict[str, object], ...] = ()
+
+
 def classify_page(signals: PageSignals) -> PageState:
     """Classify recognized states or raise a typed fail-closed error."""
 
@@ -317,98 +558,76 @@ def classify_page(signals: PageSignals) -> PageState:
     )
 
 
-def _is_visible(page: Page, selector: str) -> bool:
-    locator = page.locator(selector)
-    try:
-        return locator.count() > 0 and locator.first.is_visible()
-    except PlaywrightError:
-        return False
-
+def read_page_signals(page: Page, *, status: int | None = None) -> PageSignals:
+    """Read only coarse page-state signals; never return page content.
 
-def _has_explicit_empty_state(page: Page) -> bool:
-    if _is_visible(page, '[data-fbn-state="empty"]'):
-        return True
-    for text in ("No posts yet", "There are no posts"):
-        locator = page.get_by_text(text, exact=True)
-        try:
-            for index in range(min(locator.count(), 20)):
-                candidate = locator.nth(index)
-                if candidate.is_visible() and candidate.evaluate(
-                    """
-                    (element) => !element.closest(
-                      '[role="article"],[aria-posinset],'
-                      + '[data-pagelet*="FeedUnit"]'
-                    )
-                    """
-                ):
-                    return True
-        except PlaywrightError:
-            continue
-    return False
+    Every DOM-derived signal comes from one ``PAGE_SIGNALS_SCRIPT`` evaluation,
+    so each poll of ``wait_for_terminal_page`` costs a single round trip.
+    """
 
+    return read_page_snapshot(page, status=status).signals
 
-def read_page_signals(page: Page, *, status: int | None = None) -> PageSignals:
-    """Read only coarse page-state signals; never return page content."""
-
-    parsed = urlparse(page.url)
-    path = parsed.path.lower()
-    action_path = any(
-        marker in path
-        for marker in (
-            "/checkpoint",
-            "/two_step_verification",
-            "/consent",
-            "/captcha",
-        )
-    )
-    login_path = path.startswith("/login") or path.startswith("/recover")
 
-    main_text = ""
-    try:
-        main = page.locator('[role="main"]')
-        surface = main.first if main.count() else page.locator("body").first
-        main_text = surface.inner_text(timeout=1_000)[:50_000].casefold()
-    except PlaywrightError:
-        pass
-
-    has_rate_limit = any(
-        marker in main_text
-        for marker in (
-            "temporarily blocked",
-            "too many requests",
-            "try again later",
-        )
-    )
-    has_access_denied = any(
-        marker in main_text
-        for marker in (
-            "content isn't available",
-            "content is not available",
-            "don't have permission",
-            "do not have permission",
-        )
+def read_page_snapshot(
+    page: Page,
+    *,
+    status: int | None = None,
+    extract: bool = False,
+) -> PageSnapshot:
+    """Read page-state signals and, with ``extract``, scan inputs in one pass.
+
+    Extraction adds the group-navigation alias hrefs and the incremental
+    content payloads from the same ``PAGE_SIGNALS_SCRIPT`` evaluation, so a
+    scroll pass classifies and extracts with one DOM traversal.
+    """
+
+    url = page.url
+    path = urlparse(url).path.lower()
+    action_path = any(marker in path for marker in ACCOUNT_ACTION_PATH_MARKERS)
+    login_path = path.startswith(LOGIN_PATH_PREFIXES)
+
+    signals = _evaluate(
+        page,
+        PAGE_SIGNALS_SCRIPT,
+        {
+            "rateLimitMarkers": RATE_LIMIT_TEXT_MARKERS,
+            "accessDeniedMarkers": ACCESS_DENIED_TEXT_MARKERS,
+            "emptyTexts": EMPTY_FEED_TEXTS,
+            "feedOptions": (
+                {"includeContent": True, "incremental": True} if extract else False
+            ),
+            "includeAliases": extract,
+        },
     )
-    has_explicit_empty = _has_explicit_empty_state(page)
-
-    feed_signals = page.evaluate(DOM_SCAN_SCRIPT, False)
-    if not isinstance(feed_signals, dict):
-        feed_signals = {}
+    if not isinstance(signals, dict):
+        signals = {}
+    alias_hrefs = signals.get("aliasHrefs")
+    payloads = signals.get("payloads")
 
-    return PageSignals(
-        url=page.url,
+    page_signals = PageSignals(
+        url=url,
         status=status,
-        feed_item_count=int(feed_signals.get("itemCount", 0)),
-        post_count=int(feed_signals.get("postCount", 0)),
-        has_feed=feed_signals.get("hasFeed") is True,
-        has_login=login_path
-        or _is_visible(page, 'input[name="email"]')
-        or _is_visible(page, 'input[name="pass"]'),
-        has_account_action=action_path
-        or _is_visible(page, 'input[name="approvals_code"]')
-        or _is_visible(page, 'iframe[src*="captcha"]'),
-        has_access_denied=has_access_denied,
-        has_rate_limit=has_rate_limit,
-        has_explicit_empty=has_explicit_empty,
+        feed_item_count=int(signals.get("itemCount", 0)),
+        post_count=int(signals.get("postCount", 0)),
+        has_feed=signals.get("hasFeed") is True,
+        has_login=login_path or signals.get("hasLoginForm") is True,
+        has_account_action=action_path or signals.get("hasAccountAction") is True,
+        has_access_denied=signals.get("hasAccessDenied") is True,
+        has_rate_limit=signals.get("hasRateLimit") is True,
+        has_explicit_empty=signals.get("hasExplicitEmpty") is True,
+    )
+    return PageSnapshot(
+        signals=page_signals,
+        alias_hrefs=(
+            tuple(href for href in alias_hrefs if isinstance(href, str))
+            if isinstance(alias_hrefs, list)
+            else ()
+        ),
+        payloads=(
+            tuple(payload for payload in payloads if isinstance(payload, dict))
+            if isinstance(payloads, list)
+            else ()
+        ),
     )
 
 
@@ -421,9 +640,82 @@ def wait_for_terminal_page(
 ) -> PageState:
     """Poll through dynamic feed skeletons until a recognized state appears."""
 
+    return _drive(
+        page,
+        _terminal_page_steps(
+            page,
+            status=status,
+            timeout_seconds=timeout_seconds,
+            expected_group=expected_group,
+        ),
+    )
+
+
+def _evaluate(page: Page, script: str, argument: object = None) -> Any:
+    """Run a scan script, bounded by the page's default timeout.
+
+    ``page.evaluate`` has no timeout of its own, so a renderer stuck in a
+    script would block every tab of the pool. ``wait_for_function`` runs the
+    script at once and is cut off by the timeout. The result is wrapped in an
+    array so a falsy return value still ends the wait.
+    """
+
+    handle = page.wait_for_function(
+        f"(argument) => [({script})(argument)]", arg=argument
+    )
+    try:
+        return handle.json_value()[0]
+    finally:
+        handle.dispose()
+
+
+def _drive(page: Page, steps: _Steps[_T]) -> _T:
+    """Run scan steps on one page, sleeping through each requested delay."""
+
+    while True:
+        try:
+            delay = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        page.wait_for_timeout(delay * 1_000)
+
+
+def _terminal_page_steps(
+    page: Page,
+    *,
+    status: int | None,
+    timeout_seconds: float,
+    expected_group: GroupRef | None,
+) -> _Steps[PageState]:
+    state, _ = yield from _terminal_snapshot_steps(
+        page,
+        status=status,
+        timeout_seconds=timeout_seconds,
+        expected_group=expected_group,
+        extract=False,
+    )
+    return state
+
+
+def _terminal_snapshot_steps(
+    page: Page,
+    *,
+    status: int | None,
+    timeout_seconds: float,
+    expected_group: GroupRef | None,
+    extract: bool,
+) -> _Steps[tuple[PageState, PageSnapshot]]:
     deadline = time.monotonic() + timeout_seconds
     while True:
-        signals = read_page_signals(page, status=status)
+        # Payloads only exist when posts are present, and a page with posts is
+        # either a feed or a fatal state, so a retried poll never discards
+        # incremental payloads that a later poll would skip.
+        snapshot = (
+            read_page_snapshot(page, status=status, extract=True)
+            if extract
+            else PageSnapshot(read_page_signals(page, status=status))
+        )
+        signals = snapshot.signals
         try:
             state = classify_page(signals)
         except LayoutChangedError:
@@ -437,7 +729,7 @@ def wait_for_terminal_page(
             remaining = deadline - time.monotonic()
             if remaining <= 0:
                 raise
-            page.wait_for_timeout(min(0.25, remaining) * 1_000)
+            yield min(0.25, remaining)
             continue
         if expected_group is not None and not _is_expected_group_url(
             signals.url,
@@ -453,7 +745,39 @@ def wait_for_terminal_page(
             feed_item_count=signals.feed_item_count,
             post_link_count=signals.post_count,
         )
-        return state
+        return state, snapshot
+
+
+def _settle_steps(page: Page, group: GroupRef, limit_seconds: float) -> _Steps[None]:
+    """Wait until the feed observer reports new items or quiet, up to a limit."""
+
+    started = time.monotonic()
+    deadline = started + limit_seconds
+    added_items = 0
+    settled = False
+    while not settled:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        yield min(SETTLE_POLL_SECONDS, remaining)
+        result = _evaluate(
+            page,
+            SETTLE_POLL_SCRIPT,
+            {
+                "itemQuietMs": SETTLE_ITEM_QUIET_SECONDS * 1_000,
+                "quietMs": SETTLE_QUIET_SECONDS * 1_000,
+            },
+        )
+        if isinstance(result, dict):
+            settled = result.get("settled") is True
+            added_items = int(result.get("addedItems", 0))
+    LOGGER.debug(
+        "Feed settled after scroll",
+        group_key=group.key,
+        added_item_count=added_items,
+        settle_seconds=round(time.monotonic() - started, 3),
+        timed_out=not settled,
+    )
 
 
 def _is_expected_group_url(url: str, group: GroupRef) -> bool:
@@ -470,40 +794,17 @@ def _is_expected_group_url(url: str, group: GroupRef) -> bool:
     )
 
 
-def collect_dom_payloads(page: Page) -> list[dict[str, object]]:
-    """Collect minimal visible post payloads from the current DOM."""
-
-    result = page.evaluate(DOM_SCAN_SCRIPT, True)
-    if not isinstance(result, dict):
-        return []
-    payloads = result.get("payloads")
-    return payloads if isinstance(payloads, list) else []
-
-
-def collect_group_aliases(page: Page, group: GroupRef) -> frozenset[str]:
-    """Resolve one visible group-navigation alias without trusting page content."""
+def group_aliases_from_hrefs(
+    page_url: str,
+    hrefs: Iterable[str],
+    group: GroupRef,
+) -> frozenset[str]:
+    """Accept a navigation alias only when exactly one group path is linked."""
 
     discovered: set[str] = set()
-    links = page.locator(
-        '[role="main"] [role="tablist"] a[role="tab"][href*="/groups/"]'
-    )
     try:
-        for index in range(min(links.count(), 100)):
-            link = links.nth(index)
-            if not link.is_visible() or link.evaluate(
-                """
-                (element) => Boolean(
-                  element.closest(
-                    '[role="feed"],[data-pagelet*="GroupFeed"]'
-                  )
-                )
-                """
-            ):
-                continue
-            href = link.get_attribute("href")
-            if not href:
-                continue
-            parsed = urlparse(urljoin(page.url, href))
+        for href in hrefs:
+            parsed = urlparse(urljoin(page_url, href))
             parts = parsed.path.strip("/").split("/")
             if (
                 parsed.hostname
@@ -516,7 +817,7 @@ def collect_group_aliases(page: Page, group: GroupRef) -> frozenset[str]:
                 and parts[1]
             ):
                 discovered.add(parts[1])
-    except (PlaywrightError, ValueError):
+    except ValueError:
         return frozenset({group.key})
 
     if len(discovered) == 1:
@@ -524,17 +825,182 @@ def collect_group_aliases(page: Page, group: GroupRef) -> frozenset[str]:
     return frozenset({group.key})
 
 
+def _process_tree_rss_bytes(root_pid: int) -> int | None:
+    """Return the resident memory of a process's descendants on Linux."""
+
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    children: dict[int, list[int]] = {}
+    resident: dict[int, int] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text(encoding="ascii", errors="replace")
+            statm = (entry / "statm").read_text(encoding="ascii")
+            # The command name may contain spaces or parentheses; the parent
+            # PID is the second field after its closing parenthesis.
+            parent = int(stat[stat.rindex(")") + 2 :].split()[1])
+            pages = int(statm.split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        pid = int(entry.name)
+        children.setdefault(parent, []).append(pid)
+        resident[pid] = pages * page_size
+
+    total = 0
+    pending = list(children.get(root_pid, ()))
+    while pending:
+        pid = pending.pop()
+        total += resident.get(pid, 0)
+        pending.extend(children.get(pid, ()))
+    return total
+
+
+@contextmanager
+def _navigation_errors() -> Iterator[None]:
+    """Map raw Playwright failures to a redacted transient navigation error."""
+
+    try:
+        yield
+    except PlaywrightTimeoutError as exc:
+        raise TransientNavigationError(
+            "Facebook group navigation timed out; no immediate retry was attempted."
+        ) from exc
+    except PlaywrightError as exc:
+        raise TransientNavigationError(
+            "Facebook group navigation failed; no immediate retry was attempted."
+        ) from exc
+
+
+def _close_page(page: Page) -> None:
+    with suppress(PlaywrightError):
+        page.close()
+
+
+class _RequestFilter:
+    """Abort scan requests the DOM reader never uses and count the rest."""
+
+    def __init__(self, allowed_hosts: Sequence[str]) -> None:
+        self._allowed_hosts = tuple(allowed_hosts)
+        self.blocked = 0
+        self.allowed = 0
+        self.allowed_bytes = 0
+
+    def install(self, page: Page) -> None:
+        page.route("**/*", self._route)
+        page.on("response", self._record_response)
+
+    def allows(self, resource_type: str, url: str) -> bool:
+        if resource_type in BLOCKED_RESOURCE_TYPES:
+            return False
+        try:
+            hostname = (urlparse(url).hostname or "").casefold()
+        except ValueError:
+            return False
+        # Inline data and blob URLs have no host and never reach the network.
+        return not hostname or any(
+            hostname == allowed or hostname.endswith(f".{allowed}")
+            for allowed in self._allowed_hosts
+        )
+
+    def log(self, group: GroupRef) -> None:
+        LOGGER.debug(
+            "Feed requests filtered",
+            group_key=group.key,
+            blocked_count=self.blocked,
+            allowed_count=self.allowed,
+            allowed_bytes=self.allowed_bytes,
+        )
+
+    def _route(self, route: Route) -> None:
+        request = route.request
+        with suppress(PlaywrightError):
+            if self.allows(request.resource_type, request.url):
+                self.allowed += 1
+                route.continue_()
+            else:
+                self.blocked += 1
+                route.abort("blockedbyclient")
+
+    def _record_response(self, response: Response) -> None:
+        # Aborted requests never transfer a body, so only allowed bytes are
+        # known; chunked responses without a length are not counted.
+        length = response.headers.get("content-length", "")
+        if length.isdigit():
+            self.allowed_bytes += int(length)
+
+
+@dataclass(slots=True)
+class _BrowserTab:
+    """One group scan in progress inside a shared context."""
+
+    index: int
+    group: GroupRef
+    page: Page
+    requests: _RequestFilter | None
+    steps: _Steps[ScanResult]
+    wake_at: float
+    deadline: float
+    timeout_seconds: float
+
+
+@dataclass(slots=True)
+class _BrowserSession:
+    """One launched persistent context retained between scheduled checks."""
+
+    stack: ExitStack
+    context: BrowserContext
+    timezone_id: str
+    checks: int = 0
+    closed: bool = False
+
+
 class PlaywrightPostSource:
-    """Fetch visible recent posts through a dedicated persistent browser."""
+    """Fetch visible recent posts through a dedicated persistent browser.
+
+    With ``session`` settings, ``fetch_recent`` keeps the Playwright driver,
+    persistent context, and profile lock alive between calls. Use the source as
+    a context manager, or call ``close()``, to release them. ``tabs`` bounds
+    how many pages ``fetch_many`` keeps open at once. Launch, navigation,
+    page-state, extraction, and scroll timings are recorded in ``metrics``.
+    With a ``known_posts`` probe, a policy's ``stop_after_known`` ends a feed
+    scan at the first run of that many consecutive already-recorded posts.
+    """
 
     def __init__(
         self,
         settings: BrowserSettings,
         *,
         playwright_factory: Callable[[], Any] = sync_playwright,
+        session: SessionSettings | None = None,
+        tabs: int = 1,
+        metrics: MetricsRegistry | None = None,
+        known_posts: KnownPostProbe | None = None,
     ) -> None:
+        if isinstance(tabs, bool) or not isinstance(tabs, int) or tabs < 1:
+            raise ConfigurationError("tabs must be a positive integer")
         self.settings = settings
+        self._metrics = MetricsRegistry() if metrics is None else metrics
+        self._known_posts = known_posts
         self._playwright_factory = playwright_factory
+        self._session_settings = session
+        self._tabs = tabs
+        self._session: _BrowserSession | None = None
+
+    def __enter__(self) -> PlaywrightPostSource:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        del args
+        self.close()
+
+    def close(self) -> None:
+        """Close a retained browser session; repeated calls are safe."""
+
+        self._close_session("closed")
 
     def interactive_login(self, wait_for_user: Callable[[], None]) -> None:
         """Open a headed profile for optional authentication recovery."""
@@ -765,64 +1231,249 @@ class PlaywrightPostSource:
             headless=self.settings.headless,
             sample_count=policy.sample_count,
         )
-        with self._context(
-            headless=self.settings.headless,
-            timezone_id=policy.timezone_name,
-        ) as context:
+        with (
+            self._metrics.span("fetch_recent", group_key=group.key),
+            self._scan_context(policy.timezone_name) as context,
+        ):
             page: Page | None = None
+            requests: _RequestFilter | None = None
             try:
-                page = context.new_page()
-                page.set_default_timeout(policy.navigation_timeout_seconds * 1_000)
-                page.set_default_navigation_timeout(
-                    policy.navigation_timeout_seconds * 1_000
-                )
-                response = page.goto(
-                    chronological_group_url(group),
-                    wait_until="domcontentloaded",
-                )
-                status = response.status if response is not None else None
-                LOGGER.debug(
-                    "Feed navigation completed",
-                    group_key=group.key,
-                    response_status=status,
-                )
-                state = wait_for_terminal_page(
-                    page,
-                    status=status,
-                    timeout_seconds=policy.navigation_timeout_seconds,
-                    expected_group=group,
-                )
-                if state is PageState.EMPTY:
-                    LOGGER.info("Group feed empty", group_key=group.key)
-                    return ScanResult(
-                        posts=(),
-                        page_state=state.value,
-                        scrolls=0,
-                        bounded=False,
-                    )
-
-                observed_at = datetime.now(timezone.utc)
-                posts = self._scan_feed(page, group, policy, observed_at)
-                if not posts:
-                    raise LayoutChangedError(
-                        "A feed was present, but no supported post permalinks "
-                        "were found."
+                with _navigation_errors():
+                    page, requests = self._new_scan_page(context, policy)
+                    return _drive(
+                        page,
+                        self._fetch_steps(
+                            page,
+                            group,
+                            policy,
+                            wait_until="domcontentloaded",
+                        ),
                     )
-                return posts
-            except PlaywrightTimeoutError as exc:
-                raise TransientNavigationError(
-                    "Facebook group navigation timed out; no immediate retry "
-                    "was attempted."
-                ) from exc
-            except PlaywrightError as exc:
-                raise TransientNavigationError(
-                    "Facebook group navigation failed; no immediate retry was "
-                    "attempted."
-                ) from exc
             finally:
+                if requests is not None:
+                    requests.log(group)
                 if page is not None:
-                    with suppress(PlaywrightError):
-                        page.close()
+                    _close_page(page)
+
+    def fetch_many(
+        self,
+        groups: Sequence[GroupRef],
+        policy: ScanPolicy,
+    ) -> tuple[ScanResult | FbnError, ...]:
+        """Scan several groups in a bounded pool of tabs sharing one context.
+
+        Tabs are interleaved cooperatively: whenever one tab would wait for the
+        page to settle, another tab runs. Every Playwright call of a step is
+        capped at the time its tab has left, and a tab still unfinished after
+        ``policy.tab_timeout_seconds`` is closed with a transient failure, so a
+        slow or hung group cannot stall the others. Outcomes are returned in
+        ``groups`` order; a failure of one group does not fail the others.
+        """
+
+        outcomes: list[ScanResult | FbnError | None] = [None] * len(groups)
+        waiting = deque(enumerate(groups))
+        active: list[_BrowserTab] = []
+        LOGGER.debug(
+            "Tab pool scan started",
+            group_count=len(groups),
+            tab_count=min(self._tabs, len(groups)),
+        )
+        with (
+            self._metrics.span("fetch_many", group_count=len(groups)),
+            self._scan_context(policy.timezone_name) as context,
+        ):
+            try:
+                while waiting or active:
+                    while waiting and len(active) < self._tabs:
+                        index, group = waiting.popleft()
+                        tab = self._open_tab(context, index, group, policy)
+                        if isinstance(tab, FbnError):
+                            outcomes[index] = tab
+                        else:
+                            active.append(tab)
+
+                    for tab in list(active):
+                        now = time.monotonic()
+                        if now < tab.wake_at and now < tab.deadline:
+                            continue
+                        outcome = self._advance_tab(tab, now)
+                        if outcome is not None:
+                            outcomes[tab.index] = outcome
+                            active.remove(tab)
+                            self._close_tab(tab)
+
+                    if active and (not waiting or len(active) >= self._tabs):
+                        delay = (
+                            min(min(tab.wake_at, tab.deadline) for tab in active)
+                            - time.monotonic()
+                        )
+                        if delay > 0:
+                            self._wait_in_pool(active, delay)
+            finally:
+                for tab in active:
+                    self._close_tab(tab)
+        return tuple(
+            TransientNavigationError("The tab pool stopped before this group ran.")
+            if outcome is None
+            else outcome
+            for outcome in outcomes
+        )
+
+    def _open_tab(
+        self,
+        context: BrowserContext,
+        index: int,
+        group: GroupRef,
+        policy: ScanPolicy,
+    ) -> _BrowserTab | FbnError:
+        try:
+            with _navigation_errors():
+                page, requests = self._new_scan_page(context, policy)
+        except FbnError as exc:
+            return exc
+        now = time.monotonic()
+        # Only wait for the response to commit. Hydration is polled by the
+        # terminal-page steps, so other tabs run while this one loads.
+        steps = self._fetch_steps(page, group, policy, wait_until="commit")
+        return _BrowserTab(
+            index=index,
+            group=group,
+            page=page,
+            requests=requests,
+            steps=steps,
+            wake_at=now,
+            deadline=now + policy.tab_timeout_seconds,
+            timeout_seconds=policy.navigation_timeout_seconds,
+        )
+
+    @staticmethod
+    def _advance_tab(tab: _BrowserTab, now: float) -> ScanResult | FbnError | None:
+        if now >= tab.deadline:
+            return PlaywrightPostSource._tab_timed_out(tab)
+        # Cap every Playwright call of this step at the time the tab has left,
+        # so one hung page cannot block the single-threaded pool.
+        timeout_ms = min(tab.timeout_seconds, tab.deadline - now) * 1_000
+        try:
+            with _navigation_errors():
+                tab.page.set_default_timeout(timeout_ms)
+                tab.page.set_default_navigation_timeout(timeout_ms)
+                delay = next(tab.steps)
+        except StopIteration as stop:
+            return stop.value
+        except FbnError as exc:
+            if time.monotonic() >= tab.deadline:
+                return PlaywrightPostSource._tab_timed_out(tab)
+            return exc
+        tab.wake_at = time.monotonic() + delay
+        return None
+
+    @staticmethod
+    def _tab_timed_out(tab: _BrowserTab) -> TransientNavigationError:
+        tab.steps.close()
+        LOGGER.warning("Tab scan timed out", group_key=tab.group.key)
+        return TransientNavigationError(
+            "The group scan exceeded its tab timeout; no immediate retry was attempted."
+        )
+
+    @staticmethod
+    def _wait_in_pool(active: Sequence[_BrowserTab], delay: float) -> None:
+        """Wait through Playwright so every tab keeps handling its events.
+
+        Sync Playwright only dispatches route handlers and page events while a
+        Playwright call runs, so the pool waits on a live tab rather than
+        sleeping. A tab whose page has closed fails on its own next step.
+        """
+
+        for tab in active:
+            try:
+                tab.page.wait_for_timeout(delay * 1_000)
+            except PlaywrightError:
+                continue
+            return
+        time.sleep(delay)
+
+    @staticmethod
+    def _close_tab(tab: _BrowserTab) -> None:
+        if tab.requests is not None:
+            tab.requests.log(tab.group)
+        _close_page(tab.page)
+
+    @staticmethod
+    def _new_scan_page(
+        context: BrowserContext,
+        policy: ScanPolicy,
+    ) -> tuple[Page, _RequestFilter | None]:
+        """Open a scan page, filtering requests when the policy asks for it.
+
+        Routes are installed on the page rather than the context so that a
+        reused context never filters anything other than scans, and so each
+        scan reports its own request counts.
+        """
+
+        page = context.new_page()
+        page.set_default_timeout(policy.navigation_timeout_seconds * 1_000)
+        page.set_default_navigation_timeout(policy.navigation_timeout_seconds * 1_000)
+        if not policy.block_resources:
+            return page, None
+        requests = _RequestFilter(policy.allowed_hosts)
+        try:
+            requests.install(page)
+        except BaseException:
+            _close_page(page)
+            raise
+        return page, requests
+
+    def _fetch_steps(
+        self,
+        page: Page,
+        group: GroupRef,
+        policy: ScanPolicy,
+        *,
+        wait_until: str,
+    ) -> _Steps[ScanResult]:
+        started = time.perf_counter()
+        with self._metrics.span("page.goto", track=group.key):
+            response = page.goto(
+                chronological_group_url(group),
+                wait_until=wait_until,
+            )
+        navigated = time.perf_counter()
+        self._metrics.observe("fbn_navigation_seconds", navigated - started)
+        status = response.status if response is not None else None
+        LOGGER.debug(
+            "Feed navigation completed",
+            group_key=group.key,
+            response_status=status,
+        )
+        with self._metrics.span("wait_for_terminal_page", track=group.key):
+            state = yield from _terminal_page_steps(
+                page,
+                status=status,
+                timeout_seconds=policy.navigation_timeout_seconds,
+                expected_group=group,
+            )
+        self._metrics.observe(
+            "fbn_terminal_page_seconds",
+            time.perf_counter() - navigated,
+        )
+        if state is PageState.EMPTY:
+            LOGGER.info("Group feed empty", group_key=group.key)
+            return ScanResult(
+                posts=(),
+                page_state=state.value,
+                scrolls=0,
+                bounded=False,
+            )
+
+        observed_at = datetime.now(timezone.utc)
+        with self._metrics.span("scan_feed", track=group.key):
+            posts = yield from self._scan_feed(page, group, policy, observed_at)
+        self._metrics.observe("fbn_feed_scrolls", posts.scrolls)
+        if not posts.posts:
+            raise LayoutChangedError(
+                "A feed was present, but no supported post permalinks were found."
+            )
+        return posts
 
     def _scan_feed(
         self,
@@ -830,32 +1481,53 @@ class PlaywrightPostSource:
         group: GroupRef,
         policy: ScanPolicy,
         observed_at: datetime,
-    ) -> ScanResult:
+    ) -> _Steps[ScanResult]:
         accumulated: list[Post] = []
         seen_ids: set[str] = set()
         stagnant = 0
         scrolls = 0
+        known_run = 0
         allowed_group_keys: frozenset[str] = frozenset({group.key})
+        probe = self._known_posts if policy.stop_after_known else None
 
         for scan_index in range(policy.max_scrolls + 1):
-            state = wait_for_terminal_page(
-                page,
-                timeout_seconds=policy.navigation_timeout_seconds,
-                expected_group=group,
-            )
+            pass_started = time.perf_counter()
+            with self._metrics.span(
+                "feed snapshot",
+                track=group.key,
+                pass_number=scan_index + 1,
+            ):
+                state, snapshot = yield from _terminal_snapshot_steps(
+                    page,
+                    status=None,
+                    timeout_seconds=policy.navigation_timeout_seconds,
+                    expected_group=group,
+                    extract=True,
+                )
             if state is PageState.EMPTY:
                 break
             allowed_group_keys = allowed_group_keys.union(
-                collect_group_aliases(page, group)
+                group_aliases_from_hrefs(
+                    snapshot.signals.url, snapshot.alias_hrefs, group
+                )
             )
             before = len(accumulated)
-            extracted = extract_posts(
-                collect_dom_payloads(page),
-                group,
-                observed_at,
-                limit=policy.sample_count,
-                allowed_group_keys=allowed_group_keys,
-                timezone_name=policy.timezone_name,
+            with self._metrics.span(
+                "extract_posts",
+                track=group.key,
+                payload_count=len(snapshot.payloads),
+            ):
+                extracted = extract_posts(
+                    list(snapshot.payloads),
+                    group,
+                    observed_at,
+                    limit=policy.sample_count,
+                    allowed_group_keys=allowed_group_keys,
+                    timezone_name=policy.timezone_name,
+                )
+            self._metrics.observe(
+                "fbn_extraction_pass_seconds",
+                time.perf_counter() - pass_started,
             )
             LOGGER.debug(
                 "Feed extraction pass completed",
@@ -864,12 +1536,28 @@ class PlaywrightPostSource:
                 candidate_count=len(extracted),
                 accumulated_count=len(accumulated),
             )
-            for post in extracted:
-                if post.post_id in seen_ids:
-                    continue
+            fresh = [post for post in extracted if post.post_id not in seen_ids]
+            known = (
+                probe(group, [post.post_id for post in fresh])
+                if probe is not None and fresh
+                else frozenset()
+            )
+            for post in fresh:
                 seen_ids.add(post.post_id)
                 accumulated.append(replace(post, position=len(accumulated)))
-                if len(accumulated) >= policy.sample_count:
+                known_run = known_run + 1 if post.post_id in known else 0
+                reached_known = (
+                    probe is not None and known_run >= policy.stop_after_known
+                )
+                if reached_known:
+                    LOGGER.debug(
+                        "Feed scan reached known posts",
+                        group_key=group.key,
+                        known_count=known_run,
+                        post_count=len(accumulated),
+                        scroll_count=scrolls,
+                    )
+                if reached_known or len(accumulated) >= policy.sample_count:
                     return ScanResult(
                         posts=tuple(accumulated),
                         page_state=PageState.FEED.value,
@@ -881,11 +1569,10 @@ class PlaywrightPostSource:
             if stagnant >= policy.stagnant_scrolls or scan_index == policy.max_scrolls:
                 break
 
-            page.evaluate(
-                "() => window.scrollBy(0, Math.max(window.innerHeight * 0.8, 600))"
-            )
-            scrolls += 1
-            page.wait_for_timeout(policy.settle_seconds * 1_000)
+            with self._metrics.span("scroll and settle", track=group.key):
+                _evaluate(page, SCROLL_AND_OBSERVE_SCRIPT)
+                scrolls += 1
+                yield from _settle_steps(page, group, policy.settle_seconds)
 
         return ScanResult(
             posts=tuple(accumulated),
@@ -896,6 +1583,94 @@ class PlaywrightPostSource:
             ),
         )
 
+    @contextmanager
+    def _scan_context(self, timezone_id: str) -> Iterator[BrowserContext]:
+        """Yield a one-shot context, or the retained session when configured."""
+
+        if self._session_settings is None:
+            with self._context(
+                headless=self.settings.headless,
+                timezone_id=timezone_id,
+            ) as context:
+                yield context
+            return
+
+        session = self._acquire_session(timezone_id)
+        try:
+            yield session.context
+        except BaseException:
+            if session.closed:
+                self._close_session("crashed")
+            raise
+        finally:
+            session.checks += 1
+            if self._session is session:
+                self._recycle_session_if_due(session)
+
+    def _acquire_session(self, timezone_id: str) -> _BrowserSession:
+        session = self._session
+        if session is not None:
+            if session.closed:
+                self._close_session("crashed")
+            elif session.timezone_id != timezone_id:
+                self._close_session("timezone changed")
+            else:
+                return session
+
+        stack = ExitStack()
+        try:
+            context = stack.enter_context(
+                self._context(
+                    headless=self.settings.headless,
+                    timezone_id=timezone_id,
+                )
+            )
+        except BaseException:
+            stack.close()
+            raise
+        session = _BrowserSession(stack=stack, context=context, timezone_id=timezone_id)
+
+        def mark_closed(*args: object) -> None:
+            del args
+            session.closed = True
+
+        # Playwright emits close when the browser exits or crashes. The next
+        # check then relaunches instead of reusing a dead context.
+        context.on("close", mark_closed)
+        self._session = session
+        LOGGER.info("Browser session started", browser=self.settings.browser)
+        return session
+
+    def _recycle_session_if_due(self, session: _BrowserSession) -> None:
+        limits = self._session_settings
+        if limits is None:
+            return
+        if limits.max_checks is not None and session.checks >= limits.max_checks:
+            self._close_session("check limit reached", check_count=session.checks)
+            return
+        if limits.max_rss_bytes is None:
+            return
+        rss_bytes = _process_tree_rss_bytes(os.getpid())
+        if rss_bytes is not None and rss_bytes > limits.max_rss_bytes:
+            self._close_session(
+                "memory limit reached",
+                check_count=session.checks,
+                rss_bytes=rss_bytes,
+            )
+
+    def _close_session(self, reason: str, **fields: object) -> None:
+        session = self._session
+        if session is None:
+            return
+        self._session = None
+        try:
+            session.stack.close()
+        except BrowserUnavailableError:
+            if not session.closed:
+                raise
+        finally:
+            LOGGER.info("Browser session closed", reason=reason, **fields)
+
     def _prepare_profile(self) -> Path:
         profile_dir = Path(self.settings.profile_dir)
         try:
@@ -976,18 +1751,24 @@ class PlaywrightPostSource:
                 headless=headless,
                 timezone_id=timezone_id or "default",
             )
-            try:
-                playwright = stack.enter_context(self._playwright_factory())
-            except PlaywrightError as exc:
-                raise BrowserUnavailableError(
-                    "Playwright could not start its browser driver. "
-                    "Run `fbn doctor` for installation guidance."
-                ) from exc
-            context = self._launch_context(
-                playwright,
-                profile_dir=profile_dir,
-                headless=headless,
-                timezone_id=timezone_id,
+            launch_started = time.perf_counter()
+            with self._metrics.span("browser launch", browser=self.settings.browser):
+                try:
+                    playwright = stack.enter_context(self._playwright_factory())
+                except PlaywrightError as exc:
+                    raise BrowserUnavailableError(
+                        "Playwright could not start its browser driver. "
+                        "Run `fbn doctor` for installation guidance."
+                    ) from exc
+                context = self._launch_context(
+                    playwright,
+                    profile_dir=profile_dir,
+                    headless=headless,
+                    timezone_id=timezone_id,
+                )
+            self._metrics.observe(
+                "fbn_browser_launch_seconds",
+                time.perf_counter() - launch_started,
             )
             if marker_missing:
                 self._write_profile_browser_marker(profile_dir)
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import functools
+import json
 import signal
 import sqlite3
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, TypeVar, cast
 
@@ -14,9 +17,15 @@ import click
 
 from . import __version__
 from .auth import load_facebook_cookies
-from .browser import PlaywrightPostSource
-from .config import SUPPORTED_BROWSERS, BrowserSettings, ScheduleSettings
-from .diagnostics import run_doctor
+from .config import (
+    MINIMUM_RETAINED_POSTS,
+    SUPPORTED_BROWSERS,
+    BrowserSettings,
+    RetentionSettings,
+    ScheduleSettings,
+    SessionSettings,
+)
+from .delivery import DeliveryWorker
 from .exceptions import (
     BootstrapInterruptedError,
     BrowserUnavailableError,
@@ -24,14 +33,29 @@ from .exceptions import (
     FbnError,
 )
 from .extractor import parse_group_ref
-from .logging import configure_logging, get_logger
-from .models import GroupRef, RunSummary, ScanPolicy
+from .logging import LOG_FORMATS, configure_logging, flush_logs, get_logger
+from .metrics import MetricsRegistry, export_metrics
+from .models import (
+    DEFAULT_ALLOWED_HOSTS,
+    CompactionSummary,
+    GroupRef,
+    RunSummary,
+    ScanPolicy,
+)
 from .monitor import MonitorService
-from .notifications import AppriseSink, ConsoleSink, Notification
+from .notifications import (
+    AppriseSink,
+    ConsoleSink,
+    FanoutSink,
+    Notification,
+    NotificationSink,
+    apprise_destination_name,
+)
 from .state import SQLiteStateRepository
 
 CommandFunction = TypeVar("CommandFunction", bound=Callable[..., Any])
 LOGGER = get_logger("cli")
+_LOG_FORMAT_KEY = "fbn.log_format"
 
 
 class CliError(click.ClickException):
@@ -155,7 +179,39 @@ def _scan_options(function: CommandFunction) -> CommandFunction:
             type=click.FloatRange(min=0.0, max=10.0),
             default=1.0,
             show_default=True,
-            help="Wait after each bounded scroll.",
+            help=(
+                "Maximum wait after each bounded scroll; the wait ends early "
+                "once new feed items arrive or the feed goes quiet."
+            ),
+        ),
+        click.option(
+            "--block-resources/--load-all-resources",
+            default=True,
+            envvar="FBN_BLOCK_RESOURCES",
+            show_default=True,
+            show_envvar=True,
+            help="Abort image, media, font, ping, and non-allowlisted requests.",
+        ),
+        click.option(
+            "--allow-host",
+            "allow_hosts",
+            multiple=True,
+            help=(
+                "Additional host (and its subdomains) scans may contact; "
+                "facebook.com and fbcdn.net are always allowed. Repeatable."
+            ),
+        ),
+        click.option(
+            "--stop-after-known",
+            type=click.IntRange(0, 50),
+            default=0,
+            envvar="FBN_STOP_AFTER_KNOWN",
+            show_default=True,
+            show_envvar=True,
+            help=(
+                "Stop scrolling once this many consecutive feed posts are "
+                "already recorded; 0 always scans the full sample."
+            ),
         ),
     ]
     for option in reversed(options):
@@ -165,13 +221,6 @@ def _scan_options(function: CommandFunction) -> CommandFunction:
 
 def _run_options(function: CommandFunction) -> CommandFunction:
     options = [
-        click.option(
-            "-i",
-            "--id",
-            "target_id",
-            required=True,
-            help="Facebook group ID, slug, or canonical group URL.",
-        ),
         click.option(
             "--state-file",
             type=click.Path(
@@ -184,6 +233,18 @@ def _run_options(function: CommandFunction) -> CommandFunction:
             show_envvar=True,
             help="SQLite state file.",
         ),
+        click.option(
+            "--seen-granularity",
+            type=click.IntRange(0, 86_400),
+            default=0,
+            envvar="FBN_SEEN_GRANULARITY",
+            show_default=True,
+            show_envvar=True,
+            help=(
+                "Seconds within which a check that finds nothing new skips "
+                "rewriting last-seen times; 0 writes the state file every check."
+            ),
+        ),
         click.option(
             "--headless/--headed",
             default=True,
@@ -195,9 +256,23 @@ def _run_options(function: CommandFunction) -> CommandFunction:
         click.option(
             "-a",
             "--apprise-url",
+            "apprise_urls",
+            multiple=True,
             envvar="FBN_APPRISE_URL",
             show_envvar=True,
-            help="Apprise destination URL. Never logged.",
+            help=(
+                "Apprise destination URL; repeat to deliver to several "
+                "destinations concurrently. Never logged."
+            ),
+        ),
+        click.option(
+            "--delivery-timeout",
+            type=click.FloatRange(1, 600),
+            default=30.0,
+            envvar="FBN_DELIVERY_TIMEOUT",
+            show_default=True,
+            show_envvar=True,
+            help="Seconds each destination may take when several are configured.",
         ),
         click.option(
             "--dry-run",
@@ -220,6 +295,54 @@ def _run_options(function: CommandFunction) -> CommandFunction:
             is_flag=True,
             help="Enable secret-free operational logging.",
         ),
+        click.option(
+            "--profile",
+            "profile_file",
+            type=click.Path(
+                file_okay=True,
+                dir_okay=False,
+                path_type=Path,
+                resolve_path=True,
+            ),
+            envvar="FBN_PROFILE_FILE",
+            show_envvar=True,
+            help=(
+                "Write per-phase timing spans to this Chrome trace-event JSON "
+                "file when the command exits."
+            ),
+        ),
+        click.option(
+            "--profile-python",
+            is_flag=True,
+            help="With --profile, also write a cProfile dump to FILE.pstats.",
+        ),
+    ]
+    for option in reversed(options):
+        function = option(function)
+    return function
+
+
+def _retention_options(function: CommandFunction) -> CommandFunction:
+    options = [
+        click.option(
+            "--retain-days",
+            type=click.IntRange(1, 3650),
+            default=90,
+            show_default=True,
+            help="Prune seen posts not observed for this many days.",
+        ),
+        click.option(
+            "--max-posts",
+            type=click.IntRange(min=MINIMUM_RETAINED_POSTS),
+            help="Keep at most this many most recently seen posts per group.",
+        ),
+        click.option(
+            "--outbox-days",
+            type=click.IntRange(0, 3650),
+            default=7,
+            show_default=True,
+            help="Prune delivered notification records older than this many days.",
+        ),
     ]
     for option in reversed(options):
         function = option(function)
@@ -249,7 +372,13 @@ def _scan_policy(
     timezone_name: str,
     navigation_timeout: float,
     settle_seconds: float,
+    block_resources: bool,
+    allow_hosts: tuple[str, ...],
+    stop_after_known: int = 0,
+    tab_timeout: float = 180.0,
 ) -> ScanPolicy:
+    allowed_hosts = dict.fromkeys(DEFAULT_ALLOWED_HOSTS)
+    allowed_hosts.update(dict.fromkeys(host.strip().casefold() for host in allow_hosts))
     return ScanPolicy(
         sample_count=sample_count,
         max_scrolls=max_scrolls,
@@ -257,39 +386,113 @@ def _scan_policy(
         timezone_name=timezone_name,
         navigation_timeout_seconds=navigation_timeout,
         settle_seconds=settle_seconds,
+        tab_timeout_seconds=tab_timeout,
+        block_resources=block_resources,
+        allowed_hosts=tuple(allowed_hosts),
+        stop_after_known=stop_after_known,
+    )
+
+
+def _retention(
+    *,
+    retain_days: int,
+    max_posts: int | None,
+    outbox_days: int,
+) -> RetentionSettings:
+    return RetentionSettings(
+        post_days=retain_days,
+        max_posts=max_posts,
+        outbox_days=outbox_days,
     )
 
 
 def _notification_sink(
     *,
-    apprise_url: str | None,
+    apprise_urls: Sequence[str],
+    delivery_timeout: float,
     dry_run: bool,
-) -> ConsoleSink | AppriseSink:
+) -> NotificationSink:
     if dry_run:
         return ConsoleSink(click.echo)
-    if apprise_url is None or not apprise_url.strip():
+    urls = tuple(dict.fromkeys(url.strip() for url in apprise_urls if url.strip()))
+    if not urls:
         raise ConfigurationError(
             "--apprise-url or FBN_APPRISE_URL is required unless --dry-run is used."
         )
-    return AppriseSink(apprise_url)
+    if len(urls) == 1:
+        return AppriseSink(urls[0])
+    return FanoutSink(
+        {apprise_destination_name(url): AppriseSink(url) for url in urls},
+        timeout=delivery_timeout,
+    )
+
+
+def _monitor_groups(
+    target_ids: tuple[str, ...],
+    groups_file: Path | None,
+) -> tuple[GroupRef, ...]:
+    """Return the de-duplicated groups named by --id and --groups-file."""
+
+    targets = list(target_ids)
+    if groups_file is not None:
+        for line in groups_file.read_text(encoding="utf-8").splitlines():
+            target = line.split("#", 1)[0].strip()
+            if target:
+                targets.append(target)
+    groups: dict[str, GroupRef] = {}
+    for target in targets:
+        group = parse_group_ref(target)
+        groups.setdefault(group.key, group)
+    if not groups:
+        raise ConfigurationError("--id or --groups-file must name at least one group.")
+    return tuple(groups.values())
+
+
+@contextmanager
+def _profiled(
+    profile_file: Path | None,
+    *,
+    python: bool,
+) -> Iterator[MetricsRegistry]:
+    """Yield the run's metrics registry, tracing it when a profile is requested."""
+
+    if profile_file is None:
+        if python:
+            raise click.UsageError("--profile-python requires --profile.")
+        yield MetricsRegistry()
+        return
+
+    # Imported lazily so unprofiled runs never load cProfile.
+    from .profiling import profile_run
+
+    with profile_run(profile_file, python=python) as tracer:
+        yield MetricsRegistry(tracer=tracer)
 
 
 def _configure_logging(verbose: bool) -> None:
     """Configure only fbn's secret-free records for terminal/container output."""
 
-    configure_logging(verbose)
+    context = click.get_current_context(silent=True)
+    log_format = (
+        "text" if context is None else context.meta.get(_LOG_FORMAT_KEY, "text")
+    )
+    configure_logging(verbose, log_format=log_format)
+    if context is not None:
+        context.call_on_close(flush_logs)
 
     if verbose:
-        LOGGER.debug("Human-readable logging enabled", verbose=True)
+        LOGGER.debug("Logging enabled", verbose=True, log_format=log_format)
 
 
 def _safe_error_notification(
     *,
-    apprise_url: str | None,
+    apprise_urls: Sequence[str],
+    delivery_timeout: float,
     group: GroupRef,
     error: FbnError,
+    stopped: bool = True,
 ) -> None:
-    if apprise_url is None or not apprise_url.strip():
+    if not any(url.strip() for url in apprise_urls):
         return
     category = type(error).__name__
     LOGGER.info(
@@ -298,7 +501,11 @@ def _safe_error_notification(
         category=category,
     )
     notification = Notification(
-        title=f"fbn monitor stopped for {group.key}",
+        title=(
+            f"fbn monitor stopped for {group.key}"
+            if stopped
+            else f"fbn monitor backing off {group.key}"
+        ),
         body=(
             f"Failure category: {category}\n"
             "Run `fbn doctor` and refresh the `fbn bootstrap` authentication "
@@ -306,7 +513,11 @@ def _safe_error_notification(
         ),
     )
     try:
-        AppriseSink(apprise_url).send(notification)
+        _notification_sink(
+            apprise_urls=apprise_urls,
+            delivery_timeout=delivery_timeout,
+            dry_run=False,
+        ).send(notification)
     except FbnError:
         LOGGER.warning("Error notification failed", group_key=group.key)
 
@@ -328,20 +539,46 @@ def _run_summary(summary: RunSummary) -> None:
     )
 
 
+def _compaction_summary(summary: CompactionSummary) -> None:
+    LOGGER.info(
+        "State compacted",
+        deleted_posts=summary.deleted_posts,
+        deleted_events=summary.deleted_events,
+        reclaimed_bytes=summary.reclaimed_bytes,
+    )
+
+
 def _run_once(
     *,
     group: GroupRef,
     settings: BrowserSettings,
     policy: ScanPolicy,
     state_file: Path | None,
-    apprise_url: str | None,
+    apprise_urls: Sequence[str],
+    delivery_timeout: float,
     dry_run: bool,
     notify_initial: bool,
+    seen_granularity: timedelta = timedelta(0),
+    metrics: MetricsRegistry | None = None,
 ) -> RunSummary:
-    source = PlaywrightPostSource(settings)
-    sink = _notification_sink(apprise_url=apprise_url, dry_run=dry_run)
-    with SQLiteStateRepository(state_file) as state:
-        service = MonitorService(source, state, sink)
+    from .browser import PlaywrightPostSource
+
+    sink = _notification_sink(
+        apprise_urls=apprise_urls,
+        delivery_timeout=delivery_timeout,
+        dry_run=dry_run,
+    )
+    with SQLiteStateRepository(
+        state_file,
+        metrics=metrics,
+        seen_granularity=seen_granularity,
+    ) as state:
+        source = PlaywrightPostSource(
+            settings,
+            metrics=metrics,
+            known_posts=state.known_post_ids,
+        )
+        service = MonitorService(source, state, sink, metrics=metrics)
         return service.run_once(
             group,
             policy,
@@ -352,9 +589,21 @@ def _run_once(
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(__version__, "-V", "--version")
-def main() -> None:
+@click.option(
+    "--log-format",
+    type=click.Choice(LOG_FORMATS),
+    default="text",
+    envvar="FBN_LOG_FORMAT",
+    show_default=True,
+    show_envvar=True,
+    help="Readable text lines, or one compact JSON object per log record.",
+)
+@click.pass_context
+def main(context: click.Context, log_format: str) -> None:
     """Monitor a Facebook group through a dedicated local browser profile."""
 
+    context.meta[_LOG_FORMAT_KEY] = log_format
+
 
 @main.command("bootstrap")
 @_browser_options
@@ -408,6 +657,8 @@ def bootstrap_command(
 ) -> None:
     """Import a secret auth file and verify group access headlessly."""
 
+    from .browser import PlaywrightPostSource
+
     _configure_logging(verbose)
     cookies, ignored = load_facebook_cookies(auth_file)
     settings = _browser_settings(
@@ -467,6 +718,8 @@ def login_command(
 ) -> None:
     """Optionally recover authentication in a headed local browser."""
 
+    from .browser import PlaywrightPostSource
+
     _configure_logging(verbose)
     settings = _browser_settings(
         browser=browser,
@@ -516,6 +769,9 @@ def doctor_command(
 ) -> None:
     """Verify that the selected browser can launch headlessly."""
 
+    # Imported lazily, like the other browser commands, so --help stays fast.
+    from .diagnostics import run_doctor
+
     settings = _browser_settings(
         browser=browser,
         profile_dir=profile_dir,
@@ -537,6 +793,13 @@ def doctor_command(
 @main.command("check")
 @_browser_options
 @_scan_options
+@click.option(
+    "-i",
+    "--id",
+    "target_id",
+    required=True,
+    help="Facebook group ID, slug, or canonical group URL.",
+)
 @_run_options
 @_domain_errors
 def check_command(
@@ -550,14 +813,21 @@ def check_command(
     timezone_name: str,
     navigation_timeout: float,
     settle_seconds: float,
+    block_resources: bool,
+    allow_hosts: tuple[str, ...],
+    stop_after_known: int,
     target_id: str,
     state_file: Path | None,
+    seen_granularity: int,
     headless: bool,
-    apprise_url: str | None,
+    apprise_urls: tuple[str, ...],
+    delivery_timeout: float,
     dry_run: bool,
     notify_initial: bool,
     include_errors: bool,
     verbose: bool,
+    profile_file: Path | None,
+    profile_python: bool,
 ) -> None:
     """Perform one bounded observation and deliver pending posts."""
 
@@ -576,6 +846,9 @@ def check_command(
         timezone_name=timezone_name,
         navigation_timeout=navigation_timeout,
         settle_seconds=settle_seconds,
+        block_resources=block_resources,
+        allow_hosts=allow_hosts,
+        stop_after_known=stop_after_known,
     )
     LOGGER.info(
         "Check started",
@@ -587,19 +860,24 @@ def check_command(
         dry_run=dry_run,
     )
     try:
-        summary = _run_once(
-            group=group,
-            settings=settings,
-            policy=policy,
-            state_file=state_file,
-            apprise_url=apprise_url,
-            dry_run=dry_run,
-            notify_initial=notify_initial,
-        )
+        with _profiled(profile_file, python=profile_python) as metrics:
+            summary = _run_once(
+                group=group,
+                settings=settings,
+                policy=policy,
+                state_file=state_file,
+                seen_granularity=timedelta(seconds=seen_granularity),
+                apprise_urls=apprise_urls,
+                delivery_timeout=delivery_timeout,
+                dry_run=dry_run,
+                notify_initial=notify_initial,
+                metrics=metrics,
+            )
     except FbnError as exc:
         if include_errors:
             _safe_error_notification(
-                apprise_url=apprise_url,
+                apprise_urls=apprise_urls,
+                delivery_timeout=delivery_timeout,
                 group=group,
                 error=exc,
             )
@@ -610,6 +888,24 @@ def check_command(
 @main.command("monitor")
 @_browser_options
 @_scan_options
+@click.option(
+    "-i",
+    "--id",
+    "target_ids",
+    multiple=True,
+    help="Facebook group ID, slug, or canonical group URL. Repeatable.",
+)
+@click.option(
+    "--groups-file",
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    help="File with one group ID, slug, or URL per line; # starts a comment.",
+)
 @_run_options
 @click.option(
     "-e",
@@ -621,6 +917,96 @@ def check_command(
     "--to",
     help="Maximum interval; requires --every and must not be shorter.",
 )
+@click.option(
+    "--adaptive-interval",
+    is_flag=True,
+    envvar="FBN_ADAPTIVE_INTERVAL",
+    show_envvar=True,
+    help=(
+        "Learn each group's post rate and check busy groups nearer --every and "
+        "quiet groups nearer --to."
+    ),
+)
+@click.option(
+    "--reuse-browser",
+    is_flag=True,
+    envvar="FBN_REUSE_BROWSER",
+    show_envvar=True,
+    help="Keep one browser session and profile lock open between checks.",
+)
+@click.option(
+    "--recycle-after",
+    type=click.IntRange(1, 10_000),
+    default=50,
+    show_default=True,
+    help="Relaunch a reused browser after this many checks.",
+)
+@click.option(
+    "--max-browser-rss",
+    type=click.IntRange(min=64),
+    help="Relaunch a reused browser once its processes exceed this many MiB.",
+)
+@click.option(
+    "--tabs",
+    type=click.IntRange(1, 16),
+    default=1,
+    show_default=True,
+    help="Scan up to this many due groups concurrently in one browser context.",
+)
+@click.option(
+    "--tab-timeout",
+    type=click.FloatRange(min=10.0, max=3600.0),
+    default=180.0,
+    show_default=True,
+    help="Abandon one group's concurrent scan after this many seconds.",
+)
+@click.option(
+    "--compact/--no-compact",
+    default=True,
+    envvar="FBN_COMPACT",
+    show_default=True,
+    show_envvar=True,
+    help="Prune and compact the state file between checks once a day.",
+)
+@click.option(
+    "--seen-index-size",
+    type=click.IntRange(0, 1_000_000),
+    default=0,
+    envvar="FBN_SEEN_INDEX_SIZE",
+    show_default=True,
+    show_envvar=True,
+    help=(
+        "Keep this many recently seen post IDs in memory so scans of only known "
+        "posts skip the insert path; 0 disables the index."
+    ),
+)
+@click.option(
+    "--defer-delivery",
+    is_flag=True,
+    envvar="FBN_DEFER_DELIVERY",
+    show_envvar=True,
+    help="Only record new posts; a separate `fbn deliver` sends them.",
+)
+@click.option(
+    "--metrics-port",
+    type=click.IntRange(1, 65_535),
+    envvar="FBN_METRICS_PORT",
+    show_envvar=True,
+    help="Serve Prometheus metrics on 127.0.0.1 at this port under /metrics.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    envvar="FBN_METRICS_FILE",
+    show_envvar=True,
+    help="Rewrite this Prometheus textfile-collector file every 15 seconds.",
+)
+@_retention_options
 @_domain_errors
 def monitor_command(
     *,
@@ -633,24 +1019,48 @@ def monitor_command(
     timezone_name: str,
     navigation_timeout: float,
     settle_seconds: float,
-    target_id: str,
+    block_resources: bool,
+    allow_hosts: tuple[str, ...],
+    stop_after_known: int,
+    target_ids: tuple[str, ...],
+    groups_file: Path | None,
     state_file: Path | None,
+    seen_granularity: int,
     headless: bool,
-    apprise_url: str | None,
+    apprise_urls: tuple[str, ...],
+    delivery_timeout: float,
     dry_run: bool,
     notify_initial: bool,
     include_errors: bool,
     verbose: bool,
+    profile_file: Path | None,
+    profile_python: bool,
     every: str | None,
     to: str | None,
+    adaptive_interval: bool,
+    reuse_browser: bool,
+    recycle_after: int,
+    max_browser_rss: int | None,
+    tabs: int,
+    tab_timeout: float,
+    compact: bool,
+    seen_index_size: int,
+    defer_delivery: bool,
+    metrics_port: int | None,
+    metrics_file: Path | None,
+    retain_days: int,
+    max_posts: int | None,
+    outbox_days: int,
 ) -> None:
-    """Run bounded observations on a persisted, jittered schedule."""
+    """Run bounded observations of one or more groups on a jittered schedule."""
 
-    # Imported lazily so one-shot commands do not initialize scheduling state.
+    # Imported lazily so one-shot commands do not initialize scheduling state
+    # and commands that never open a browser do not load Playwright.
+    from .browser import PlaywrightPostSource
     from .scheduling import MonitorLoop
 
     _configure_logging(verbose)
-    group = parse_group_ref(target_id)
+    groups = _monitor_groups(target_ids, groups_file)
     settings = _browser_settings(
         browser=browser,
         profile_dir=profile_dir,
@@ -664,18 +1074,49 @@ def monitor_command(
         timezone_name=timezone_name,
         navigation_timeout=navigation_timeout,
         settle_seconds=settle_seconds,
+        block_resources=block_resources,
+        allow_hosts=allow_hosts,
+        stop_after_known=stop_after_known,
+        tab_timeout=tab_timeout,
+    )
+    schedule = ScheduleSettings.from_values(every, to, adaptive=adaptive_interval)
+    retention = _retention(
+        retain_days=retain_days,
+        max_posts=max_posts,
+        outbox_days=outbox_days,
+    )
+    session = (
+        SessionSettings(
+            max_checks=recycle_after,
+            max_rss_bytes=(
+                None if max_browser_rss is None else max_browser_rss * 1024 * 1024
+            ),
+        )
+        if reuse_browser
+        else None
+    )
+    sink = (
+        None
+        if defer_delivery
+        else _notification_sink(
+            apprise_urls=apprise_urls,
+            delivery_timeout=delivery_timeout,
+            dry_run=dry_run,
+        )
     )
-    schedule = ScheduleSettings.from_values(every, to)
-    sink = _notification_sink(apprise_url=apprise_url, dry_run=dry_run)
     stop_event = threading.Event()
     LOGGER.info(
         "Monitor started",
-        group_key=group.key,
+        group_count=len(groups),
         browser=settings.browser,
         headless=settings.headless,
         interval_min_seconds=int(schedule.every.total_seconds()),
         interval_max_seconds=int(schedule.to.total_seconds()),
+        adaptive_interval=schedule.adaptive,
+        reuse_browser=reuse_browser,
+        tab_count=tabs,
         dry_run=dry_run,
+        defer_delivery=defer_delivery,
     )
 
     received_signal: int | None = None
@@ -691,12 +1132,59 @@ def monitor_command(
         previous_handlers[signum] = signal.signal(signum, stop_monitor)
 
     try:
-        with SQLiteStateRepository(state_file) as state:
-            service = MonitorService(PlaywrightPostSource(settings), state, sink)
-            loop = MonitorLoop(service, state, schedule, on_success=_run_summary)
+        with (
+            _profiled(profile_file, python=profile_python) as metrics,
+            export_metrics(metrics, port=metrics_port, textfile=metrics_file),
+            SQLiteStateRepository(
+                state_file,
+                metrics=metrics,
+                seen_index_size=seen_index_size,
+                seen_granularity=timedelta(seconds=seen_granularity),
+            ) as state,
+            PlaywrightPostSource(
+                settings,
+                session=session,
+                tabs=tabs,
+                metrics=metrics,
+                known_posts=state.known_post_ids,
+            ) as source,
+        ):
+            service = MonitorService(source, state, sink, metrics=metrics)
+
+            def compact_state() -> None:
+                try:
+                    summary = state.compact(retention)
+                except sqlite3.Error as exc:
+                    # A busy or failed pass is retried after the next interval.
+                    LOGGER.warning(
+                        "State compaction failed",
+                        category=type(exc).__name__,
+                    )
+                    return
+                _compaction_summary(summary)
+
+            def notify_group_failure(group: GroupRef, error: FbnError) -> None:
+                _safe_error_notification(
+                    apprise_urls=apprise_urls,
+                    delivery_timeout=delivery_timeout,
+                    group=group,
+                    error=error,
+                    stopped=False,
+                )
+
+            loop = MonitorLoop(
+                service,
+                state,
+                schedule,
+                on_success=_run_summary,
+                on_group_failure=notify_group_failure if include_errors else None,
+                batch_size=tabs,
+                maintenance=compact_state if compact else None,
+                maintenance_interval=retention.interval,
+            )
             try:
-                loop.run(
-                    group,
+                loop.run_many(
+                    groups,
                     policy,
                     notify_initial=notify_initial,
                     commit_delivery=not dry_run,
@@ -705,8 +1193,9 @@ def monitor_command(
             except FbnError as exc:
                 if include_errors:
                     _safe_error_notification(
-                        apprise_url=apprise_url,
-                        group=group,
+                        apprise_urls=apprise_urls,
+                        delivery_timeout=delivery_timeout,
+                        group=loop.current_group or groups[0],
                         error=exc,
                     )
                 raise
@@ -715,9 +1204,255 @@ def monitor_command(
             signal.signal(signum, handler)
     if received_signal is not None:
         LOGGER.info("Monitor stop signal received", signal_number=received_signal)
-    LOGGER.info("Monitor stopped", group_key=group.key)
+    LOGGER.info("Monitor stopped", group_count=len(groups))
     click.echo("monitor stopped")
 
 
+@main.command("deliver")
+@click.option(
+    "--state-file",
+    type=click.Path(
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    envvar="FBN_STATE_FILE",
+    show_envvar=True,
+    help="SQLite state file.",
+)
+@click.option(
+    "-a",
+    "--apprise-url",
+    "apprise_urls",
+    multiple=True,
+    envvar="FBN_APPRISE_URL",
+    show_envvar=True,
+    help="Apprise destination URL; repeatable. Never logged.",
+)
+@click.option(
+    "--delivery-timeout",
+    type=click.FloatRange(1, 600),
+    default=30.0,
+    envvar="FBN_DELIVERY_TIMEOUT",
+    show_default=True,
+    show_envvar=True,
+    help="Seconds each destination may take when several are configured.",
+)
+@click.option(
+    "--poll-seconds",
+    type=click.IntRange(1, 3600),
+    default=30,
+    show_default=True,
+    help="Seconds between outbox passes.",
+)
+@click.option(
+    "--once",
+    is_flag=True,
+    help="Run one delivery pass and exit.",
+)
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="Enable secret-free operational logging.",
+)
+@_domain_errors
+def deliver_command(
+    *,
+    state_file: Path | None,
+    apprise_urls: tuple[str, ...],
+    delivery_timeout: float,
+    poll_seconds: int,
+    once: bool,
+    verbose: bool,
+) -> None:
+    """Drain pending notifications independently of scanning."""
+
+    _configure_logging(verbose)
+    sink = _notification_sink(
+        apprise_urls=apprise_urls,
+        delivery_timeout=delivery_timeout,
+        dry_run=False,
+    )
+    with SQLiteStateRepository(state_file) as state, state.delivery_lock():
+        worker = DeliveryWorker(
+            state,
+            sink,
+            poll_interval=timedelta(seconds=poll_seconds),
+        )
+        if once:
+            summary = worker.drain()
+            click.echo(
+                f"delivered={summary.delivered} pending={summary.pending} "
+                f"failed_groups={len(summary.failed_groups)}"
+            )
+            return
+
+        stop_event = threading.Event()
+
+        def stop_worker(signum: int, frame: object) -> None:
+            del signum, frame
+            stop_event.set()
+
+        previous_handlers: dict[signal.Signals, Any] = {}
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            previous_handlers[signum] = signal.signal(signum, stop_worker)
+        LOGGER.info("Delivery worker started", poll_seconds=poll_seconds)
+        try:
+            worker.run(stop_event)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+    LOGGER.info("Delivery worker stopped")
+    click.echo("delivery worker stopped")
+
+
+@main.command("bench")
+@_browser_options
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(1, 5_000),
+    multiple=True,
+    help="Synthetic feed size in items; repeat for several (default 10, 100, "
+    "1000, and 5000).",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(1, 100),
+    default=3,
+    show_default=True,
+    help="Timed runs per benchmark; the fastest run is reported.",
+)
+@click.option(
+    "--fixtures",
+    "fixtures_dir",
+    type=click.Path(
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    help="Directory of recorded feed pages, such as tests/fixtures, to scan.",
+)
+@click.option(
+    "--no-dom",
+    is_flag=True,
+    help="Skip the headless-browser DOM scan benchmarks.",
+)
+@click.option(
+    "--output",
+    type=click.Path(
+        file_okay=True,
+        dir_okay=False,
+        writable=True,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    help="Write the JSON report to this file instead of standard output.",
+)
+@_domain_errors
+def bench_command(
+    *,
+    browser: str,
+    profile_dir: Path | None,
+    executable_path: Path | None,
+    sizes: tuple[int, ...],
+    repeat: int,
+    fixtures_dir: Path | None,
+    no_dom: bool,
+    output: Path | None,
+) -> None:
+    """Time scan, state, and digest hot paths offline and print JSON results."""
+
+    # Imported lazily so SQLite and rendering setup stay out of CLI startup.
+    from .bench import FEED_SIZES, run_benchmarks
+
+    settings = (
+        None
+        if no_dom
+        else _browser_settings(
+            browser=browser,
+            profile_dir=profile_dir,
+            headless=True,
+            executable_path=executable_path,
+        )
+    )
+    report = run_benchmarks(
+        sizes=sizes or FEED_SIZES,
+        repeat=repeat,
+        fixtures_dir=fixtures_dir,
+        browser=settings,
+    )
+    rendered = json.dumps(report.as_dict(), indent=2)
+    if output is None:
+        click.echo(rendered)
+    else:
+        output.write_text(rendered + "\n", encoding="utf-8")
+
+
+@main.group("state")
+def state_group() -> None:
+    """Inspect and maintain the local SQLite state file."""
+
+
+@state_group.command("compact")
+@click.option(
+    "--state-file",
+    type=click.Path(
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    envvar="FBN_STATE_FILE",
+    show_envvar=True,
+    help="SQLite state file.",
+)
+@_retention_options
+@click.option(
+    "--full",
+    is_flag=True,
+    help=(
+        "Rebuild the whole file with VACUUM; also enables incremental "
+        "vacuuming for state files created before it was the default."
+    ),
+)
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="Enable secret-free operational logging.",
+)
+@_domain_errors
+def state_compact_command(
+    *,
+    state_file: Path | None,
+    retain_days: int,
+    max_posts: int | None,
+    outbox_days: int,
+    full: bool,
+    verbose: bool,
+) -> None:
+    """Prune expired post history and return free space to the filesystem."""
+
+    _configure_logging(verbose)
+    retention = _retention(
+        retain_days=retain_days,
+        max_posts=max_posts,
+        outbox_days=outbox_days,
+    )
+    with SQLiteStateRepository(state_file) as state:
+        summary = state.compact(retention, full=full)
+    _compaction_summary(summary)
+    click.echo(
+        f"compacted: posts={summary.deleted_posts} "
+        f"events={summary.deleted_events} "
+        f"reclaimed_bytes={summary.reclaimed_bytes}"
+    )
+
+
 if __name__ == "__main__":
     main()
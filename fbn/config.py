@@ -18,6 +18,10 @@ DEFAULT_EVERY = "1h"
 DEFAULT_TO = "3h"
 MINIMUM_INTERVAL = timedelta(minutes=15)
 MAXIMUM_INTERVAL = timedelta(days=365)
+# Matches the largest accepted scan sample.
+MINIMUM_RETAINED_POSTS = 50
+# Bounds the retry exponent so a long-failing event cannot overflow timedelta.
+_MAX_RETRY_DOUBLINGS = 30
 
 _DURATION_PATTERN = re.compile(r"([1-9][0-9]*)([smhdw])")
 _DURATION_UNITS = {
@@ -49,14 +53,21 @@ def parse_duration(value: str) -> timedelta:
 
 @dataclass(frozen=True, slots=True)
 class ScheduleSettings:
-    """A normalized inclusive scheduling interval."""
+    """A normalized inclusive scheduling interval.
+
+    With ``adaptive``, each group's interval follows its learned post arrival
+    rate within these bounds instead of being drawn across all of them.
+    """
 
     every: timedelta = timedelta(hours=1)
     to: timedelta = timedelta(hours=3)
+    adaptive: bool = False
 
     def __post_init__(self) -> None:
         if not isinstance(self.every, timedelta) or not isinstance(self.to, timedelta):
             raise ConfigurationError("schedule bounds must be timedeltas")
+        if not isinstance(self.adaptive, bool):
+            raise ConfigurationError("adaptive scheduling must be a boolean")
         if self.every < MINIMUM_INTERVAL:
             raise ConfigurationError("monitor intervals must be at least 15 minutes")
         if self.to < self.every:
@@ -69,9 +80,11 @@ class ScheduleSettings:
         cls,
         every: str | None = None,
         to: str | None = None,
+        *,
+        adaptive: bool = False,
     ) -> ScheduleSettings:
         lower, upper = parse_interval_range(every, to)
-        return cls(lower, upper)
+        return cls(lower, upper, adaptive)
 
 
 def parse_interval_range(
@@ -224,3 +237,89 @@ class BrowserSettings:
                 None if executable_path is None else _resolve_path(executable_path)
             ),
         )
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionSettings:
+    """Limits applied when compacting the state database.
+
+    ``max_posts`` is per group and may not be smaller than the largest scan
+    sample, so a feed window that was just observed is never pruned.
+    """
+
+    post_days: int = 90
+    max_posts: int | None = None
+    outbox_days: int = 7
+    interval: timedelta = timedelta(days=1)
+
+    def __post_init__(self) -> None:
+        for name, minimum in (("post_days", 1), ("outbox_days", 0)):
+            value = getattr(self, name)
+            if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+                raise ConfigurationError(
+                    f"{name} must be an integer of at least {minimum}"
+                )
+        if self.max_posts is not None and (
+            isinstance(self.max_posts, bool)
+            or not isinstance(self.max_posts, int)
+            or self.max_posts < MINIMUM_RETAINED_POSTS
+        ):
+            raise ConfigurationError(
+                f"max_posts must be at least {MINIMUM_RETAINED_POSTS} or None"
+            )
+        if not isinstance(self.interval, timedelta) or self.interval <= timedelta(0):
+            raise ConfigurationError("interval must be a positive timedelta")
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSettings:
+    """Recycling limits for a browser context kept alive between checks."""
+
+    max_checks: int | None = 50
+    max_rss_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("max_checks", "max_rss_bytes"):
+            value = getattr(self, name)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < 1
+            ):
+                raise ConfigurationError(f"{name} must be a positive integer or None")
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryRetrySettings:
+    """Capped exponential retry timing for failed notification events.
+
+    An event that has failed ``max_attempts`` times is dead-lettered: it keeps
+    its outbox row but is never selected for delivery again.
+    """
+
+    base_delay: timedelta = timedelta(minutes=1)
+    max_delay: timedelta = timedelta(hours=6)
+    max_attempts: int = 10
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.base_delay, timedelta) or self.base_delay <= timedelta(
+            0
+        ):
+            raise ConfigurationError("base_delay must be a positive timedelta")
+        if (
+            not isinstance(self.max_delay, timedelta)
+            or self.max_delay < self.base_delay
+        ):
+            raise ConfigurationError(
+                "max_delay must be a timedelta of at least base_delay"
+            )
+        if (
+            isinstance(self.max_attempts, bool)
+            or not isinstance(self.max_attempts, int)
+            or self.max_attempts < 1
+        ):
+            raise ConfigurationError("max_attempts must be an integer of at least 1")
+
+    def delay(self, attempts: int) -> timedelta:
+        """Return the wait after an event's ``attempts``-th failed delivery."""
+
+        doublings = min(max(attempts - 1, 0), _MAX_RETRY_DOUBLINGS)
+        return min(self.max_delay, self.base_delay * 2**doublings)
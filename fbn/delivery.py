@@ -0,0 +1,440 @@
+"""Outbox delivery shared by in-band checks and the standalone worker."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from threading import Event
+from typing import Protocol
+
+from .exceptions import DeliveryError
+from .extractor import parse_group_ref
+from .logging import get_logger
+from .metrics import MetricsRegistry
+from .models import DeliverySummary, GroupRef, PendingNotification
+from .notifications import (
+    FanoutNotificationSink,
+    NotificationChunk,
+    NotificationSink,
+    iter_digest_chunks,
+)
+
+LOGGER = get_logger("delivery")
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class OutboxState(Protocol):
+    """The pending-outbox operations that delivery needs."""
+
+    def iter_pending(
+        self,
+        group: GroupRef,
+        *,
+        due_at: datetime | None = None,
+    ) -> Iterator[PendingNotification]:
+        """Stream pending records in deterministic order, optionally only due ones."""
+
+    def pending_count(self, group: GroupRef) -> int:
+        """Return how many records are pending, due or not."""
+
+    def mark_delivered(
+        self,
+        event_ids: Sequence[str],
+        delivered_at: datetime | None = None,
+        *,
+        destination: str | None = None,
+    ) -> None:
+        """Mark events delivered, to one destination or completely."""
+
+    def mark_delivery_failed(
+        self,
+        event_ids: Sequence[str],
+        error: str,
+        *,
+        destination: str | None = None,
+    ) -> int:
+        """Record a redacted failure and return how many events were dead-lettered."""
+
+
+class DeliveryQueue(OutboxState, Protocol):
+    """An outbox that can also list the groups with pending events."""
+
+    def pending_group_keys(self) -> tuple[str, ...]:
+        """Return every group key that has undelivered events."""
+
+
+class OutboxDelivery:
+    """Render pending events into chunks, send them, and record each outcome.
+
+    Pending records are consumed lazily and each chunk is sent as soon as it
+    is rendered, so memory stays bounded by one chunk however large the
+    backlog is.
+    """
+
+    def __init__(
+        self,
+        state: OutboxState,
+        sink: NotificationSink,
+        *,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._state = state
+        self._sink = sink
+        self._metrics = MetricsRegistry() if metrics is None else metrics
+
+    def deliver(
+        self,
+        group: GroupRef,
+        pending: Iterable[PendingNotification],
+        *,
+        commit_delivery: bool,
+        delivered_at: datetime,
+    ) -> int:
+        """Deliver pending events and return how many were committed.
+
+        ``pending`` must already be in delivery order. A failed chunk is
+        recorded against its events, which then wait out their retry delay,
+        and the remaining chunks are still sent. The first failure is re-raised
+        afterwards as a redacted ``DeliveryError``.
+        """
+
+        delivered_to: dict[str, frozenset[str]] = {}
+
+        def tracked() -> Iterator[PendingNotification]:
+            for item in pending:
+                delivered_to[item.event_id] = item.delivered_to
+                yield item
+
+        chunks = iter_digest_chunks(group.key, tracked())
+        first = next(chunks, None)
+        if first is None:
+            LOGGER.info("No pending notifications", group_key=group.key)
+            return 0
+
+        sink = self._sink
+        fanout = isinstance(sink, FanoutNotificationSink)
+        LOGGER.info(
+            "Pending notification delivery started",
+            group_key=group.key,
+            commit_delivery=commit_delivery,
+            destination_count=len(sink.destinations) if fanout else 1,
+        )
+        failed_destinations: dict[str, DeliveryError] = {}
+        first_error: DeliveryError | None = None
+        delivered = 0
+        post_count = 0
+        chunk_count = 0
+        for chunk_count, chunk in enumerate(chain((first,), chunks), start=1):
+            post_count += len(chunk.event_ids)
+            started = time.perf_counter()
+            with self._metrics.span(
+                "deliver chunk",
+                chunk_number=chunk_count,
+                post_count=len(chunk.event_ids),
+            ):
+                if fanout:
+                    committed, failed = self._send_to_each(
+                        sink,
+                        group,
+                        chunk_count,
+                        chunk,
+                        delivered_to,
+                        failed_destinations,
+                        commit_delivery=commit_delivery,
+                        delivered_at=delivered_at,
+                    )
+                    for event_id in chunk.event_ids:
+                        del delivered_to[event_id]
+                else:
+                    try:
+                        committed = self._send(
+                            group,
+                            chunk_count,
+                            chunk,
+                            commit_delivery=commit_delivery,
+                            delivered_at=delivered_at,
+                        )
+                        failed = False
+                    except DeliveryError as exc:
+                        first_error = first_error or exc
+                        committed = 0
+                        failed = True
+            self._metrics.observe(
+                "fbn_delivery_chunk_seconds",
+                time.perf_counter() - started,
+                outcome="failed" if failed else "delivered",
+            )
+            delivered += committed
+
+        LOGGER.info(
+            "Pending notification delivery finished",
+            group_key=group.key,
+            post_count=post_count,
+            chunk_count=chunk_count,
+            delivered=delivered,
+        )
+        if failed_destinations:
+            raise DeliveryError(
+                "Notification delivery failed for "
+                f"{', '.join(sorted(failed_destinations))}."
+            )
+        if first_error is not None:
+            raise first_error
+        return delivered
+
+    def _send(
+        self,
+        group: GroupRef,
+        index: int,
+        chunk: NotificationChunk,
+        *,
+        commit_delivery: bool,
+        delivered_at: datetime,
+    ) -> int:
+        """Send one chunk to the single sink and return how many were committed.
+
+        A failure is recorded against the chunk's events and raised redacted.
+        """
+
+        LOGGER.debug(
+            "Notification chunk delivery started",
+            group_key=group.key,
+            chunk_index=index,
+            post_count=len(chunk.event_ids),
+        )
+        try:
+            self._sink.send(chunk.notification)
+        except Exception as exc:
+            LOGGER.warning(
+                "Notification delivery failed",
+                group_key=group.key,
+                chunk_index=index,
+                post_count=len(chunk.event_ids),
+                category=type(exc).__name__,
+            )
+            if isinstance(exc, DeliveryError):
+                self._record_failure(group, chunk, str(exc))
+                raise
+            redacted = DeliveryError(
+                f"Notification delivery failed ({type(exc).__name__})."
+            )
+            self._record_failure(group, chunk, str(redacted))
+            raise redacted from exc
+
+        return self._commit(
+            group,
+            index,
+            chunk,
+            commit_delivery=commit_delivery,
+            delivered_at=delivered_at,
+        )
+
+    def _send_to_each(
+        self,
+        sink: FanoutNotificationSink,
+        group: GroupRef,
+        index: int,
+        chunk: NotificationChunk,
+        delivered_to: Mapping[str, frozenset[str]],
+        failed: dict[str, DeliveryError],
+        *,
+        commit_delivery: bool,
+        delivered_at: datetime,
+    ) -> tuple[int, bool]:
+        """Send one chunk to every destination that still lacks it.
+
+        Destinations are tracked separately: one that already received a
+        chunk's events is skipped, and one that fails is recorded in ``failed``
+        and left out of later chunks in this run while the others continue.
+        Later chunks are recorded as failed for it without a send, so their
+        events wait out the same retry delay. Events become fully delivered
+        once every destination has them. Returns the committed event count and
+        whether the chunk failed for any destination.
+        """
+
+        missing = tuple(
+            destination
+            for destination in sink.destinations
+            if any(
+                destination not in delivered_to[event_id]
+                for event_id in chunk.event_ids
+            )
+        )
+        targets = tuple(
+            destination for destination in missing if destination not in failed
+        )
+        LOGGER.debug(
+            "Notification chunk delivery started",
+            group_key=group.key,
+            chunk_index=index,
+            post_count=len(chunk.event_ids),
+            destination_count=len(targets),
+        )
+        outcomes = sink.send_each(chunk.notification, targets)
+        chunk_failures: list[str] = []
+        for destination in missing:
+            if destination in failed:
+                chunk_failures.append(destination)
+                self._state.mark_delivery_failed(
+                    chunk.event_ids,
+                    str(failed[destination]),
+                    destination=destination,
+                )
+        for destination, error in outcomes.items():
+            if error is None:
+                if commit_delivery:
+                    self._state.mark_delivered(
+                        chunk.event_ids,
+                        delivered_at=delivered_at,
+                        destination=destination,
+                    )
+                continue
+            LOGGER.warning(
+                "Notification delivery failed",
+                group_key=group.key,
+                destination=destination,
+                chunk_index=index,
+                post_count=len(chunk.event_ids),
+                category=type(error).__name__,
+            )
+            failed[destination] = error
+            chunk_failures.append(destination)
+            self._state.mark_delivery_failed(
+                chunk.event_ids,
+                str(error),
+                destination=destination,
+            )
+
+        complete = all(
+            outcomes.get(destination, False) is None
+            or all(
+                destination in delivered_to[event_id] for event_id in chunk.event_ids
+            )
+            for destination in sink.destinations
+        )
+        if chunk_failures:
+            self._record_failure(
+                group,
+                chunk,
+                f"Delivery failed for {', '.join(sorted(chunk_failures))}.",
+            )
+            return 0, True
+        if not complete:
+            return 0, False
+        committed = self._commit(
+            group,
+            index,
+            chunk,
+            commit_delivery=commit_delivery,
+            delivered_at=delivered_at,
+        )
+        return committed, False
+
+    def _commit(
+        self,
+        group: GroupRef,
+        index: int,
+        chunk: NotificationChunk,
+        *,
+        commit_delivery: bool,
+        delivered_at: datetime,
+    ) -> int:
+        if not commit_delivery:
+            LOGGER.info(
+                "Notification chunk dry run completed",
+                group_key=group.key,
+                chunk_index=index,
+                post_count=len(chunk.event_ids),
+            )
+            return 0
+        self._state.mark_delivered(chunk.event_ids, delivered_at=delivered_at)
+        LOGGER.info(
+            "Notification chunk delivery committed",
+            group_key=group.key,
+            chunk_index=index,
+            post_count=len(chunk.event_ids),
+        )
+        return len(chunk.event_ids)
+
+    def _record_failure(
+        self,
+        group: GroupRef,
+        chunk: NotificationChunk,
+        error: str,
+    ) -> None:
+        dead_lettered = self._state.mark_delivery_failed(chunk.event_ids, error)
+        if dead_lettered:
+            LOGGER.warning(
+                "Notifications dead-lettered after repeated failures",
+                group_key=group.key,
+                post_count=dead_lettered,
+            )
+
+
+class DeliveryWorker:
+    """Drain the outbox on its own schedule, independent of scanning.
+
+    Each pass delivers every group's due events. Failed events wait out their
+    own retry delay in the state store, so a failing group never holds back
+    the others.
+    """
+
+    def __init__(
+        self,
+        state: DeliveryQueue,
+        sink: NotificationSink,
+        *,
+        poll_interval: timedelta = timedelta(seconds=30),
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        if poll_interval <= timedelta(0):
+            raise ValueError("poll_interval must be positive")
+        self._state = state
+        self._delivery = OutboxDelivery(state, sink)
+        self._poll_interval = poll_interval
+        self._clock = clock
+
+    def drain(self) -> DeliverySummary:
+        """Run one delivery pass over every group with pending events."""
+
+        now = self._clock()
+        delivered = 0
+        pending_count = 0
+        failed: list[str] = []
+        for group_key in self._state.pending_group_keys():
+            group = parse_group_ref(group_key)
+            try:
+                delivered += self._delivery.deliver(
+                    group,
+                    self._state.iter_pending(group, due_at=now),
+                    commit_delivery=True,
+                    delivered_at=now,
+                )
+            except DeliveryError:
+                failed.append(group_key)
+            pending_count += self._state.pending_count(group)
+
+        summary = DeliverySummary(
+            delivered=delivered,
+            pending=pending_count,
+            failed_groups=tuple(failed),
+        )
+        LOGGER.info(
+            "Delivery pass completed",
+            delivered=summary.delivered,
+            pending=summary.pending,
+            failed_group_count=len(summary.failed_groups),
+        )
+        return summary
+
+    def run(self, stop_event: Event) -> None:
+        """Drain repeatedly until ``stop_event`` is set."""
+
+        while not stop_event.is_set():
+            self.drain()
+            stop_event.wait(self._poll_interval.total_seconds())
@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 from collections.abc import Collection, Iterable, Mapping
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import parse_qs, urlsplit
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import dateparser
-
 from .exceptions import ConfigurationError
 from .models import GroupRef, Post
 
@@ -42,6 +41,42 @@ _FACEBOOK_TIMESTAMP_RE = re.compile(
     r")$",
     re.IGNORECASE,
 )
+# Fast-path forms of the accepted grammar, matched against lowercased text
+# whose whitespace is already collapsed to single spaces.
+_SHORT_AGE_RE = re.compile(r"([0-9]+) ?([smhd])")
+_LONG_AGE_RE = re.compile(r"([0-9]+) (second|minute|hour|day|week)s? ago")
+_DAY_CLOCK_RE = re.compile(r"(today|yesterday) at ([0-9]{1,2}):([0-9]{2})")
+_DATE_CLOCK_RE = re.compile(r"([0-9]{1,2}) ([a-z]+) at ([0-9]{1,2}):([0-9]{2})")
+_AGE_UNITS = {
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+    "second": "seconds",
+    "minute": "minutes",
+    "hour": "hours",
+    "day": "days",
+    "week": "weeks",
+}
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_MONTHS = {
+    **{name: index for index, name in enumerate(_MONTH_NAMES, start=1)},
+    **{name[:3]: index for index, name in enumerate(_MONTH_NAMES, start=1)},
+    "sept": 9,
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -173,42 +208,146 @@ def parse_facebook_timestamp(
 ) -> datetime | None:
     """Parse one rendered English Facebook timestamp in an IANA timezone."""
 
-    if (
-        not isinstance(observed_at, datetime)
-        or observed_at.tzinfo is None
-        or observed_at.utcoffset() is None
-    ):
-        raise ValueError("observed_at must be a timezone-aware datetime")
+    return _TimestampParser(observed_at, timezone_name)(value)
+
+
+@functools.lru_cache(maxsize=32)
+def _zone(timezone_name: str) -> ZoneInfo:
     try:
-        local_timezone = ZoneInfo(timezone_name)
+        return ZoneInfo(timezone_name)
     except (TypeError, ValueError, ZoneInfoNotFoundError) as exc:
         raise ValueError("timezone_name must be an IANA timezone name") from exc
-    if not isinstance(value, str):
-        return None
 
-    text = normalize_visible_text(value, limit=128)
-    if not text or _FACEBOOK_TIMESTAMP_RE.fullmatch(text) is None:
+
+class _TimestampParser:
+    """Parse rendered timestamps against one fixed relative base.
+
+    The accepted grammar is parsed directly, reproducing dateparser's results.
+    Anything the fast path does not resolve exactly, such as an unusual month
+    spelling or a date that needs leap-year correction, falls back to
+    dateparser with the same settings.
+    """
+
+    __slots__ = ("_base", "_timezone_name", "_utc_wall", "_wall", "_zone")
+
+    def __init__(self, observed_at: datetime, timezone_name: str) -> None:
+        if (
+            not isinstance(observed_at, datetime)
+            or observed_at.tzinfo is None
+            or observed_at.utcoffset() is None
+        ):
+            raise ValueError("observed_at must be a timezone-aware datetime")
+        if not isinstance(timezone_name, str):
+            raise ValueError("timezone_name must be an IANA timezone name")
+        self._zone = _zone(timezone_name)
+        self._timezone_name = timezone_name
+        self._base = observed_at.astimezone(self._zone)
+        self._wall = self._base.replace(tzinfo=None, fold=0)
+        # dateparser picks the year of a day-month date by comparing its local
+        # wall time with the UTC relative base; keep that for identical results.
+        self._utc_wall = observed_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def __call__(self, value: object) -> datetime | None:
+        if not isinstance(value, str):
+            return None
+        text = normalize_visible_text(value, limit=128)
+        if not text or _FACEBOOK_TIMESTAMP_RE.fullmatch(text) is None:
+            return None
+        try:
+            parsed = self._parse_known(text.lower())
+        except (OverflowError, ValueError):
+            parsed = None
+        return self._parse_with_dateparser(text) if parsed is None else parsed
+
+    def _parse_known(self, text: str) -> datetime | None:
+        if text == "just now":
+            return self._from_wall(self._wall)
+        match = _SHORT_AGE_RE.fullmatch(text) or _LONG_AGE_RE.fullmatch(text)
+        if match is not None:
+            amount, unit = match.groups()
+            age = timedelta(**{_AGE_UNITS[unit]: int(amount)})
+            return self._from_wall(self._wall - age)
+        match = _DAY_CLOCK_RE.fullmatch(text)
+        if match is not None:
+            day, hour, minute = match.groups()
+            wall = self._wall - timedelta(days=0 if day == "today" else 1)
+            return self._from_wall(
+                wall.replace(
+                    hour=int(hour), minute=int(minute), second=0, microsecond=0
+                )
+            )
+        match = _DATE_CLOCK_RE.fullmatch(text)
+        if match is not None:
+            day, month_name, hour, minute = match.groups()
+            month = _MONTHS.get(month_name)
+            if month is None:
+                return None
+            wall = datetime(
+                self._wall.year,
+                month,
+                int(day),
+                int(hour),
+                int(minute),
+            )
+            if wall > self._utc_wall:
+                wall = wall.replace(year=wall.year - 1)
+            return self._from_standard_wall(wall)
         return None
 
-    relative_base = observed_at.astimezone(local_timezone)
-    try:
-        parsed = dateparser.parse(
-            text,
-            languages=["en"],
-            settings={
-                "DATE_ORDER": "DMY",
-                "PREFER_DATES_FROM": "past",
-                "RELATIVE_BASE": relative_base,
-                "RETURN_AS_TIMEZONE_AWARE": True,
-                "TIMEZONE": timezone_name,
-                "TO_TIMEZONE": timezone_name,
-            },
+    def _from_wall(self, wall: datetime) -> datetime:
+        """Resolve a wall time like dateparser's aware arithmetic, as fold 0."""
+
+        return self._normalize(wall.replace(tzinfo=self._zone))
+
+    def _from_standard_wall(self, wall: datetime) -> datetime:
+        """Resolve a wall time the way pytz does with ``is_dst=False``.
+
+        A skipped time keeps the offset from before the transition. A repeated
+        time takes the occurrence with no DST adjustment, which is the second
+        one in most zones but the first in zones with negative DST, such as
+        Europe/Dublin.
+        """
+
+        earlier = wall.replace(tzinfo=self._zone)
+        later = wall.replace(tzinfo=self._zone, fold=1)
+        earlier_offset = earlier.utcoffset()
+        later_offset = later.utcoffset()
+        repeated = (
+            earlier_offset is not None
+            and later_offset is not None
+            and later_offset < earlier_offset
         )
-    except (OverflowError, TypeError, ValueError):
-        return None
-    if parsed is None or parsed.tzinfo is None or parsed.utcoffset() is None:
-        return None
-    return parsed.astimezone(local_timezone)
+        if repeated and earlier.dst() and not later.dst():
+            return self._normalize(later)
+        return self._normalize(earlier)
+
+    def _normalize(self, value: datetime) -> datetime:
+        # astimezone() to the same zone is a no-op, so round-trip through UTC
+        # to move a skipped wall time onto the real clock.
+        return value.astimezone(timezone.utc).astimezone(self._zone)
+
+    def _parse_with_dateparser(self, text: str) -> datetime | None:
+        # Imported lazily: loading dateparser's language data dominates startup.
+        import dateparser
+
+        try:
+            parsed = dateparser.parse(
+                text,
+                languages=["en"],
+                settings={
+                    "DATE_ORDER": "DMY",
+                    "PREFER_DATES_FROM": "past",
+                    "RELATIVE_BASE": self._base,
+                    "RETURN_AS_TIMEZONE_AWARE": True,
+                    "TIMEZONE": self._timezone_name,
+                    "TO_TIMEZONE": self._timezone_name,
+                },
+            )
+        except (OverflowError, TypeError, ValueError):
+            return None
+        if parsed is None or parsed.tzinfo is None or parsed.utcoffset() is None:
+            return None
+        return parsed.astimezone(self._zone)
 
 
 def _require_positive_int(value: object, *, name: str) -> None:
@@ -241,6 +380,7 @@ def extract_posts(
 
     _require_positive_int(limit, name="post limit")
     _require_positive_int(text_limit, name="text limit")
+    parse_timestamp = _TimestampParser(observed_at, timezone_name)
     accepted_group_keys = {
         key.casefold()
         for key in (
@@ -280,11 +420,7 @@ def extract_posts(
             observed_at=observed_at,
             position=position,
             partial=payload.get("partial") is True,
-            published_at=parse_facebook_timestamp(
-                payload.get("timestamp"),
-                observed_at,
-                timezone_name=timezone_name,
-            ),
+            published_at=parse_timestamp(payload.get("timestamp")),
         )
         extracted.append((position, source_index, post))
         seen_post_ids.add(link.post_id)
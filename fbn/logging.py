@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging as standard_logging
 import sys
+import threading
+from datetime import timezone
 from typing import Any
 
 import loguru
@@ -11,13 +15,19 @@ from loguru import logger
 
 _FIELD_LABELS = {
     "accumulated_count": "total candidates",
+    "added_item_count": "added feed items",
+    "allowed_bytes": "allowed bytes",
+    "allowed_count": "allowed requests",
+    "blocked_count": "blocked requests",
     "candidate_count": "candidates",
+    "check_count": "checks",
     "chunk_count": "chunks",
     "chunk_index": "chunk",
     "cookie_count": "cookies",
     "delay_seconds": "next check in",
     "failure_number": "failure",
     "feed_item_count": "feed items",
+    "group_count": "groups",
     "group_key": "group",
     "inserted_count": "inserted",
     "interval_max_seconds": "maximum interval",
@@ -30,12 +40,25 @@ _FIELD_LABELS = {
     "post_link_count": "post links",
     "queued_count": "queued",
     "retry_delay_seconds": "retry in",
+    "rss_bytes": "browser memory bytes",
     "sample_count": "sample limit",
     "scroll_count": "scrolls",
     "signal_number": "signal",
+    "tab_count": "tabs",
     "timeout_seconds": "timeout",
 }
 _RESERVED_FIELDS = frozenset({"component", "rendered_context", "service"})
+LOG_FORMATS = ("text", "json")
+# One reusable encoder; compact separators and ASCII escapes keep each record
+# on a single line whatever its field values contain.
+_encode_json = json.JSONEncoder(
+    ensure_ascii=True,
+    separators=(",", ":"),
+    default=str,
+).encode
+_JSON_BATCH_LINES = 64
+_JSON_FLUSH_SECONDS = 1.0
+_WARNING_LEVEL = standard_logging.WARNING
 
 # Keep library-style imports quiet until a CLI command explicitly configures fbn.
 logger.disable("fbn")
@@ -92,22 +115,103 @@ def _write_stdout(message: loguru.Message) -> None:
     sys.stdout.flush()
 
 
-def configure_logging(verbose: bool) -> None:
-    """Emit safe, readable fbn records without changing the root logger."""
-
-    logger.configure(
-        handlers=[
-            {
-                "sink": _write_stdout,
-                "level": "DEBUG" if verbose else "WARNING",
-                "format": _human_format,
-                "filter": _is_fbn_record,
-                "colorize": sys.stdout.isatty(),
-                "backtrace": False,
-                "diagnose": False,
-            }
-        ]
+def _json_line(record: dict[str, Any]) -> str:
+    """Serialize the same fields as the text format into one JSON object."""
+
+    document: dict[str, Any] = {
+        key: value
+        for key, value in record["extra"].items()
+        if key not in _RESERVED_FIELDS
+    }
+    document["time"] = (
+        record["time"].astimezone(timezone.utc).isoformat(timespec="milliseconds")
     )
+    document["level"] = record["level"].name
+    document["service"] = "fbn"
+    document["component"] = record["extra"].get("component")
+    document["message"] = record["message"]
+    return _encode_json(document)
+
+
+class _BufferedJsonSink:
+    """Write JSON lines in batches instead of flushing stdout per record.
+
+    A batch is written once it holds ``_JSON_BATCH_LINES`` records, once its
+    oldest record is ``_JSON_FLUSH_SECONDS`` old, on any warning or error, and
+    at exit. Lines go to the stdout active at write time, so Click and pytest
+    capture still receive them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._lines: list[str] = []
+        self._timer: threading.Timer | None = None
+
+    def __call__(self, message: loguru.Message) -> None:
+        record = message.record
+        line = _json_line(record)
+        with self._lock:
+            self._lines.append(line)
+            if (
+                len(self._lines) >= _JSON_BATCH_LINES
+                or record["level"].no >= _WARNING_LEVEL
+            ):
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(_JSON_FLUSH_SECONDS, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+_json_sink = _BufferedJsonSink()
+atexit.register(_json_sink.flush)
+
+
+def flush_logs() -> None:
+    """Write any JSON records still waiting for their batch."""
+
+    _json_sink.flush()
+
+
+def configure_logging(verbose: bool, *, log_format: str = "text") -> None:
+    """Emit safe fbn records without changing the root logger.
+
+    ``log_format="json"`` writes one compact JSON object per record with the
+    same fields as the readable text format.
+    """
+
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"log_format must be one of: {', '.join(LOG_FORMATS)}")
+    _json_sink.flush()
+    handler: dict[str, Any] = {
+        "level": "DEBUG" if verbose else "WARNING",
+        "filter": _is_fbn_record,
+        "backtrace": False,
+        "diagnose": False,
+    }
+    if log_format == "json":
+        handler.update(sink=_json_sink, format="{message}", colorize=False)
+    else:
+        handler.update(
+            sink=_write_stdout,
+            format=_human_format,
+            colorize=sys.stdout.isatty(),
+        )
+    logger.configure(handlers=[handler])
     logger.enable("fbn")
 
     # Apprise can include destination URLs and notification bodies in its own
@@ -0,0 +1,359 @@
+"""Process-local scan-performance metrics in the Prometheus text format.
+
+Components record into a shared ``MetricsRegistry``. ``export_metrics`` then
+serves the registry on a loopback HTTP endpoint, writes it periodically to a
+node-exporter textfile-collector file, or both. Only a fixed, declared set of
+metric families with low-cardinality labels can be recorded, so no group name,
+URL, or post content ever reaches an exported sample.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .exceptions import ConfigurationError
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    from .profiling import TraceRecorder
+
+LOGGER = get_logger("metrics")
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+SCROLL_BUCKETS = (0.0, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass(frozen=True, slots=True)
+class MetricFamily:
+    """One declared metric: its kind, help text, labels, and buckets."""
+
+    name: str
+    kind: str
+    help: str
+    labels: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = ()
+
+
+FAMILIES = {
+    family.name: family
+    for family in (
+        MetricFamily(
+            "fbn_browser_launch_seconds",
+            "histogram",
+            "Time to start the Playwright driver and launch the browser context.",
+            buckets=LATENCY_BUCKETS,
+        ),
+        MetricFamily(
+            "fbn_navigation_seconds",
+            "histogram",
+            "Time for the group feed navigation to return a response.",
+            buckets=LATENCY_BUCKETS,
+        ),
+        MetricFamily(
+            "fbn_terminal_page_seconds",
+            "histogram",
+            "Time from the navigation response to a recognized page state.",
+            buckets=LATENCY_BUCKETS,
+        ),
+        MetricFamily(
+            "fbn_extraction_pass_seconds",
+            "histogram",
+            "Time for one feed snapshot and post extraction pass.",
+            buckets=LATENCY_BUCKETS,
+        ),
+        MetricFamily(
+            "fbn_feed_scrolls",
+            "histogram",
+            "Scroll passes performed by one completed feed scan.",
+            buckets=SCROLL_BUCKETS,
+        ),
+        MetricFamily(
+            "fbn_scans_total",
+            "counter",
+            "Completed feed scans by page state or failure category.",
+            labels=("result",),
+        ),
+        MetricFamily(
+            "fbn_state_observe_seconds",
+            "histogram",
+            "Time for one SQLite observation transaction.",
+            buckets=LATENCY_BUCKETS,
+        ),
+        MetricFamily(
+            "fbn_delivery_chunk_seconds",
+            "histogram",
+            "Time to send one digest chunk and record its outcome.",
+            labels=("outcome",),
+            buckets=LATENCY_BUCKETS,
+        ),
+    )
+}
+
+
+class _Histogram:
+    __slots__ = ("count", "counts", "total")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.counts = [0] * bucket_count
+        self.count = 0
+        self.total = 0.0
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms for the declared metric families.
+
+    A ``TraceRecorder`` can be attached for profiled runs; ``span`` then records
+    a trace span, and is a no-op otherwise.
+    """
+
+    def __init__(self, *, tracer: TraceRecorder | None = None) -> None:
+        self.tracer = tracer
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple[str, ...]], float] = {}
+        self._histograms: dict[tuple[str, tuple[str, ...]], _Histogram] = {}
+
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Add a non-negative amount to a counter."""
+
+        family = self._family(name, "counter", labels)
+        if not math.isfinite(amount) or amount < 0:
+            raise ValueError("counter increments must be finite and non-negative")
+        key = (family.name, tuple(labels[label] for label in family.labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one histogram observation."""
+
+        family = self._family(name, "histogram", labels)
+        if not math.isfinite(value):
+            raise ValueError("histogram observations must be finite")
+        key = (family.name, tuple(labels[label] for label in family.labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = _Histogram(len(family.buckets))
+                self._histograms[key] = histogram
+            for index, bound in enumerate(family.buckets):
+                if value <= bound:
+                    histogram.counts[index] += 1
+            histogram.count += 1
+            histogram.total += value
+
+    def span(
+        self,
+        name: str,
+        *,
+        track: str | None = None,
+        **args: object,
+    ) -> AbstractContextManager[None]:
+        """Record a profiling span for the enclosed block when tracing."""
+
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, track=track, **args)
+
+    def render(self) -> str:
+        """Return every family in the Prometheus text exposition format."""
+
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {
+                key: (list(value.counts), value.count, value.total)
+                for key, value in self._histograms.items()
+            }
+
+        lines: list[str] = []
+        for family in FAMILIES.values():
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            if family.kind == "counter":
+                samples = sorted(
+                    (values, total)
+                    for (name, values), total in counters.items()
+                    if name == family.name
+                )
+                if not samples and not family.labels:
+                    samples = [((), 0.0)]
+                for values, total in samples:
+                    labels = _labels(zip(family.labels, values, strict=True))
+                    lines.append(f"{family.name}{labels} {_number(total)}")
+                continue
+
+            series = sorted(
+                (values, state)
+                for (name, values), state in histograms.items()
+                if name == family.name
+            )
+            if not series and not family.labels:
+                series = [((), ([0] * len(family.buckets), 0, 0.0))]
+            for values, (counts, count, total) in series:
+                pairs = list(zip(family.labels, values, strict=True))
+                for bound, bucket_count in zip(family.buckets, counts, strict=True):
+                    le = _labels([*pairs, ("le", _number(bound))])
+                    lines.append(f"{family.name}_bucket{le} {bucket_count}")
+                le = _labels([*pairs, ("le", "+Inf")])
+                lines.append(f"{family.name}_bucket{le} {count}")
+                lines.append(f"{family.name}_sum{_labels(pairs)} {_number(total)}")
+                lines.append(f"{family.name}_count{_labels(pairs)} {count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _family(name: str, kind: str, labels: dict[str, str]) -> MetricFamily:
+        family = FAMILIES.get(name)
+        if family is None or family.kind != kind:
+            raise ValueError(f"{name} is not a declared {kind}")
+        if set(labels) != set(family.labels):
+            raise ValueError(f"{name} requires labels: {', '.join(family.labels)}")
+        if not all(isinstance(value, str) for value in labels.values()):
+            raise ValueError("metric label values must be strings")
+        return family
+
+
+def _number(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _labels(pairs: Iterable[tuple[str, str]]) -> str:
+    rendered = [f'{name}="{_escape(value)}"' for name, value in pairs]
+    return "{" + ",".join(rendered) + "}" if rendered else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def write_textfile(registry: MetricsRegistry, path: Path) -> None:
+    """Atomically replace a textfile-collector file with the current metrics."""
+
+    descriptor, temporary = tempfile.mkstemp(
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        dir=path.parent,
+    )
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            handle.write(registry.render())
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def _metrics_handler(registry: MetricsRegistry) -> type:
+    # Imported lazily so importing fbn never loads the HTTP server stack.
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            del format, args
+
+    return MetricsHandler
+
+
+@contextmanager
+def export_metrics(
+    registry: MetricsRegistry,
+    *,
+    port: int | None = None,
+    textfile: Path | None = None,
+    interval_seconds: float = 15.0,
+    host: str = "127.0.0.1",
+) -> Iterator[int | None]:
+    """Serve and/or periodically write ``registry`` until the block exits.
+
+    Yields the bound HTTP port, which differs from ``port`` only when ``port``
+    is 0. The textfile is written once more on exit so it ends current.
+    """
+
+    if textfile is not None and not textfile.parent.is_dir():
+        raise ConfigurationError("The metrics textfile directory does not exist.")
+    server: ThreadingHTTPServer | None = None
+    threads: list[threading.Thread] = []
+    stop = threading.Event()
+    bound_port: int | None = None
+
+    def start(target: Callable[[], None], name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    try:
+        if port is not None:
+            from http.server import ThreadingHTTPServer
+
+            try:
+                server = ThreadingHTTPServer((host, port), _metrics_handler(registry))
+            except OSError as exc:
+                raise ConfigurationError(
+                    f"The metrics endpoint could not listen on {host}:{port}."
+                ) from exc
+            server.daemon_threads = True
+            bound_port = server.server_address[1]
+            start(server.serve_forever, "fbn-metrics-http")
+            LOGGER.info("Metrics endpoint started", host=host, port=bound_port)
+        if textfile is not None:
+
+            def write_periodically() -> None:
+                while not stop.wait(interval_seconds):
+                    _write_safely(registry, textfile)
+
+            _write_safely(registry, textfile)
+            start(write_periodically, "fbn-metrics-textfile")
+        yield bound_port
+    finally:
+        stop.set()
+        if server is not None:
+            if threads:
+                server.shutdown()
+            server.server_close()
+        for thread in threads:
+            thread.join(timeout=5)
+        if textfile is not None:
+            _write_safely(registry, textfile)
+
+
+def _write_safely(registry: MetricsRegistry, path: Path) -> None:
+    try:
+        write_textfile(registry, path)
+    except OSError as exc:
+        LOGGER.warning("Metrics textfile write failed", category=type(exc).__name__)
@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import math
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+DEFAULT_ALLOWED_HOSTS = ("facebook.com", "fbcdn.net")
+_HOST_PATTERN = re.compile(r"(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}")
+# Notification destination names are stored and logged, so they are short,
+# secret-free identifiers rather than Apprise URLs.
+DESTINATION_PATTERN = re.compile(r"[a-z0-9][a-z0-9._-]{0,63}")
+
 
 def _require_non_empty(value: str, field_name: str) -> None:
     if not isinstance(value, str) or not value:
@@ -83,7 +90,11 @@ class Post:
 
 @dataclass(frozen=True, slots=True)
 class ScanPolicy:
-    """Hard limits for one browser scan."""
+    """Hard limits for one browser scan.
+
+    A positive ``stop_after_known`` ends a scan early once that many
+    consecutive feed posts are already known to the source's probe.
+    """
 
     sample_count: int = 10
     max_scrolls: int = 4
@@ -91,6 +102,10 @@ class ScanPolicy:
     navigation_timeout_seconds: float = 30
     settle_seconds: float = 1
     timezone_name: str = "UTC"
+    tab_timeout_seconds: float = 180
+    block_resources: bool = True
+    allowed_hosts: tuple[str, ...] = DEFAULT_ALLOWED_HOSTS
+    stop_after_known: int = 0
 
     def __post_init__(self) -> None:
         if (
@@ -126,6 +141,32 @@ class ScanPolicy:
         ):
             raise ValueError("settle_seconds must be non-negative")
         _require_timezone_name(self.timezone_name)
+        if (
+            isinstance(self.tab_timeout_seconds, bool)
+            or not isinstance(self.tab_timeout_seconds, (int, float))
+            or not math.isfinite(self.tab_timeout_seconds)
+            or self.tab_timeout_seconds <= 0
+        ):
+            raise ValueError("tab_timeout_seconds must be positive")
+        if not isinstance(self.block_resources, bool):
+            raise ValueError("block_resources must be a boolean")
+        if (
+            not isinstance(self.allowed_hosts, tuple)
+            or not self.allowed_hosts
+            or not all(
+                isinstance(host, str) and _HOST_PATTERN.fullmatch(host)
+                for host in self.allowed_hosts
+            )
+        ):
+            raise ValueError(
+                "allowed_hosts must be a non-empty tuple of lowercase host names"
+            )
+        if (
+            isinstance(self.stop_after_known, bool)
+            or not isinstance(self.stop_after_known, int)
+            or not 0 <= self.stop_after_known <= 50
+        ):
+            raise ValueError("stop_after_known must be an integer between 0 and 50")
 
 
 @dataclass(frozen=True, slots=True)
@@ -161,6 +202,7 @@ class PendingNotification:
     position: int
     created_at: datetime
     attempts: int
+    delivered_to: frozenset[str] = frozenset()
 
     def __post_init__(self) -> None:
         _require_non_empty(self.event_id, "event_id")
@@ -175,6 +217,11 @@ class PendingNotification:
         if not isinstance(self.created_at, datetime):
             raise ValueError("created_at must be a datetime")
         _require_non_negative(self.attempts, "attempts")
+        if not isinstance(self.delivered_to, frozenset) or not all(
+            isinstance(name, str) and DESTINATION_PATTERN.fullmatch(name)
+            for name in self.delivered_to
+        ):
+            raise ValueError("delivered_to must be a frozenset of destination names")
 
 
 @dataclass(frozen=True, slots=True)
@@ -197,6 +244,37 @@ class ObservationBatch:
             raise ValueError("pending must be a tuple of PendingNotification values")
 
 
+@dataclass(frozen=True, slots=True)
+class CompactionSummary:
+    """Counts describing one retention and compaction pass."""
+
+    deleted_posts: int
+    deleted_events: int
+    reclaimed_bytes: int
+
+    def __post_init__(self) -> None:
+        _require_non_negative(self.deleted_posts, "deleted_posts")
+        _require_non_negative(self.deleted_events, "deleted_events")
+        _require_non_negative(self.reclaimed_bytes, "reclaimed_bytes")
+
+
+@dataclass(frozen=True, slots=True)
+class DeliverySummary:
+    """Counts describing one pass of the standalone delivery worker."""
+
+    delivered: int
+    pending: int
+    failed_groups: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        _require_non_negative(self.delivered, "delivered")
+        _require_non_negative(self.pending, "pending")
+        if not isinstance(self.failed_groups, tuple):
+            raise ValueError("failed_groups must be a tuple")
+        for group_key in self.failed_groups:
+            _require_non_empty(group_key, "failed_groups")
+
+
 @dataclass(frozen=True, slots=True)
 class RunSummary:
     """Secret-safe counts describing one monitor run."""
@@ -3,22 +3,23 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, ExitStack
 from datetime import datetime, timezone
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
-from .exceptions import DeliveryError
+from .delivery import OutboxDelivery, OutboxState
+from .exceptions import FbnError, MonitorInUseError
 from .logging import get_logger
+from .metrics import MetricsRegistry
 from .models import (
     GroupRef,
     ObservationBatch,
-    PendingNotification,
     Post,
     RunSummary,
     ScanPolicy,
     ScanResult,
 )
-from .notifications import NotificationSink, render_digest_chunks
+from .notifications import NotificationSink
 
 LOGGER = get_logger("monitor")
 
@@ -30,12 +31,27 @@ class PostSource(Protocol):
         """Fetch recent posts or raise a typed acquisition failure."""
 
 
-class StateRepository(Protocol):
+@runtime_checkable
+class BatchPostSource(PostSource, Protocol):
+    """A post source that can scan several groups concurrently."""
+
+    def fetch_many(
+        self,
+        groups: Sequence[GroupRef],
+        policy: ScanPolicy,
+    ) -> tuple[ScanResult | FbnError, ...]:
+        """Return one scan or typed failure per group, in order."""
+
+
+class StateRepository(OutboxState, Protocol):
     """Durable seen-post and notification-outbox operations."""
 
     def run_lock(self) -> AbstractContextManager[None]:
         """Exclusively own one observation and delivery cycle."""
 
+    def delivery_lock(self) -> AbstractContextManager[None]:
+        """Exclusively own outbox draining, or raise ``MonitorInUseError``."""
+
     def observe(
         self,
         group: GroupRef,
@@ -44,39 +60,33 @@ class StateRepository(Protocol):
         notify_initial: bool = False,
         observed_at: datetime | None = None,
         same_day_only: bool = False,
+        load_pending: bool = True,
     ) -> ObservationBatch:
         """Atomically record a scan and return pending delivery records."""
 
-    def pending(self, group: GroupRef) -> tuple[PendingNotification, ...]:
-        """Return all currently pending records in deterministic order."""
-
-    def mark_delivered(
-        self,
-        event_ids: Sequence[str],
-        delivered_at: datetime | None = None,
-    ) -> None:
-        """Mark events delivered and discard retained private body text."""
-
-    def mark_delivery_failed(
-        self,
-        event_ids: Sequence[str],
-        error: str,
-    ) -> None:
-        """Record a redacted delivery failure without dropping events."""
-
 
 class MonitorService:
-    """Coordinate acquisition, durable observation, and notification."""
+    """Coordinate acquisition, durable observation, and notification.
+
+    Without a sink, checks only record posts and leave every event pending
+    for a separate ``fbn deliver`` worker. With a sink, a check delivers only
+    while it holds the delivery lock; if a worker holds it, the events are left
+    to that worker so none is sent twice. Scan results and delivery chunk
+    timings are recorded in ``metrics``.
+    """
 
     def __init__(
         self,
         source: PostSource,
         state: StateRepository,
-        sink: NotificationSink,
+        sink: NotificationSink | None,
+        *,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         self.source = source
         self.state = state
         self.sink = sink
+        self.metrics = MetricsRegistry() if metrics is None else metrics
 
     def run_once(
         self,
@@ -115,7 +125,85 @@ class MonitorService:
                 group_key=group.key,
                 category=type(exc).__name__,
             )
+            self.metrics.increment("fbn_scans_total", result=type(exc).__name__)
             raise
+        return self._record_scan(
+            group,
+            scan,
+            notify_initial=notify_initial,
+            commit_delivery=commit_delivery,
+        )
+
+    def run_batch(
+        self,
+        groups: Sequence[GroupRef],
+        policy: ScanPolicy,
+        *,
+        notify_initial: bool = False,
+        commit_delivery: bool = True,
+    ) -> tuple[RunSummary | FbnError, ...]:
+        """Check several groups under one run lock and return each outcome.
+
+        A source that implements ``fetch_many`` scans the groups concurrently;
+        any other source is fetched one group at a time. A typed failure of one
+        group is returned in its place instead of abandoning the others.
+        """
+
+        with self.state.run_lock():
+            for group in groups:
+                LOGGER.info("Observation started", group_key=group.key)
+            if isinstance(self.source, BatchPostSource):
+                scans = self.source.fetch_many(groups, policy)
+            else:
+                scans = tuple(self._fetch_or_error(group, policy) for group in groups)
+
+            outcomes: list[RunSummary | FbnError] = []
+            for group, scan in zip(groups, scans, strict=True):
+                if isinstance(scan, FbnError):
+                    LOGGER.warning(
+                        "Observation scan failed",
+                        group_key=group.key,
+                        category=type(scan).__name__,
+                    )
+                    self.metrics.increment(
+                        "fbn_scans_total",
+                        result=type(scan).__name__,
+                    )
+                    outcomes.append(scan)
+                    continue
+                try:
+                    outcomes.append(
+                        self._record_scan(
+                            group,
+                            scan,
+                            notify_initial=notify_initial,
+                            commit_delivery=commit_delivery,
+                        )
+                    )
+                except FbnError as exc:
+                    outcomes.append(exc)
+            return tuple(outcomes)
+
+    def _fetch_or_error(
+        self,
+        group: GroupRef,
+        policy: ScanPolicy,
+    ) -> ScanResult | FbnError:
+        try:
+            return self.source.fetch_recent(group, policy)
+        except FbnError as exc:
+            return exc
+
+    def _record_scan(
+        self,
+        group: GroupRef,
+        scan: ScanResult,
+        *,
+        notify_initial: bool,
+        commit_delivery: bool,
+    ) -> RunSummary:
+        """Record one completed scan and deliver its pending notifications."""
+
         LOGGER.info(
             "Scan completed",
             group_key=group.key,
@@ -124,15 +212,17 @@ class MonitorService:
             scroll_count=scan.scrolls,
             bounded=scan.bounded,
         )
+        self.metrics.increment("fbn_scans_total", result=scan.page_state)
         observed_at = datetime.now(timezone.utc)
-        batch = self.state.observe(
-            group,
-            scan.posts,
-            notify_initial=notify_initial,
-            observed_at=observed_at,
-            same_day_only=True,
-        )
-        pending = batch.pending
+        with self.metrics.span("observe", post_count=len(scan.posts)):
+            batch = self.state.observe(
+                group,
+                scan.posts,
+                notify_initial=notify_initial,
+                observed_at=observed_at,
+                same_day_only=True,
+                load_pending=False,
+            )
         delivered = 0
         LOGGER.info(
             "Observation recorded",
@@ -140,85 +230,39 @@ class MonitorService:
             baseline=batch.baseline,
             inserted_count=batch.inserted,
             queued_count=batch.queued,
-            pending_count=len(pending),
         )
 
-        if pending:
-            chunks = render_digest_chunks(group.key, pending)
-            LOGGER.info(
-                "Pending notification delivery started",
-                group_key=group.key,
-                post_count=len(pending),
-                chunk_count=len(chunks),
-                commit_delivery=commit_delivery,
-            )
-            for index, chunk in enumerate(chunks, start=1):
-                LOGGER.debug(
-                    "Notification chunk delivery started",
+        if self.sink is None:
+            deferred = self.state.pending_count(group)
+            if deferred:
+                LOGGER.info(
+                    "Notification delivery deferred",
                     group_key=group.key,
-                    chunk_index=index,
-                    chunk_count=len(chunks),
-                    post_count=len(chunk.event_ids),
+                    post_count=deferred,
                 )
+        else:
+            with ExitStack() as stack:
                 try:
-                    self.sink.send(chunk.notification)
-                except DeliveryError as exc:
-                    LOGGER.warning(
-                        "Notification delivery failed",
-                        group_key=group.key,
-                        chunk_index=index,
-                        chunk_count=len(chunks),
-                        post_count=len(chunk.event_ids),
-                        category=type(exc).__name__,
-                    )
-                    self.state.mark_delivery_failed(
-                        chunk.event_ids,
-                        str(exc),
-                    )
-                    raise
-                except Exception as exc:
-                    LOGGER.warning(
-                        "Notification delivery failed",
-                        group_key=group.key,
-                        chunk_index=index,
-                        chunk_count=len(chunks),
-                        post_count=len(chunk.event_ids),
-                        category=type(exc).__name__,
-                    )
-                    redacted = DeliveryError(
-                        f"Notification delivery failed ({type(exc).__name__})."
-                    )
-                    self.state.mark_delivery_failed(
-                        chunk.event_ids,
-                        str(redacted),
-                    )
-                    raise redacted from exc
-
-                if commit_delivery:
-                    self.state.mark_delivered(
-                        chunk.event_ids,
-                        delivered_at=observed_at,
-                    )
-                    delivered += len(chunk.event_ids)
+                    stack.enter_context(self.state.delivery_lock())
+                except MonitorInUseError:
                     LOGGER.info(
-                        "Notification chunk delivery committed",
+                        "Notification delivery left to the delivery worker",
                         group_key=group.key,
-                        chunk_index=index,
-                        chunk_count=len(chunks),
-                        post_count=len(chunk.event_ids),
                     )
                 else:
-                    LOGGER.info(
-                        "Notification chunk dry run completed",
-                        group_key=group.key,
-                        chunk_index=index,
-                        chunk_count=len(chunks),
-                        post_count=len(chunk.event_ids),
-                    )
-        else:
-            LOGGER.info("No pending notifications", group_key=group.key)
+                    with self.metrics.span("deliver", group_key=group.key):
+                        delivered = OutboxDelivery(
+                            self.state,
+                            self.sink,
+                            metrics=self.metrics,
+                        ).deliver(
+                            group,
+                            self.state.iter_pending(group, due_at=observed_at),
+                            commit_delivery=commit_delivery,
+                            delivered_at=observed_at,
+                        )
 
-        remaining = len(self.state.pending(group))
+        remaining = self.state.pending_count(group)
         summary = RunSummary(
             group_key=group.key,
             observed=len(scan.posts),
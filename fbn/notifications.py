@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+import hashlib
+import math
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, wait
 from dataclasses import dataclass
-from typing import Protocol
-
-import apprise
+from typing import Protocol, runtime_checkable
+from urllib.parse import urlsplit
 
 from .exceptions import DeliveryError
-from .models import PendingNotification
+from .models import DESTINATION_PATTERN, PendingNotification
 
 MAX_POST_BODY_CHARS = 4_000
 MAX_DIGEST_CHARS = 32_000
@@ -38,6 +41,22 @@ class NotificationSink(Protocol):
         """Deliver a notification."""
 
 
+@runtime_checkable
+class FanoutNotificationSink(NotificationSink, Protocol):
+    """A sink that delivers to several named destinations independently."""
+
+    @property
+    def destinations(self) -> tuple[str, ...]:
+        """Return every configured destination name in a stable order."""
+
+    def send_each(
+        self,
+        notification: Notification,
+        destinations: Sequence[str],
+    ) -> dict[str, DeliveryError | None]:
+        """Send to the named destinations and return each one's outcome."""
+
+
 def render_digest(
     group_key: str,
     pending: Sequence[PendingNotification],
@@ -68,7 +87,46 @@ def render_digest_chunks(
             ),
         )
 
-    grouped: list[tuple[list[str], list[str]]] = []
+    grouped = list(_digest_sections(ordered))
+    total_chunks = len(grouped)
+    return tuple(
+        _digest_chunk(
+            group_key,
+            chunk_sections,
+            chunk_event_ids,
+            f"{index}/{total_chunks}" if total_chunks > 1 else None,
+        )
+        for index, (chunk_sections, chunk_event_ids, _) in enumerate(
+            grouped,
+            start=1,
+        )
+    )
+
+
+def iter_digest_chunks(
+    group_key: str,
+    pending: Iterable[PendingNotification],
+) -> Iterator[NotificationChunk]:
+    """Lazily render pending posts, already in delivery order, into chunks.
+
+    Each chunk is yielded as soon as the next post no longer fits, so only one
+    chunk is held at a time. The total is unknown while streaming, so a
+    multi-chunk digest is titled ``(part N)`` instead of ``(N/total)``.
+    """
+
+    for index, (sections, event_ids, last) in enumerate(
+        _digest_sections(pending),
+        start=1,
+    ):
+        part = None if index == 1 and last else f"part {index}"
+        yield _digest_chunk(group_key, sections, event_ids, part)
+
+
+def _digest_sections(
+    ordered: Iterable[PendingNotification],
+) -> Iterator[tuple[list[str], list[str], bool]]:
+    """Yield each chunk's sections, its event IDs, and whether it is the last."""
+
     sections: list[str] = []
     event_ids: list[str] = []
     rendered_length = 0
@@ -81,7 +139,7 @@ def render_digest_chunks(
         if len(section) > MAX_DIGEST_CHARS:
             raise ValueError("one pending notification exceeds the digest limit")
         if sections and rendered_length + added_length > MAX_DIGEST_CHARS:
-            grouped.append((sections, event_ids))
+            yield sections, event_ids, False
             sections = []
             event_ids = []
             rendered_length = 0
@@ -90,25 +148,23 @@ def render_digest_chunks(
         event_ids.append(item.event_id)
         rendered_length += added_length
     if sections:
-        grouped.append((sections, event_ids))
+        yield sections, event_ids, True
 
-    total_chunks = len(grouped)
-    chunks: list[NotificationChunk] = []
-    for index, (chunk_sections, chunk_event_ids) in enumerate(grouped, start=1):
-        count = len(chunk_event_ids)
-        title = f"{count} new post{'s' if count != 1 else ''} from {group_key}"
-        if total_chunks > 1:
-            title = f"{title} ({index}/{total_chunks})"
-        chunks.append(
-            NotificationChunk(
-                notification=Notification(
-                    title=title,
-                    body="\n\n".join(chunk_sections),
-                ),
-                event_ids=tuple(chunk_event_ids),
-            )
-        )
-    return tuple(chunks)
+
+def _digest_chunk(
+    group_key: str,
+    sections: Sequence[str],
+    event_ids: Sequence[str],
+    part: str | None,
+) -> NotificationChunk:
+    count = len(event_ids)
+    title = f"{count} new post{'s' if count != 1 else ''} from {group_key}"
+    if part is not None:
+        title = f"{title} ({part})"
+    return NotificationChunk(
+        notification=Notification(title=title, body="\n\n".join(sections)),
+        event_ids=tuple(event_ids),
+    )
 
 
 class ConsoleSink:
@@ -122,22 +178,39 @@ class ConsoleSink:
 
 
 class AppriseSink:
-    """Deliver notifications through an Apprise URL."""
+    """Deliver notifications through an Apprise URL.
+
+    The Apprise object is built and validated on the first send and reused for
+    later chunks and checks, so its URL is parsed once. Any failure discards
+    it, and the next send builds a fresh one. A send takes the object under a
+    lock and owns it until it returns, so a send that ``FanoutSink`` abandoned
+    at its deadline never shares an object with a later send.
+    """
 
     def __init__(
         self,
         url: str,
         *,
-        app_factory: Callable[[], object] = apprise.Apprise,
+        app_factory: Callable[[], object] | None = None,
     ) -> None:
         self._url = url
         self._app_factory = app_factory
+        self._app: object | None = None
+        self._app_lock = threading.Lock()
 
     def send(self, notification: Notification) -> None:
+        # Imported lazily so commands that never deliver skip Apprise's plugins.
+        import apprise
+
+        with self._app_lock:
+            app, self._app = self._app, None
         try:
-            app = self._app_factory()
-            if not app.add(self._url):  # type: ignore[attr-defined]
-                raise DeliveryError("Apprise rejected the configured notification URL.")
+            if app is None:
+                app = (self._app_factory or apprise.Apprise)()
+                if not app.add(self._url):  # type: ignore[attr-defined]
+                    raise DeliveryError(
+                        "Apprise rejected the configured notification URL."
+                    )
             delivered = app.notify(  # type: ignore[attr-defined]
                 title=notification.title,
                 body=notification.body,
@@ -152,3 +225,123 @@ class AppriseSink:
 
         if not delivered:
             raise DeliveryError("Apprise did not deliver the notification.")
+        with self._app_lock:
+            if self._app is None:
+                self._app = app
+
+
+def apprise_destination_name(url: str) -> str:
+    """Return a stable, secret-free name for one Apprise URL.
+
+    The name keeps only the URL scheme and a short digest, so it can be stored
+    with delivery records and logged without exposing tokens.
+    """
+
+    scheme = "".join(
+        character
+        for character in urlsplit(url.strip()).scheme.lower()
+        if character.isascii() and character.isalnum()
+    )
+    digest = hashlib.sha256(url.strip().encode("utf-8")).hexdigest()[:12]
+    return f"{scheme[:32] or 'apprise'}-{digest}"
+
+
+def _send_into(
+    future: Future[None],
+    sink: NotificationSink,
+    notification: Notification,
+) -> None:
+    future.set_running_or_notify_cancel()
+    try:
+        sink.send(notification)
+    except BaseException as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(None)
+
+
+class FanoutSink:
+    """Deliver each notification to several named sinks concurrently.
+
+    Every destination sends on its own thread, and all of them share one
+    deadline of ``timeout`` seconds from the start of the send. A destination
+    that raises or misses the deadline is reported in its place without
+    delaying or failing the others; a send still running at the deadline is
+    abandoned rather than awaited. Sends run on daemon threads, so an abandoned
+    send never holds up interpreter exit either. An abandoned send may still
+    deliver after
+    it was reported as timed out, so the retry of its events can notify twice;
+    delivery is at-least-once. Sinks must therefore not share mutable state
+    between concurrent sends.
+    """
+
+    def __init__(
+        self,
+        sinks: Mapping[str, NotificationSink],
+        *,
+        timeout: float = 30.0,
+    ) -> None:
+        if not sinks:
+            raise ValueError("sinks must name at least one destination")
+        for name in sinks:
+            if not isinstance(name, str) or not DESTINATION_PATTERN.fullmatch(name):
+                raise ValueError(f"invalid destination name: {name!r}")
+        if (
+            isinstance(timeout, bool)
+            or not isinstance(timeout, (int, float))
+            or not math.isfinite(timeout)
+            or timeout <= 0
+        ):
+            raise ValueError("timeout must be a positive number of seconds")
+        self._sinks = dict(sinks)
+        self._timeout = float(timeout)
+
+    @property
+    def destinations(self) -> tuple[str, ...]:
+        return tuple(self._sinks)
+
+    def send(self, notification: Notification) -> None:
+        outcomes = self.send_each(notification, self.destinations)
+        failed = [name for name, error in outcomes.items() if error is not None]
+        if failed:
+            raise DeliveryError(f"Delivery failed for {', '.join(failed)}.")
+
+    def send_each(
+        self,
+        notification: Notification,
+        destinations: Sequence[str],
+    ) -> dict[str, DeliveryError | None]:
+        names = tuple(dict.fromkeys(destinations))
+        unknown = [name for name in names if name not in self._sinks]
+        if unknown:
+            raise ValueError(f"unknown destinations: {', '.join(unknown)}")
+        if not names:
+            return {}
+
+        futures: dict[str, Future[None]] = {}
+        for name in names:
+            future: Future[None] = Future()
+            futures[name] = future
+            # Not a ThreadPoolExecutor: its workers are joined at interpreter
+            # exit, so one hung destination would keep the process alive.
+            threading.Thread(
+                target=_send_into,
+                args=(future, self._sinks[name], notification),
+                name=f"fbn-delivery-{name}",
+                daemon=True,
+            ).start()
+        done, _ = wait(futures.values(), timeout=self._timeout)
+
+        outcomes: dict[str, DeliveryError | None] = {}
+        for name, future in futures.items():
+            if future not in done:
+                outcomes[name] = DeliveryError(f"Delivery to {name} timed out.")
+                continue
+            error = future.exception()
+            if error is None or isinstance(error, DeliveryError):
+                outcomes[name] = error
+            else:
+                outcomes[name] = DeliveryError(
+                    f"Delivery to {name} failed ({type(error).__name__})."
+                )
+        return outcomes
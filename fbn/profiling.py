@@ -0,0 +1,157 @@
+"""Opt-in per-phase profiling written as Chrome trace-event JSON.
+
+``fbn check --profile FILE`` and ``fbn monitor --profile FILE`` attach a
+``TraceRecorder`` to the run's ``MetricsRegistry``. Every component that
+already records metrics then also records a span for each scan, browser, state,
+and delivery phase. The file opens in ``chrome://tracing`` or Perfetto. With
+``--profile-python``, a cProfile dump of the Python side is written next to it.
+Spans carry phase names, counts, and failure classes, never post content.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .exceptions import ConfigurationError
+from .logging import get_logger
+
+LOGGER = get_logger("profiling")
+PYTHON_PROFILE_SUFFIX = ".pstats"
+
+
+class TraceRecorder:
+    """Thread-safe complete-event spans for one profiled run.
+
+    Each span is placed on a named track, shown as one thread row by trace
+    viewers. Spans default to the current thread's track. Browser scan phases
+    use one track per group, so tabs interleaved on one thread still nest.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._events: list[dict[str, object]] = []
+        self._tracks: dict[str, int] = {}
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        track: str | None = None,
+        **args: object,
+    ) -> Iterator[None]:
+        """Record the enclosed block, and the failure class if it raises."""
+
+        started = time.perf_counter_ns()
+        try:
+            yield
+        except BaseException as exc:
+            args["error"] = type(exc).__name__
+            raise
+        finally:
+            ended = time.perf_counter_ns()
+            track_name = threading.current_thread().name if track is None else track
+            with self._lock:
+                tid = self._tracks.setdefault(track_name, len(self._tracks) + 1)
+                self._events.append(
+                    {
+                        "name": name,
+                        "cat": "fbn",
+                        "ph": "X",
+                        "ts": (started - self._origin) / 1_000,
+                        "dur": (ended - started) / 1_000,
+                        "pid": self._pid,
+                        "tid": tid,
+                        "args": args,
+                    }
+                )
+
+    def trace(self) -> dict[str, object]:
+        """Return the recorded spans in the Chrome trace-event JSON format."""
+
+        with self._lock:
+            events = list(self._events)
+            tracks = dict(self._tracks)
+        metadata: list[dict[str, object]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": 0,
+                "args": {"name": "fbn"},
+            }
+        ]
+        metadata.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": tid,
+                "args": {"name": track},
+            }
+            for track, tid in tracks.items()
+        )
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> int:
+        """Atomically replace ``path`` with the trace; return the span count."""
+
+        trace = self.trace()
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            dir=path.parent,
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(trace, handle, separators=(",", ":"), default=str)
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        return sum(1 for event in trace["traceEvents"] if event["ph"] == "X")
+
+
+@contextmanager
+def profile_run(path: Path, *, python: bool = False) -> Iterator[TraceRecorder]:
+    """Record spans until the block exits, then write them to ``path``.
+
+    The trace is written even when the block raises, so a failed or slow run
+    can still be inspected. With ``python``, the calling thread is also
+    profiled with cProfile and its stats are written to ``path`` plus
+    ``.pstats``.
+    """
+
+    if not path.parent.is_dir():
+        raise ConfigurationError("The profile output directory does not exist.")
+    recorder = TraceRecorder()
+    profiler = cProfile.Profile() if python else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield recorder
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        try:
+            span_count = recorder.write(path)
+            if profiler is not None:
+                profiler.dump_stats(path.with_name(path.name + PYTHON_PROFILE_SUFFIX))
+        except OSError as exc:
+            LOGGER.warning("Profile write failed", category=type(exc).__name__)
+        else:
+            LOGGER.info(
+                "Profile written",
+                span_count=span_count,
+                python_profile=profiler is not None,
+            )
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta, timezone
 from threading import Event
 from typing import Protocol
 
 from .config import ScheduleSettings
 from .exceptions import (
+    AccessDeniedError,
     ConfigurationError,
+    DeliveryError,
+    FbnError,
+    LayoutChangedError,
     MonitorInUseError,
     TransientNavigationError,
 )
@@ -20,6 +25,17 @@ from .models import GroupRef, RunSummary, ScanPolicy
 
 MAX_BACKOFF = timedelta(hours=24)
 MAX_WAIT_SECONDS = MAX_BACKOFF.total_seconds()
+# Adaptive intervals are drawn within this fraction either side of the target.
+ADAPTIVE_JITTER = 0.2
+_EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+# Failures confined to one group's page. In a multi-group run the group backs
+# off like a transient failure while the others keep being checked; the monitor
+# still stops once every group has failed this way. Any other failure affects
+# the whole profile and stops the monitor.
+GROUP_SCOPED_ERRORS: tuple[type[FbnError], ...] = (
+    AccessDeniedError,
+    LayoutChangedError,
+)
 LOGGER = get_logger("scheduling")
 
 
@@ -46,6 +62,16 @@ class ScheduledMonitor(Protocol):
     ) -> RunSummary:
         """Perform one browser acquisition, observation, and delivery cycle."""
 
+    def run_batch(
+        self,
+        groups: Sequence[GroupRef],
+        policy: ScanPolicy,
+        *,
+        notify_initial: bool = False,
+        commit_delivery: bool = True,
+    ) -> tuple[RunSummary | FbnError, ...]:
+        """Check several groups together; used when ``batch_size`` exceeds one."""
+
 
 class ScheduleState(Protocol):
     """Persisted scheduling operations required by the loop."""
@@ -72,6 +98,14 @@ class ScheduleState(Protocol):
     ) -> int:
         """Persist one transient failure and its next eligible time."""
 
+    def update_arrival_rate(
+        self,
+        group: GroupRef,
+        *,
+        at: datetime | None = None,
+    ) -> float | None:
+        """Learn from posts first seen since the last update; adaptive mode only."""
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -106,6 +140,34 @@ def backoff_for_failure(
     return timedelta(seconds=seconds)
 
 
+def adaptive_window(
+    schedule: ScheduleSettings,
+    arrival_rate: float | None,
+) -> tuple[timedelta, timedelta]:
+    """Return the jittered interval window for a learned post arrival rate.
+
+    The target interval is the expected time until the next new post, clamped
+    to the schedule bounds. Without a learned rate, the whole range is used.
+    """
+
+    if arrival_rate is None:
+        return schedule.every, schedule.to
+    if (
+        isinstance(arrival_rate, bool)
+        or not isinstance(arrival_rate, (int, float))
+        or not math.isfinite(arrival_rate)
+        or arrival_rate < 0
+    ):
+        raise ValueError("arrival_rate must be a finite non-negative number")
+    lower = schedule.every.total_seconds()
+    upper = schedule.to.total_seconds()
+    target = upper if arrival_rate == 0 else min(upper, max(lower, 3600 / arrival_rate))
+    return (
+        timedelta(seconds=max(lower, target * (1 - ADAPTIVE_JITTER))),
+        timedelta(seconds=min(upper, target * (1 + ADAPTIVE_JITTER))),
+    )
+
+
 class MonitorLoop:
     """Run checks indefinitely while honoring persisted scheduling state."""
 
@@ -118,13 +180,40 @@ class MonitorLoop:
         clock: Callable[[], datetime] = _utc_now,
         uniform: Callable[[float, float], float] = random.uniform,
         on_success: Callable[[RunSummary], None] | None = None,
+        on_group_failure: Callable[[GroupRef, FbnError], None] | None = None,
+        batch_size: int = 1,
+        maintenance: Callable[[], None] | None = None,
+        maintenance_interval: timedelta = timedelta(days=1),
     ) -> None:
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+            raise ValueError("batch_size must be a positive integer")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if not isinstance(
+            maintenance_interval, timedelta
+        ) or maintenance_interval <= timedelta(0):
+            raise ValueError("maintenance_interval must be a positive timedelta")
         self._service = service
+        self._batch_size = batch_size
         self._state = state
         self._schedule = schedule
         self._clock = clock
         self._uniform = uniform
         self._on_success = on_success
+        self._on_group_failure = on_group_failure
+        self._group_keys: frozenset[str] = frozenset()
+        self._scoped_failures: dict[str, FbnError] = {}
+        self._deferred_until: dict[str, datetime] = {}
+        self._current_group: GroupRef | None = None
+        self._maintenance = maintenance
+        self._maintenance_interval = maintenance_interval
+        self._maintained_at: datetime | None = None
+
+    @property
+    def current_group(self) -> GroupRef | None:
+        """Return the group whose check is running or most recently ran."""
+
+        return self._current_group
 
     def run(
         self,
@@ -135,115 +224,320 @@ class MonitorLoop:
         commit_delivery: bool = True,
         stop_event: EventLike | None = None,
     ) -> None:
-        """Run until stopped; retry transient failures and defer to an active peer."""
+        """Run until stopped; back off failed checks and defer to an active peer."""
+
+        self.run_many(
+            (group,),
+            policy,
+            notify_initial=notify_initial,
+            commit_delivery=commit_delivery,
+            stop_event=stop_event,
+        )
 
+    def run_many(
+        self,
+        groups: Sequence[GroupRef],
+        policy: ScanPolicy,
+        *,
+        notify_initial: bool = False,
+        commit_delivery: bool = True,
+        stop_event: EventLike | None = None,
+    ) -> None:
+        """Check whichever group is due next until stopped.
+
+        Groups are ordered by their persisted next eligible time in a priority
+        queue. The queued time of the earliest group is re-read before it is
+        waited on or checked, so a peer that moved it is honored. With a
+        ``batch_size`` above one, up to that many due groups are checked
+        together through ``run_batch``. The ``maintenance`` hook runs after a
+        check once per ``maintenance_interval``, never while one is running.
+
+        An access-denied or layout failure stops the loop when it is the only
+        group, or once every group has failed that way. Otherwise that group
+        backs off, ``on_group_failure`` reports the error, and the others keep
+        being checked.
+        """
+
+        if not groups:
+            raise ValueError("at least one group is required")
+        self._group_keys = frozenset(group.key for group in groups)
+        self._scoped_failures.clear()
         stopper = Event() if stop_event is None else stop_event
         LOGGER.info(
             "Scheduler started",
-            group_key=group.key,
+            group_count=len(groups),
             interval_min_seconds=int(self._schedule.every.total_seconds()),
             interval_max_seconds=int(self._schedule.to.total_seconds()),
         )
+        if stopper.is_set():
+            return
+        queue = [
+            (self._due_at(group), index, group) for index, group in enumerate(groups)
+        ]
+        heapq.heapify(queue)
         while not stopper.is_set():
-            if not self._wait_until_eligible(group, stopper):
-                LOGGER.info("Scheduler stopped before next check", group_key=group.key)
-                return
+            queued_at, index, group = queue[0]
+            due_at = self._due_at(group)
+            if due_at != queued_at:
+                heapq.heapreplace(queue, (due_at, index, group))
+                continue
+            delay = (due_at - self._now()).total_seconds()
+            if delay > 0:
+                LOGGER.info(
+                    "Scheduled check waiting",
+                    group_key=group.key,
+                    delay_seconds=math.ceil(delay),
+                )
+                if stopper.wait(min(delay, MAX_WAIT_SECONDS)):
+                    break
+                continue
 
-            attempt_started = self._now()
-            LOGGER.info("Scheduled check started", group_key=group.key)
-            self._state.set_next_eligible(
-                group,
-                self._add_interval(attempt_started, self._schedule.every),
+            heapq.heappop(queue)
+            batch = [(index, group)]
+            while len(batch) < self._batch_size and queue:
+                queued_at, index, group = queue[0]
+                due_at = self._due_at(group)
+                if due_at != queued_at:
+                    heapq.heapreplace(queue, (due_at, index, group))
+                    continue
+                if due_at > self._now():
+                    break
+                heapq.heappop(queue)
+                batch.append((index, group))
+
+            self._check(
+                [group for _, group in batch],
+                policy,
+                notify_initial=notify_initial,
+                commit_delivery=commit_delivery,
             )
+            for index, group in batch:
+                heapq.heappush(queue, (self._due_at(group), index, group))
+            self._maintain_if_due()
+        LOGGER.info("Scheduler stopped before next check", group_count=len(groups))
+
+    def _check(
+        self,
+        groups: Sequence[GroupRef],
+        policy: ScanPolicy,
+        *,
+        notify_initial: bool,
+        commit_delivery: bool,
+    ) -> None:
+        for group in groups:
+            self._start_attempt(group)
 
-            try:
-                summary = self._service.run_once(
-                    group,
+        try:
+            if len(groups) == 1:
+                outcomes: tuple[RunSummary | FbnError, ...] = (
+                    self._run_once(
+                        groups[0],
+                        policy,
+                        notify_initial=notify_initial,
+                        commit_delivery=commit_delivery,
+                    ),
+                )
+            else:
+                outcomes = self._service.run_batch(
+                    groups,
                     policy,
                     notify_initial=notify_initial,
                     commit_delivery=commit_delivery,
                 )
-            except MonitorInUseError:
-                next_interval = self._success_interval()
+        except MonitorInUseError:
+            next_interval = self._success_interval()
+            for group in groups:
+                self._deferred_until[group.key] = self._add_interval(
+                    self._now(),
+                    next_interval,
+                )
                 LOGGER.info(
                     "Scheduled check skipped because another monitor is active",
                     group_key=group.key,
                     delay_seconds=int(next_interval.total_seconds()),
                 )
-                if stopper.wait(next_interval.total_seconds()):
-                    return
+            return
+
+        failure: tuple[GroupRef, FbnError] | None = None
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, RunSummary):
+                self._record_success(group, outcome)
+            elif isinstance(outcome, TransientNavigationError):
+                self._record_group_failure(group, outcome)
+            elif isinstance(outcome, GROUP_SCOPED_ERRORS) and self._continue_without(
+                group, outcome
+            ):
                 continue
-            except TransientNavigationError:
-                failed_at = self._now()
-                failure_number = self._state.consecutive_failures(group) + 1
-                retry_at = self._add_interval(
-                    failed_at,
-                    backoff_for_failure(
-                        self._schedule,
-                        failure_number,
-                    ),
-                )
-                self._state.record_failure(
-                    group,
-                    next_eligible_at=retry_at,
-                    at=failed_at,
-                )
-                LOGGER.warning(
-                    "Transient navigation failure",
-                    group_key=group.key,
-                    failure_number=failure_number,
-                    retry_delay_seconds=int((retry_at - failed_at).total_seconds()),
-                )
-                continue
-
-            LOGGER.info(
-                "Scheduled check completed",
-                group_key=summary.group_key,
-                observed=summary.observed,
-                new_posts=summary.new_posts,
-                delivered=summary.delivered,
-                pending=summary.pending,
-                baseline=summary.baseline,
-            )
-            if self._on_success is not None:
-                self._on_success(summary)
-            completed_at = self._now()
-            next_interval = self._success_interval()
-            self._state.set_next_eligible(
-                group,
-                self._add_interval(completed_at, next_interval),
-            )
-            LOGGER.info(
-                "Next scheduled check",
-                group_key=group.key,
-                delay_seconds=int(next_interval.total_seconds()),
-            )
-
-    def _wait_until_eligible(
+            elif isinstance(outcome, DeliveryError):
+                self._record_delivery_failure(group, outcome)
+            elif failure is None:
+                failure = (group, outcome)
+        if failure is not None:
+            self._current_group, error = failure
+            raise error
+
+    def _run_once(
         self,
         group: GroupRef,
-        stopper: EventLike,
-    ) -> bool:
-        while not stopper.is_set():
-            eligible_at = self._state.next_eligible(group)
-            now = self._now()
-            if eligible_at is None:
-                return True
-            delay = (_as_utc(eligible_at) - now).total_seconds()
-            if delay <= 0:
-                return True
-            LOGGER.info(
-                "Scheduled check waiting",
-                group_key=group.key,
-                delay_seconds=math.ceil(delay),
+        policy: ScanPolicy,
+        *,
+        notify_initial: bool,
+        commit_delivery: bool,
+    ) -> RunSummary | FbnError:
+        try:
+            return self._service.run_once(
+                group,
+                policy,
+                notify_initial=notify_initial,
+                commit_delivery=commit_delivery,
             )
-            if stopper.wait(min(delay, MAX_WAIT_SECONDS)):
-                return False
-        return False
+        except (TransientNavigationError, DeliveryError, *GROUP_SCOPED_ERRORS) as exc:
+            return exc
+
+    def _start_attempt(self, group: GroupRef) -> None:
+        self._current_group = group
+        self._deferred_until.pop(group.key, None)
+        attempt_started = self._now()
+        LOGGER.info("Scheduled check started", group_key=group.key)
+        self._state.set_next_eligible(
+            group,
+            self._add_interval(attempt_started, self._schedule.every),
+        )
+
+    def _continue_without(self, group: GroupRef, error: FbnError) -> bool:
+        """Back off a group-scoped failure unless no healthy group remains."""
+
+        self._scoped_failures[group.key] = error
+        if self._group_keys <= self._scoped_failures.keys():
+            return False
+        self._record_group_failure(group, error)
+        if self._on_group_failure is not None:
+            self._on_group_failure(group, error)
+        return True
+
+    def _record_group_failure(self, group: GroupRef, error: FbnError) -> None:
+        """Back off one group after a transient or group-scoped failure."""
+
+        failed_at = self._now()
+        failure_number = self._state.consecutive_failures(group) + 1
+        retry_at = self._add_interval(
+            failed_at,
+            backoff_for_failure(
+                self._schedule,
+                failure_number,
+            ),
+        )
+        self._state.record_failure(
+            group,
+            next_eligible_at=retry_at,
+            at=failed_at,
+        )
+        LOGGER.warning(
+            (
+                "Transient navigation failure"
+                if isinstance(error, TransientNavigationError)
+                else "Group check failed; other groups continue"
+            ),
+            group_key=group.key,
+            category=type(error).__name__,
+            failure_number=failure_number,
+            retry_delay_seconds=int((retry_at - failed_at).total_seconds()),
+        )
+
+    def _record_delivery_failure(self, group: GroupRef, error: DeliveryError) -> None:
+        """Keep scanning after a failed send; the outbox retries on its own delay."""
+
+        LOGGER.warning(
+            "Notification delivery failed; pending posts will be retried",
+            group_key=group.key,
+            category=type(error).__name__,
+        )
+        completed_at = self._now()
+        next_interval = self._next_interval(group, completed_at)
+        self._state.set_next_eligible(
+            group,
+            self._add_interval(completed_at, next_interval),
+        )
+        LOGGER.info(
+            "Next scheduled check",
+            group_key=group.key,
+            delay_seconds=int(next_interval.total_seconds()),
+        )
 
-    def _success_interval(self) -> timedelta:
-        lower = self._schedule.every.total_seconds()
-        upper = self._schedule.to.total_seconds()
+    def _record_success(self, group: GroupRef, summary: RunSummary) -> None:
+        self._current_group = group
+        self._scoped_failures.pop(group.key, None)
+        LOGGER.info(
+            "Scheduled check completed",
+            group_key=summary.group_key,
+            observed=summary.observed,
+            new_posts=summary.new_posts,
+            delivered=summary.delivered,
+            pending=summary.pending,
+            baseline=summary.baseline,
+        )
+        if self._on_success is not None:
+            self._on_success(summary)
+        completed_at = self._now()
+        next_interval = self._next_interval(group, completed_at)
+        self._state.set_next_eligible(
+            group,
+            self._add_interval(completed_at, next_interval),
+        )
+        LOGGER.info(
+            "Next scheduled check",
+            group_key=group.key,
+            delay_seconds=int(next_interval.total_seconds()),
+        )
+
+    def _maintain_if_due(self) -> None:
+        """Run the maintenance hook between checks at most once per interval."""
+
+        if self._maintenance is None:
+            return
+        now = self._now()
+        if (
+            self._maintained_at is not None
+            and now - self._maintained_at < self._maintenance_interval
+        ):
+            return
+        self._maintained_at = now
+        self._maintenance()
+
+    def _due_at(self, group: GroupRef) -> datetime:
+        """Return the persisted eligibility, delayed by any in-memory deferral."""
+
+        eligible_at = self._state.next_eligible(group)
+        due_at = _EARLIEST if eligible_at is None else _as_utc(eligible_at)
+        deferred_at = self._deferred_until.get(group.key)
+        if deferred_at is not None and deferred_at > due_at:
+            return deferred_at
+        return due_at
+
+    def _next_interval(self, group: GroupRef, completed_at: datetime) -> timedelta:
+        """Draw the interval after a recorded scan, adapting it when enabled."""
+
+        if not self._schedule.adaptive:
+            return self._success_interval()
+        arrival_rate = self._state.update_arrival_rate(group, at=completed_at)
+        window = adaptive_window(self._schedule, arrival_rate)
+        LOGGER.debug(
+            "Adaptive interval selected",
+            group_key=group.key,
+            arrival_rate_per_hour=(
+                "unknown" if arrival_rate is None else round(arrival_rate, 3)
+            ),
+            interval_min_seconds=int(window[0].total_seconds()),
+            interval_max_seconds=int(window[1].total_seconds()),
+        )
+        return self._success_interval(window)
+
+    def _success_interval(
+        self,
+        window: tuple[timedelta, timedelta] | None = None,
+    ) -> timedelta:
+        bounds = (self._schedule.every, self._schedule.to) if window is None else window
+        lower, upper = (bound.total_seconds() for bound in bounds)
         seconds = self._uniform(lower, upper)
         if (
             isinstance(seconds, bool)
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import os
 import sqlite3
+import time
 import uuid
-from collections.abc import Callable, Iterator, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from types import TracebackType
@@ -13,9 +15,22 @@ from types import TracebackType
 from filelock import FileLock
 from filelock import Timeout as FileLockTimeout
 
-from .config import ensure_private_directory, resolve_state_file
+from .config import (
+    DeliveryRetrySettings,
+    RetentionSettings,
+    ensure_private_directory,
+    resolve_state_file,
+)
 from .exceptions import ConfigurationError, MonitorInUseError
-from .models import GroupRef, ObservationBatch, PendingNotification, Post
+from .metrics import MetricsRegistry
+from .models import (
+    DESTINATION_PATTERN,
+    CompactionSummary,
+    GroupRef,
+    ObservationBatch,
+    PendingNotification,
+    Post,
+)
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS groups (
@@ -24,7 +39,9 @@ CREATE TABLE IF NOT EXISTS groups (
     last_success_at TEXT,
     next_eligible_at TEXT,
     consecutive_failures INTEGER NOT NULL DEFAULT 0
-        CHECK (consecutive_failures >= 0)
+        CHECK (consecutive_failures >= 0),
+    arrival_rate REAL CHECK (arrival_rate >= 0),
+    arrival_rate_at TEXT
 );
 
 CREATE TABLE IF NOT EXISTS posts (
@@ -48,6 +65,8 @@ CREATE TABLE IF NOT EXISTS outbox (
     delivered_at TEXT,
     attempts INTEGER NOT NULL DEFAULT 0 CHECK (attempts >= 0),
     last_error TEXT,
+    next_attempt_at TEXT,
+    dead_at TEXT,
     UNIQUE (group_key, post_id),
     FOREIGN KEY (group_key, post_id)
         REFERENCES posts(group_key, post_id)
@@ -56,9 +75,39 @@ CREATE TABLE IF NOT EXISTS outbox (
 CREATE INDEX IF NOT EXISTS outbox_pending_order
     ON outbox (group_key, delivered_at, created_at, position, event_id);
 
-PRAGMA user_version = 1;
+CREATE TABLE IF NOT EXISTS deliveries (
+    event_id TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    delivered_at TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0 CHECK (attempts >= 0),
+    last_error TEXT,
+    PRIMARY KEY (event_id, destination),
+    FOREIGN KEY (event_id) REFERENCES outbox(event_id) ON DELETE CASCADE
+);
+"""
+_SCHEMA_VERSION = 4
+# Columns added after the first schema; older state files gain them in place
+# when they are opened.
+_ADDED_COLUMNS = (
+    ("outbox", "next_attempt_at", "TEXT"),
+    ("outbox", "dead_at", "TEXT"),
+    ("groups", "arrival_rate", "REAL CHECK (arrival_rate >= 0)"),
+    ("groups", "arrival_rate_at", "TEXT"),
+)
+# Connection-local staging for one scan, so observe() can classify and upsert
+# every scanned post with set-based statements instead of per-post round trips.
+_SCAN_SCHEMA = """
+CREATE TEMP TABLE IF NOT EXISTS scan_posts (
+    post_id TEXT PRIMARY KEY,
+    canonical_url TEXT NOT NULL,
+    ordinal INTEGER NOT NULL
+);
 """
 _MAX_FUTURE_SKEW = timedelta(minutes=5)
+# Rows per keyset page when streaming the outbox; about one digest chunk.
+PENDING_PAGE_SIZE = 64
+# How quickly a group's learned post arrival rate forgets older activity.
+ARRIVAL_RATE_HALF_LIFE = timedelta(days=2)
 
 
 def _utc_now() -> datetime:
@@ -96,26 +145,102 @@ def _is_same_calendar_day(
     )
 
 
+class _SeenPostIndex:
+    """Bounded LRU set of recently seen ``(group_key, post_id)`` pairs.
+
+    It only ever holds posts committed to the state file, so a hit is
+    authoritative and a miss falls back to SQLite. An exact set is used rather
+    than a Bloom filter because a false positive would silently drop a new post.
+    """
+
+    __slots__ = ("_entries", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._entries: OrderedDict[tuple[str, str], None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def known(self, group_key: str, post_ids: Iterable[str]) -> frozenset[str]:
+        """Return the indexed subset of ``post_ids`` and mark them recent."""
+
+        hits: list[str] = []
+        for post_id in post_ids:
+            key = (group_key, post_id)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                hits.append(post_id)
+        return frozenset(hits)
+
+    def add(self, group_key: str, post_ids: Iterable[str]) -> None:
+        """Record committed posts as most recent, evicting the oldest."""
+
+        for post_id in post_ids:
+            key = (group_key, post_id)
+            self._entries[key] = None
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def discard_group(self, group_key: str) -> None:
+        for key in [key for key in self._entries if key[0] == group_key]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 def _event_id(group_key: str, post_id: str) -> str:
     return str(uuid.uuid5(uuid.NAMESPACE_URL, f"fbn:{group_key}:{post_id}"))
 
 
 class SQLiteStateRepository:
-    """Persist group observations and retryable notification events in SQLite."""
+    """Persist group observations and retryable notification events in SQLite.
+
+    With ``seen_index_size``, the most recently seen posts are also kept in an
+    in-process LRU index, loaded when the file is opened. A scan made only of
+    indexed posts then skips the staging and insert statements, and
+    ``known_post_ids`` answers from memory. With a positive
+    ``seen_granularity``, ``observe`` first checks in a read transaction
+    whether a scan would only refresh timestamps written less than that long
+    ago, and then skips the write transaction.
+    """
 
     def __init__(
         self,
         path: str | os.PathLike[str] | None = None,
         *,
         clock: Callable[[], datetime] = _utc_now,
+        retry: DeliveryRetrySettings | None = None,
+        metrics: MetricsRegistry | None = None,
+        seen_index_size: int = 0,
+        seen_granularity: timedelta = timedelta(0),
     ) -> None:
+        if retry is not None and not isinstance(retry, DeliveryRetrySettings):
+            raise ValueError("retry must be DeliveryRetrySettings")
+        if (
+            isinstance(seen_index_size, bool)
+            or not isinstance(seen_index_size, int)
+            or seen_index_size < 0
+        ):
+            raise ValueError("seen_index_size must be a non-negative integer")
+        if (
+            not isinstance(seen_granularity, timedelta)
+            or seen_granularity.total_seconds() < 0
+        ):
+            raise ValueError("seen_granularity must be a non-negative timedelta")
         self.path = resolve_state_file(path)
         if not self.path.parent.exists():
             ensure_private_directory(self.path.parent)
         elif not self.path.parent.is_dir():
             raise ConfigurationError("state file parent path is not a directory")
         self._clock = clock
+        self._retry = DeliveryRetrySettings() if retry is None else retry
+        self._metrics = MetricsRegistry() if metrics is None else metrics
         self._connection: sqlite3.Connection | None = None
+        self._seen = _SeenPostIndex(seen_index_size) if seen_index_size else None
+        self._seen_granularity = seen_granularity
         try:
             if not self.path.exists():
                 flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
@@ -140,8 +265,14 @@ class SQLiteStateRepository:
             self._connection.row_factory = sqlite3.Row
             self._connection.execute("PRAGMA foreign_keys = ON")
             self._connection.execute("PRAGMA busy_timeout = 30000")
+            # Only takes effect while a new database has no tables. Older state
+            # files switch over on their first `fbn state compact --full`.
+            self._connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
             self._connection.execute("PRAGMA journal_mode = WAL")
             self._connection.executescript(_SCHEMA)
+            self._migrate(self._connection)
+            self._connection.executescript(_SCAN_SCHEMA)
+            self._load_seen_index(self._connection)
             self._restrict_database_files()
         except ConfigurationError:
             raise
@@ -153,6 +284,47 @@ class SQLiteStateRepository:
                 "The state database could not be opened or initialized."
             ) from exc
 
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection) -> None:
+        """Add columns that state files created by older versions lack."""
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            columns = {
+                (table, row["name"])
+                for table in {table for table, _, _ in _ADDED_COLUMNS}
+                for row in connection.execute(f"PRAGMA table_info({table})")
+            }
+            for table, name, definition in _ADDED_COLUMNS:
+                if (table, name) not in columns:
+                    connection.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {name} {definition}"
+                    )
+            connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+
+    def _load_seen_index(self, connection: sqlite3.Connection) -> None:
+        """Fill the seen-post index with the most recently seen posts."""
+
+        if self._seen is None:
+            return
+        rows = connection.execute(
+            """
+            SELECT group_key, post_id
+            FROM posts
+            ORDER BY last_seen_at DESC, first_seen_at DESC, post_id
+            LIMIT ?
+            """,
+            (self._seen.capacity,),
+        ).fetchall()
+        self._seen.clear()
+        # Oldest first, so the most recently seen posts are evicted last.
+        for row in reversed(rows):
+            self._seen.add(row["group_key"], (row["post_id"],))
+
     def _restrict_database_files(self) -> None:
         """Keep the database and any SQLite sidecars owner-readable only."""
 
@@ -190,14 +362,30 @@ class SQLiteStateRepository:
     def run_lock(self) -> Iterator[None]:
         """Exclusively own one observation and delivery cycle for this state file."""
 
-        lock_path = self.path.with_name(f".{self.path.name}.run.lock")
+        with self._exclusive_lock(
+            "run",
+            "Another fbn monitor is already using this state database.",
+        ):
+            yield
+
+    @contextmanager
+    def delivery_lock(self) -> Iterator[None]:
+        """Exclusively own outbox draining by a standalone delivery worker."""
+
+        with self._exclusive_lock(
+            "delivery",
+            "Another fbn delivery worker is already draining this state database.",
+        ):
+            yield
+
+    @contextmanager
+    def _exclusive_lock(self, purpose: str, busy_message: str) -> Iterator[None]:
+        lock_path = self.path.with_name(f".{self.path.name}.{purpose}.lock")
         lock = FileLock(str(lock_path))
         try:
             lock.acquire(timeout=0)
         except FileLockTimeout as exc:
-            raise MonitorInUseError(
-                "Another fbn monitor is already using this state database."
-            ) from exc
+            raise MonitorInUseError(busy_message) from exc
 
         try:
             if os.name != "nt" and lock_path.exists():
@@ -214,8 +402,15 @@ class SQLiteStateRepository:
         notify_initial: bool = False,
         observed_at: datetime | None = None,
         same_day_only: bool = False,
+        load_pending: bool = True,
     ) -> ObservationBatch:
-        """Atomically store unseen posts and, when appropriate, outbox rows."""
+        """Atomically store unseen posts and, when appropriate, outbox rows.
+
+        With ``load_pending=False`` the batch carries no pending records, for
+        callers that stream them afterwards with ``iter_pending``. A scan that
+        finds nothing new within ``seen_granularity`` of the group's last
+        recorded scan writes nothing.
+        """
 
         if not isinstance(group, GroupRef):
             raise ValueError("group must be a GroupRef")
@@ -223,13 +418,37 @@ class SQLiteStateRepository:
             raise ValueError("notify_initial must be a boolean")
         if not isinstance(same_day_only, bool):
             raise ValueError("same_day_only must be a boolean")
+        if not isinstance(load_pending, bool):
+            raise ValueError("load_pending must be a boolean")
         scan_time = _as_utc(
             self._clock() if observed_at is None else observed_at,
             "observed_at",
         )
         scan_timestamp = _timestamp(scan_time, "observed_at")
         unique_posts = self._unique_posts(group, posts)
+        post_ids = [post.post_id for post in unique_posts]
         connection = self._require_connection()
+        all_indexed = (
+            self._seen is not None
+            and bool(unique_posts)
+            and len(self._seen.known(group.key, post_ids)) == len(post_ids)
+        )
+
+        started = time.perf_counter()
+        unchanged = self._unchanged_observation(
+            connection,
+            group.key,
+            unique_posts,
+            scan_time,
+            load_pending=load_pending,
+        )
+        if unchanged is not None:
+            if self._seen is not None:
+                self._seen.add(group.key, post_ids)
+            self._metrics.observe(
+                "fbn_state_observe_seconds", time.perf_counter() - started
+            )
+            return unchanged
 
         connection.execute("BEGIN IMMEDIATE")
         try:
@@ -241,44 +460,24 @@ class SQLiteStateRepository:
             initialized = bool(group_row["initialized_at"])
             first_non_empty_scan = not initialized and bool(unique_posts)
             baseline = first_non_empty_scan and not notify_initial
-            inserted_posts: list[Post] = []
-            queued = 0
-
-            for post in unique_posts:
-                cursor = connection.execute(
-                    """
-                    INSERT OR IGNORE INTO posts (
-                        group_key,
-                        post_id,
-                        canonical_url,
-                        first_seen_at,
-                        last_seen_at
-                    ) VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        group.key,
-                        post.post_id,
-                        post.url,
-                        scan_timestamp,
-                        scan_timestamp,
-                    ),
+            if all_indexed and self._refresh_known_posts(
+                connection,
+                group.key,
+                unique_posts,
+                scan_timestamp,
+            ):
+                inserted_posts: tuple[Post, ...] = ()
+            else:
+                if all_indexed and self._seen is not None:
+                    # Another process pruned an indexed post; trust SQLite.
+                    self._seen.discard_group(group.key)
+                inserted_posts = self._upsert_scan_posts(
+                    connection,
+                    group.key,
+                    unique_posts,
+                    scan_timestamp,
                 )
-                if cursor.rowcount:
-                    inserted_posts.append(post)
-                else:
-                    connection.execute(
-                        """
-                        UPDATE posts
-                        SET canonical_url = ?, last_seen_at = ?
-                        WHERE group_key = ? AND post_id = ?
-                        """,
-                        (
-                            post.url,
-                            scan_timestamp,
-                            group.key,
-                            post.post_id,
-                        ),
-                    )
+            queued = 0
 
             if first_non_empty_scan:
                 connection.execute(
@@ -291,32 +490,34 @@ class SQLiteStateRepository:
                 )
 
             if not baseline:
-                for post in inserted_posts:
-                    if same_day_only and not _is_same_calendar_day(post, scan_time):
-                        continue
-                    connection.execute(
-                        """
-                        INSERT INTO outbox (
-                            event_id,
-                            group_key,
-                            post_id,
-                            author,
-                            body,
-                            position,
-                            created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            _event_id(group.key, post.post_id),
-                            group.key,
-                            post.post_id,
-                            post.author,
-                            post.text,
-                            post.position,
-                            scan_timestamp,
-                        ),
+                outbox_rows = [
+                    (
+                        _event_id(group.key, post.post_id),
+                        group.key,
+                        post.post_id,
+                        post.author,
+                        post.text,
+                        post.position,
+                        scan_timestamp,
                     )
-                    queued += 1
+                    for post in inserted_posts
+                    if not same_day_only or _is_same_calendar_day(post, scan_time)
+                ]
+                connection.executemany(
+                    """
+                    INSERT INTO outbox (
+                        event_id,
+                        group_key,
+                        post_id,
+                        author,
+                        body,
+                        position,
+                        created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    outbox_rows,
+                )
+                queued = len(outbox_rows)
 
             connection.execute(
                 """
@@ -326,11 +527,20 @@ class SQLiteStateRepository:
                 """,
                 (scan_timestamp, group.key),
             )
-            pending = self._pending_rows(connection, group.key)
+            pending = (
+                self._pending_rows(connection, group.key, scan_timestamp)
+                if load_pending
+                else ()
+            )
             connection.commit()
         except BaseException:
             connection.rollback()
             raise
+        if self._seen is not None:
+            self._seen.add(group.key, post_ids)
+        self._metrics.observe(
+            "fbn_state_observe_seconds", time.perf_counter() - started
+        )
 
         return ObservationBatch(
             baseline=baseline,
@@ -339,23 +549,152 @@ class SQLiteStateRepository:
             pending=pending,
         )
 
-    def pending(self, group: GroupRef) -> tuple[PendingNotification, ...]:
-        """Return undelivered events in deterministic delivery order."""
+    def pending(
+        self,
+        group: GroupRef,
+        *,
+        due_at: datetime | None = None,
+    ) -> tuple[PendingNotification, ...]:
+        """Return undelivered events in deterministic delivery order.
+
+        Dead-lettered events are never returned. With ``due_at``, events still
+        waiting out a retry delay at that time are left out as well.
+        """
+
+        if not isinstance(group, GroupRef):
+            raise ValueError("group must be a GroupRef")
+        return self._pending_rows(
+            self._require_connection(),
+            group.key,
+            None if due_at is None else _timestamp(due_at, "due_at"),
+        )
+
+    def iter_pending(
+        self,
+        group: GroupRef,
+        *,
+        due_at: datetime | None = None,
+        page_size: int = PENDING_PAGE_SIZE,
+    ) -> Iterator[PendingNotification]:
+        """Stream what ``pending`` returns, one keyset page at a time.
+
+        Each page is a separate short read that resumes after the last key of
+        the previous one along ``outbox_pending_order``, so events may be
+        marked delivered or failed while the stream is being consumed.
+        """
+
+        if not isinstance(group, GroupRef):
+            raise ValueError("group must be a GroupRef")
+        if isinstance(page_size, bool) or not isinstance(page_size, int):
+            raise ValueError("page_size must be an integer")
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        due_timestamp = None if due_at is None else _timestamp(due_at, "due_at")
+        after: tuple[str, int, str] | None = None
+        while True:
+            page = self._pending_rows(
+                self._require_connection(),
+                group.key,
+                due_timestamp,
+                after=after,
+                limit=page_size,
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            last = page[-1]
+            after = (
+                _timestamp(last.created_at, "created_at"),
+                last.position,
+                last.event_id,
+            )
+
+    def pending_count(self, group: GroupRef) -> int:
+        """Return how many events ``pending`` would return, without loading them."""
+
+        if not isinstance(group, GroupRef):
+            raise ValueError("group must be a GroupRef")
+        row = (
+            self._require_connection()
+            .execute(
+                """
+                SELECT count(*) AS pending
+                FROM outbox
+                WHERE group_key = ? AND delivered_at IS NULL AND dead_at IS NULL
+                """,
+                (group.key,),
+            )
+            .fetchone()
+        )
+        return row["pending"]
+
+    def known_post_ids(
+        self,
+        group: GroupRef,
+        post_ids: Sequence[str],
+    ) -> frozenset[str]:
+        """Return which of ``post_ids`` are already recorded for ``group``."""
 
         if not isinstance(group, GroupRef):
             raise ValueError("group must be a GroupRef")
-        return self._pending_rows(self._require_connection(), group.key)
+        candidates = list(dict.fromkeys(post_ids))
+        indexed = (
+            frozenset()
+            if self._seen is None
+            else self._seen.known(group.key, candidates)
+        )
+        candidates = [post_id for post_id in candidates if post_id not in indexed]
+        if not candidates:
+            return indexed
+        placeholders = ", ".join("?" for _ in candidates)
+        rows = (
+            self._require_connection()
+            .execute(
+                f"""
+                SELECT post_id
+                FROM posts
+                WHERE group_key = ? AND post_id IN ({placeholders})
+                """,
+                (group.key, *candidates),
+            )
+            .fetchall()
+        )
+        return indexed | frozenset(row["post_id"] for row in rows)
+
+    def pending_group_keys(self) -> tuple[str, ...]:
+        """Return every group key with undelivered events, in key order."""
+
+        rows = (
+            self._require_connection()
+            .execute(
+                """
+                SELECT DISTINCT group_key
+                FROM outbox
+                WHERE delivered_at IS NULL AND dead_at IS NULL
+                ORDER BY group_key
+                """
+            )
+            .fetchall()
+        )
+        return tuple(row["group_key"] for row in rows)
 
     def mark_delivered(
         self,
         event_ids: Sequence[str],
         delivered_at: datetime | None = None,
+        *,
+        destination: str | None = None,
     ) -> None:
-        """Mark events delivered and erase their retained author and body."""
+        """Mark events delivered and erase their retained author and body.
+
+        With ``destination``, only that destination's delivery is recorded and
+        the events stay pending, with their payload, for the others.
+        """
 
         identifiers = self._event_ids(event_ids)
         if not identifiers:
             return
+        destination_name = self._destination(destination)
         delivered_timestamp = _timestamp(
             self._clock() if delivered_at is None else delivered_at,
             "delivered_at",
@@ -363,17 +702,35 @@ class SQLiteStateRepository:
         connection = self._require_connection()
         connection.execute("BEGIN IMMEDIATE")
         try:
-            connection.executemany(
-                """
-                UPDATE outbox
-                SET delivered_at = ?,
-                    author = NULL,
-                    body = NULL,
-                    last_error = NULL
-                WHERE event_id = ? AND delivered_at IS NULL
-                """,
-                ((delivered_timestamp, event_id) for event_id in identifiers),
-            )
+            if destination_name is not None:
+                connection.executemany(
+                    """
+                    INSERT INTO deliveries (event_id, destination, delivered_at)
+                    SELECT event_id, ?, ?
+                    FROM outbox
+                    WHERE event_id = ? AND delivered_at IS NULL
+                    ON CONFLICT (event_id, destination) DO UPDATE SET
+                        delivered_at = excluded.delivered_at,
+                        last_error = NULL
+                    WHERE deliveries.delivered_at IS NULL
+                    """,
+                    (
+                        (destination_name, delivered_timestamp, event_id)
+                        for event_id in identifiers
+                    ),
+                )
+            else:
+                connection.executemany(
+                    """
+                    UPDATE outbox
+                    SET delivered_at = ?,
+                        author = NULL,
+                        body = NULL,
+                        last_error = NULL
+                    WHERE event_id = ? AND delivered_at IS NULL
+                    """,
+                    ((delivered_timestamp, event_id) for event_id in identifiers),
+                )
             connection.commit()
         except BaseException:
             connection.rollback()
@@ -383,30 +740,89 @@ class SQLiteStateRepository:
         self,
         event_ids: Sequence[str],
         error: str,
-    ) -> None:
-        """Record a failed delivery while retaining its pending payload."""
+        *,
+        destination: str | None = None,
+    ) -> int:
+        """Record a failed delivery while retaining its pending payload.
+
+        Each event is held back for its capped exponential retry delay, and an
+        event that reaches the retry limit is dead-lettered. Returns how many
+        events were dead-lettered. With ``destination``, the failure is only
+        counted against that destination and nothing is held back.
+        """
 
         identifiers = self._event_ids(event_ids)
         if not identifiers:
-            return
+            return 0
         if not isinstance(error, str):
             raise ValueError("error must be a string")
+        destination_name = self._destination(destination)
         safe_error = error[:1000]
+        failed_at = _as_utc(self._clock(), "clock")
+        dead_lettered = 0
         connection = self._require_connection()
         connection.execute("BEGIN IMMEDIATE")
         try:
-            connection.executemany(
-                """
-                UPDATE outbox
-                SET attempts = attempts + 1, last_error = ?
-                WHERE event_id = ? AND delivered_at IS NULL
-                """,
-                ((safe_error, event_id) for event_id in identifiers),
-            )
+            if destination_name is not None:
+                connection.executemany(
+                    """
+                    INSERT INTO deliveries (event_id, destination, attempts, last_error)
+                    SELECT event_id, ?, 1, ?
+                    FROM outbox
+                    WHERE event_id = ? AND delivered_at IS NULL
+                    ON CONFLICT (event_id, destination) DO UPDATE SET
+                        attempts = deliveries.attempts + 1,
+                        last_error = excluded.last_error
+                    WHERE deliveries.delivered_at IS NULL
+                    """,
+                    (
+                        (destination_name, safe_error, event_id)
+                        for event_id in identifiers
+                    ),
+                )
+            else:
+                updates = []
+                for event_id in identifiers:
+                    row = connection.execute(
+                        """
+                        SELECT attempts
+                        FROM outbox
+                        WHERE event_id = ?
+                          AND delivered_at IS NULL
+                          AND dead_at IS NULL
+                        """,
+                        (event_id,),
+                    ).fetchone()
+                    if row is None:
+                        continue
+                    attempts = row["attempts"] + 1
+                    if attempts >= self._retry.max_attempts:
+                        dead_lettered += 1
+                        retry_at = None
+                        dead_at = _timestamp(failed_at, "clock")
+                    else:
+                        retry_at = _timestamp(
+                            failed_at + self._retry.delay(attempts),
+                            "clock",
+                        )
+                        dead_at = None
+                    updates.append((safe_error, retry_at, dead_at, event_id))
+                connection.executemany(
+                    """
+                    UPDATE outbox
+                    SET attempts = attempts + 1,
+                        last_error = ?,
+                        next_attempt_at = ?,
+                        dead_at = ?
+                    WHERE event_id = ?
+                    """,
+                    updates,
+                )
             connection.commit()
         except BaseException:
             connection.rollback()
             raise
+        return dead_lettered
 
     def next_eligible(self, group: GroupRef) -> datetime | None:
         """Return the persisted earliest next-check time for a group."""
@@ -502,6 +918,182 @@ class SQLiteStateRepository:
         )
         return 0 if row is None else int(row["consecutive_failures"])
 
+    def update_arrival_rate(
+        self,
+        group: GroupRef,
+        *,
+        at: datetime | None = None,
+    ) -> float | None:
+        """Fold posts first seen since the last update into the learned rate.
+
+        The rate is a time-weighted moving average of new posts per hour with
+        a half-life of ``ARRIVAL_RATE_HALF_LIFE``, so irregular check intervals
+        are weighted by the time they cover. The first call only starts the
+        measurement, which keeps a baseline scan's backlog out of the rate.
+        Returns the learned rate, or ``None`` until one exists.
+        """
+
+        if not isinstance(group, GroupRef):
+            raise ValueError("group must be a GroupRef")
+        now = _as_utc(self._clock() if at is None else at, "at")
+        timestamp = _timestamp(now, "at")
+        connection = self._require_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._ensure_group(connection, group.key)
+            row = connection.execute(
+                """
+                SELECT arrival_rate, arrival_rate_at
+                FROM groups
+                WHERE group_key = ?
+                """,
+                (group.key,),
+            ).fetchone()
+            rate = row["arrival_rate"]
+            if row["arrival_rate_at"] is not None:
+                since = _parse_timestamp(row["arrival_rate_at"])
+                hours = (now - since).total_seconds() / 3600
+                if hours <= 0:
+                    connection.rollback()
+                    return rate
+                arrivals = connection.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM posts
+                    WHERE group_key = ?
+                      AND first_seen_at > ?
+                      AND first_seen_at <= ?
+                    """,
+                    (group.key, row["arrival_rate_at"], timestamp),
+                ).fetchone()[0]
+                sample = arrivals / hours
+                half_lives = hours * 3600 / ARRIVAL_RATE_HALF_LIFE.total_seconds()
+                weight = 1 - 0.5**half_lives
+                rate = sample if rate is None else rate + weight * (sample - rate)
+            connection.execute(
+                """
+                UPDATE groups
+                SET arrival_rate = ?, arrival_rate_at = ?
+                WHERE group_key = ?
+                """,
+                (rate, timestamp, group.key),
+            )
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        return rate
+
+    def compact(
+        self,
+        retention: RetentionSettings,
+        *,
+        now: datetime | None = None,
+        full: bool = False,
+    ) -> CompactionSummary:
+        """Prune expired history, then return free pages and truncate the WAL.
+
+        Delivered and dead-lettered outbox rows older than ``outbox_days`` are
+        removed first.
+        A post is then pruned when it was last seen more than ``post_days``
+        ago or falls outside its group's ``max_posts`` most recently seen
+        posts. Posts that still have an outbox row, and posts seen in their
+        group's latest scan, are always kept, so the feed window that a next
+        scan can return stays deduplicated.
+        """
+
+        if not isinstance(retention, RetentionSettings):
+            raise ValueError("retention must be RetentionSettings")
+        if not isinstance(full, bool):
+            raise ValueError("full must be a boolean")
+        compact_time = _as_utc(self._clock() if now is None else now, "now")
+        post_cutoff = _timestamp(
+            compact_time - timedelta(days=retention.post_days),
+            "now",
+        )
+        outbox_cutoff = _timestamp(
+            compact_time - timedelta(days=retention.outbox_days),
+            "now",
+        )
+        connection = self._require_connection()
+        size_before = self._database_bytes(connection)
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            deleted_events = connection.execute(
+                """
+                DELETE FROM outbox
+                WHERE (delivered_at IS NOT NULL AND delivered_at < ?)
+                   OR (dead_at IS NOT NULL AND dead_at < ?)
+                """,
+                (outbox_cutoff, outbox_cutoff),
+            ).rowcount
+            deleted_posts = connection.execute(
+                """
+                DELETE FROM posts
+                WHERE rowid IN (
+                    SELECT ranked.post_rowid
+                    FROM (
+                        SELECT
+                            rowid AS post_rowid,
+                            group_key,
+                            post_id,
+                            last_seen_at,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY group_key
+                                ORDER BY last_seen_at DESC, first_seen_at DESC, post_id
+                            ) AS recency,
+                            MAX(last_seen_at) OVER (
+                                PARTITION BY group_key
+                            ) AS latest_scan_at
+                        FROM posts
+                    ) AS ranked
+                    WHERE ranked.last_seen_at < ranked.latest_scan_at
+                      AND (
+                          ranked.last_seen_at < :post_cutoff
+                          OR ranked.recency > :max_posts
+                      )
+                      AND NOT EXISTS (
+                          SELECT 1
+                          FROM outbox
+                          WHERE outbox.group_key = ranked.group_key
+                            AND outbox.post_id = ranked.post_id
+                      )
+                )
+                """,
+                {
+                    "post_cutoff": post_cutoff,
+                    # NULL compares as unknown, so no count limit applies.
+                    "max_posts": retention.max_posts,
+                },
+            ).rowcount
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        if deleted_posts:
+            self._load_seen_index(connection)
+
+        if full:
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            connection.execute("VACUUM")
+        else:
+            # Each result row frees one page; step through all of them.
+            connection.execute("PRAGMA incremental_vacuum").fetchall()
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._restrict_database_files()
+        return CompactionSummary(
+            deleted_posts=deleted_posts,
+            deleted_events=deleted_events,
+            reclaimed_bytes=max(0, size_before - self._database_bytes(connection)),
+        )
+
+    @staticmethod
+    def _database_bytes(connection: sqlite3.Connection) -> int:
+        page_count = connection.execute("PRAGMA page_count").fetchone()[0]
+        page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+        return int(page_count) * int(page_size)
+
     def _require_connection(self) -> sqlite3.Connection:
         connection = self._connection
         if connection is None:
@@ -515,6 +1107,177 @@ class SQLiteStateRepository:
             (group_key,),
         )
 
+    def _unchanged_observation(
+        self,
+        connection: sqlite3.Connection,
+        group_key: str,
+        posts: Sequence[Post],
+        scan_time: datetime,
+        *,
+        load_pending: bool,
+    ) -> ObservationBatch | None:
+        """Return the batch for a scan that needs no write, or None.
+
+        The scan needs no write when the group has no failure streak, its last
+        success is recent, and every scanned post was recorded, with the same
+        URL, by the group's latest written scan less than ``seen_granularity``
+        ago. Requiring that latest scan keeps compaction's guarantee that the
+        posts of a group's latest scan are never pruned.
+        """
+
+        if self._seen_granularity <= timedelta(0):
+            return None
+        cutoff = _timestamp(scan_time - self._seen_granularity, "observed_at")
+        connection.execute("BEGIN")
+        try:
+            group_row = connection.execute(
+                """
+                SELECT last_success_at, consecutive_failures
+                FROM groups
+                WHERE group_key = ?
+                """,
+                (group_key,),
+            ).fetchone()
+            unchanged = (
+                group_row is not None
+                and group_row["consecutive_failures"] == 0
+                and group_row["last_success_at"] is not None
+                and group_row["last_success_at"] >= cutoff
+            )
+            if unchanged and posts:
+                # Staging only writes the connection's temp database, so the
+                # state file stays unlocked for writers.
+                connection.executemany(
+                    """
+                    INSERT INTO temp.scan_posts (post_id, canonical_url, ordinal)
+                    VALUES (?, ?, ?)
+                    """,
+                    (
+                        (post.post_id, post.url, ordinal)
+                        for ordinal, post in enumerate(posts)
+                    ),
+                )
+                row = connection.execute(
+                    """
+                    SELECT
+                        COUNT(posts.post_id) AS known,
+                        COUNT(
+                            CASE
+                                WHEN posts.canonical_url = scan_posts.canonical_url
+                                THEN 1
+                            END
+                        ) AS same_url,
+                        MIN(posts.last_seen_at) AS oldest_seen,
+                        (
+                            SELECT MAX(last_seen_at)
+                            FROM posts
+                            WHERE group_key = ?
+                        ) AS latest_seen
+                    FROM temp.scan_posts AS scan_posts
+                    LEFT JOIN posts
+                      ON posts.group_key = ?
+                     AND posts.post_id = scan_posts.post_id
+                    """,
+                    (group_key, group_key),
+                ).fetchone()
+                connection.execute("DELETE FROM temp.scan_posts")
+                unchanged = (
+                    row["known"] == row["same_url"] == len(posts)
+                    and row["oldest_seen"] == row["latest_seen"]
+                    and row["oldest_seen"] >= cutoff
+                )
+            pending = (
+                self._pending_rows(
+                    connection,
+                    group_key,
+                    _timestamp(scan_time, "observed_at"),
+                )
+                if unchanged and load_pending
+                else ()
+            )
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        if not unchanged:
+            return None
+        return ObservationBatch(baseline=False, inserted=0, queued=0, pending=pending)
+
+    @staticmethod
+    def _refresh_known_posts(
+        connection: sqlite3.Connection,
+        group_key: str,
+        posts: Sequence[Post],
+        scan_timestamp: str,
+    ) -> bool:
+        """Update already-recorded posts in place; False if any row is missing."""
+
+        updated = connection.executemany(
+            """
+            UPDATE posts
+            SET canonical_url = ?, last_seen_at = ?
+            WHERE group_key = ? AND post_id = ?
+            """,
+            ((post.url, scan_timestamp, group_key, post.post_id) for post in posts),
+        ).rowcount
+        return updated == len(posts)
+
+    @staticmethod
+    def _upsert_scan_posts(
+        connection: sqlite3.Connection,
+        group_key: str,
+        posts: Sequence[Post],
+        scan_timestamp: str,
+    ) -> tuple[Post, ...]:
+        """Stage one scan, upsert it, and return the previously unseen posts."""
+
+        if not posts:
+            return ()
+        connection.execute("DELETE FROM temp.scan_posts")
+        connection.executemany(
+            """
+            INSERT INTO temp.scan_posts (post_id, canonical_url, ordinal)
+            VALUES (?, ?, ?)
+            """,
+            ((post.post_id, post.url, ordinal) for ordinal, post in enumerate(posts)),
+        )
+        new_ordinals = {
+            row["ordinal"]
+            for row in connection.execute(
+                """
+                SELECT scan_posts.ordinal
+                FROM temp.scan_posts AS scan_posts
+                LEFT JOIN posts
+                  ON posts.group_key = ?
+                 AND posts.post_id = scan_posts.post_id
+                WHERE posts.post_id IS NULL
+                """,
+                (group_key,),
+            )
+        }
+        connection.execute(
+            """
+            INSERT INTO posts (
+                group_key,
+                post_id,
+                canonical_url,
+                first_seen_at,
+                last_seen_at
+            )
+            SELECT ?, post_id, canonical_url, ?, ?
+            FROM temp.scan_posts
+            WHERE true
+            ON CONFLICT (group_key, post_id) DO UPDATE SET
+                canonical_url = excluded.canonical_url,
+                last_seen_at = excluded.last_seen_at
+            """,
+            (group_key, scan_timestamp, scan_timestamp),
+        )
+        connection.execute("DELETE FROM temp.scan_posts")
+        return tuple(
+            post for ordinal, post in enumerate(posts) if ordinal in new_ordinals
+        )
+
     @staticmethod
     def _unique_posts(group: GroupRef, posts: Sequence[Post]) -> tuple[Post, ...]:
         unique: list[Post] = []
@@ -543,13 +1306,32 @@ class SQLiteStateRepository:
                 identifiers.append(event_id)
         return tuple(identifiers)
 
+    @staticmethod
+    def _destination(destination: str | None) -> str | None:
+        if destination is None:
+            return None
+        if not isinstance(destination, str) or not DESTINATION_PATTERN.fullmatch(
+            destination
+        ):
+            raise ValueError("destination must be a destination name")
+        return destination
+
     @staticmethod
     def _pending_rows(
         connection: sqlite3.Connection,
         group_key: str,
+        due_at: str | None = None,
+        *,
+        after: tuple[str, int, str] | None = None,
+        limit: int = -1,
     ) -> tuple[PendingNotification, ...]:
+        keyset = (
+            ""
+            if after is None
+            else "AND (outbox.created_at, outbox.position, outbox.event_id) > (?, ?, ?)"
+        )
         rows = connection.execute(
-            """
+            f"""
             SELECT
                 outbox.event_id,
                 outbox.group_key,
@@ -559,15 +1341,30 @@ class SQLiteStateRepository:
                 outbox.body,
                 outbox.position,
                 outbox.created_at,
-                outbox.attempts
+                outbox.attempts,
+                (
+                    SELECT group_concat(deliveries.destination, ',')
+                    FROM deliveries
+                    WHERE deliveries.event_id = outbox.event_id
+                      AND deliveries.delivered_at IS NOT NULL
+                ) AS delivered_to
             FROM outbox
             JOIN posts
               ON posts.group_key = outbox.group_key
              AND posts.post_id = outbox.post_id
-            WHERE outbox.group_key = ? AND outbox.delivered_at IS NULL
+            WHERE outbox.group_key = ?
+              AND outbox.delivered_at IS NULL
+              AND outbox.dead_at IS NULL
+              AND (
+                  ? IS NULL
+                  OR outbox.next_attempt_at IS NULL
+                  OR outbox.next_attempt_at <= ?
+              )
+              {keyset}
             ORDER BY outbox.created_at, outbox.position, outbox.event_id
+            LIMIT ?
             """,
-            (group_key,),
+            (group_key, due_at, due_at, *(after or ()), limit),
         ).fetchall()
         return tuple(
             PendingNotification(
@@ -580,6 +1377,9 @@ class SQLiteStateRepository:
                 position=row["position"],
                 created_at=_parse_timestamp(row["created_at"]),
                 attempts=row["attempts"],
+                delivered_to=frozenset(
+                    row["delivered_to"].split(",") if row["delivered_to"] else ()
+                ),
             )
             for row in rows
         )
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Iterator, Sequence
+import os
+import subprocess
+import sys
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 import fbn.browser as browser_module
+from fbn.bench import synthetic_payloads
 from fbn.browser import PageSignals, PageState, PlaywrightPostSource
-from fbn.config import BrowserSettings
+from fbn.config import BrowserSettings, SessionSettings
 from fbn.exceptions import (
     AuthenticationRequiredError,
     BrowserUnavailableError,
     ConfigurationError,
+    ProfileInUseError,
     TransientNavigationError,
 )
 from fbn.extractor import parse_group_ref
-from fbn.models import ScanPolicy
+from fbn.models import ScanPolicy, ScanResult
 
 
 class FakeLocator:
@@ -38,6 +45,14 @@ class FakePage:
         self.error = error
         self.closed = False
         self.url = "https://www.facebook.com/groups/example/"
+        self.routes: list[tuple[str, Callable[..., object]]] = []
+        self.handlers: dict[str, list[Callable[..., object]]] = {}
+
+    def route(self, pattern: str, handler: Callable[..., object]) -> None:
+        self.routes.append((pattern, handler))
+
+    def on(self, event: str, handler: Callable[..., object]) -> None:
+        self.handlers.setdefault(event, []).append(handler)
 
     def set_default_timeout(self, timeout: float) -> None:
         del timeout
@@ -80,6 +95,7 @@ class FakeContext:
         self.cookie_reads = 0
         self.cookie_error_reads = cookie_error_reads or set()
         self.closed = False
+        self.handlers: dict[str, list[Callable[..., object]]] = {}
 
     def cookies(self) -> list[dict[str, object]]:
         self.cookie_reads += 1
@@ -101,6 +117,13 @@ class FakeContext:
             raise self.new_page_error
         return self.page
 
+    def on(self, event: str, handler: Callable[..., object]) -> None:
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event: str) -> None:
+        for handler in self.handlers.get(event, ()):
+            handler(self)
+
     def close(self) -> None:
         self.closed = True
 
@@ -171,6 +194,7 @@ def test_bootstrap_replaces_profile_cookies_and_validates_headlessly(
     assert context.page.closed is True
     assert context.requested_headless == [True, True]
     assert context.requested_lock == [False, False]
+    assert context.page.routes == []
 
 
 def test_bootstrap_holds_one_profile_lock_across_import_and_validation(
@@ -361,6 +385,7 @@ def test_fetch_maps_generic_playwright_navigation_error_to_transient(
     assert context.requested_headless == [True]
     assert context.requested_lock == [True]
     assert context.requested_timezone == ["UTC"]
+    assert [pattern for pattern, _ in context.page.routes] == ["**/*"]
 
 
 @pytest.mark.parametrize("operation", ["bootstrap", "fetch", "login"])
@@ -536,3 +561,571 @@ def test_failed_first_browser_launch_does_not_bind_empty_profile(
         pass
 
     assert (profile / ".fbn-browser").read_text(encoding="utf-8") == "chrome\n"
+
+
+class CountingPersistentChromium:
+    def __init__(self) -> None:
+        self.contexts: list[FakeContext] = []
+        self.timezones: list[object] = []
+
+    def launch_persistent_context(
+        self,
+        profile_dir: str,
+        **kwargs: object,
+    ) -> FakeContext:
+        del profile_dir
+        self.timezones.append(kwargs.get("timezone_id"))
+        context = FakeContext(())
+        self.contexts.append(context)
+        return context
+
+
+def session_source(
+    tmp_path: Path,
+    chromium: CountingPersistentChromium,
+    **limits: int | None,
+) -> PlaywrightPostSource:
+    return PlaywrightPostSource(
+        BrowserSettings(profile_dir=tmp_path / "profile"),
+        playwright_factory=lambda: NormalManager(chromium),
+        session=SessionSettings(**limits),  # type: ignore[arg-type]
+    )
+
+
+def test_reused_session_launches_once_and_recycles_after_check_limit(
+    tmp_path: Path,
+) -> None:
+    chromium = CountingPersistentChromium()
+    used: list[object] = []
+
+    with session_source(tmp_path, chromium, max_checks=2) as source:
+        for _ in range(3):
+            with source._scan_context("UTC") as context:
+                used.append(context)
+
+    assert len(chromium.contexts) == 2
+    assert used == [chromium.contexts[0], chromium.contexts[0], chromium.contexts[1]]
+    assert all(context.closed for context in chromium.contexts)
+
+
+def test_reused_session_holds_profile_lock_until_closed(tmp_path: Path) -> None:
+    chromium = CountingPersistentChromium()
+    other = PlaywrightPostSource(
+        BrowserSettings(profile_dir=tmp_path / "profile"),
+        playwright_factory=lambda: NormalManager(CountingPersistentChromium()),
+    )
+
+    with session_source(tmp_path, chromium) as source:
+        with source._scan_context("UTC"):
+            pass
+        with pytest.raises(ProfileInUseError), other._context(headless=True):
+            pass
+
+    with other._context(headless=True):
+        pass
+
+
+def test_reused_session_relaunches_after_browser_crash_or_timezone_change(
+    tmp_path: Path,
+) -> None:
+    chromium = CountingPersistentChromium()
+
+    with session_source(tmp_path, chromium) as source:
+        with source._scan_context("UTC") as first:
+            pass
+        first.emit("close")  # type: ignore[attr-defined]
+        with source._scan_context("UTC"):
+            pass
+        with source._scan_context("America/New_York"):
+            pass
+
+    assert len(chromium.contexts) == 3
+    assert chromium.timezones == ["UTC", "UTC", "America/New_York"]
+
+
+def test_reused_session_recycles_above_memory_ceiling(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    chromium = CountingPersistentChromium()
+    monkeypatch.setattr(
+        browser_module,
+        "_process_tree_rss_bytes",
+        lambda root_pid: 512 * 1024 * 1024,
+    )
+
+    with session_source(tmp_path, chromium, max_rss_bytes=256 * 1024 * 1024) as source:
+        for _ in range(2):
+            with source._scan_context("UTC"):
+                pass
+
+    assert len(chromium.contexts) == 2
+
+
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="requires Linux procfs")
+def test_process_tree_rss_includes_child_processes() -> None:
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        rss_bytes = browser_module._process_tree_rss_bytes(os.getpid())
+    finally:
+        child.kill()
+        child.wait()
+
+    assert rss_bytes is not None and rss_bytes > 0
+
+
+class PoolClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class PoolPage(FakePage):
+    def __init__(self, clock: PoolClock) -> None:
+        super().__init__()
+        self.clock = clock
+        self.timeout_ms: float | None = None
+        self.waits = 0
+
+    def set_default_timeout(self, timeout: float) -> None:
+        self.timeout_ms = timeout
+
+    def wait_for_timeout(self, timeout: float) -> None:
+        if self.closed:
+            raise PlaywrightError("Target page, context or browser has been closed")
+        self.waits += 1
+        self.clock.now += timeout / 1_000
+
+    def wait_for_function(self, expression: str, *, arg: object = None) -> object:
+        # A page that never settles blocks until the default timeout expires.
+        assert self.timeout_ms is not None
+        self.clock.now += self.timeout_ms / 1_000
+        raise PlaywrightTimeoutError("Timeout exceeded")
+
+
+class PoolContext(FakeContext):
+    def __init__(self, clock: PoolClock) -> None:
+        super().__init__(())
+        self.clock = clock
+        self.pages: list[PoolPage] = []
+
+    def new_page(self) -> PoolPage:
+        page = PoolPage(self.clock)
+        self.pages.append(page)
+        return page
+
+    def open_pages(self) -> int:
+        return sum(not page.closed for page in self.pages)
+
+
+def test_tab_pool_interleaves_groups_and_bounds_open_tabs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = PoolClock()
+    context = PoolContext(clock)
+    source = source_with_context(tmp_path, context, monkeypatch)
+    source._tabs = 2
+    events: list[tuple[str, int]] = []
+    peak_tabs = 0
+
+    def fake_steps(
+        page: PoolPage,
+        group: object,
+        policy: ScanPolicy,
+        *,
+        wait_until: str,
+    ) -> Iterator[float]:
+        nonlocal peak_tabs
+        assert wait_until == "commit"
+        key = group.key  # type: ignore[attr-defined]
+        for step in range(2):
+            peak_tabs = max(peak_tabs, context.open_pages())
+            events.append((key, step))
+            yield 1.0
+        return ScanResult((), "empty", 0, False)
+
+    monkeypatch.setattr(source, "_fetch_steps", fake_steps)
+    monkeypatch.setattr(browser_module, "time", clock)
+    groups = [parse_group_ref(key) for key in ("first", "second", "third")]
+
+    outcomes = source.fetch_many(groups, ScanPolicy())
+
+    assert all(isinstance(outcome, ScanResult) for outcome in outcomes)
+    assert events[:4] == [("first", 0), ("second", 0), ("first", 1), ("second", 1)]
+    assert events[4:] == [("third", 0), ("third", 1)]
+    assert peak_tabs == 2
+    assert context.open_pages() == 0
+    assert clock.now == pytest.approx(4.0)
+
+
+def test_tab_pool_times_out_one_slow_group_without_failing_others(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = PoolClock()
+    context = PoolContext(clock)
+    source = source_with_context(tmp_path, context, monkeypatch)
+    source._tabs = 2
+
+    def fake_steps(
+        page: PoolPage,
+        group: object,
+        policy: ScanPolicy,
+        *,
+        wait_until: str,
+    ) -> Iterator[float]:
+        if group.key == "slow":  # type: ignore[attr-defined]
+            while True:
+                yield 5.0
+        if group.key == "gone":  # type: ignore[attr-defined]
+            raise PlaywrightError("private-navigation-detail")
+        yield 1.0
+        return ScanResult((), "empty", 0, False)
+
+    monkeypatch.setattr(source, "_fetch_steps", fake_steps)
+    monkeypatch.setattr(browser_module, "time", clock)
+    groups = [parse_group_ref(key) for key in ("slow", "fast", "gone")]
+
+    slow, fast, gone = source.fetch_many(groups, ScanPolicy(tab_timeout_seconds=12))
+
+    assert isinstance(slow, TransientNavigationError)
+    assert "tab timeout" in str(slow)
+    assert isinstance(fast, ScanResult)
+    assert isinstance(gone, TransientNavigationError)
+    assert "private-navigation-detail" not in str(gone)
+    assert clock.now == pytest.approx(12.0)
+    assert context.open_pages() == 0
+
+
+def test_tab_pool_fails_only_the_tab_whose_page_closed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = PoolClock()
+    context = PoolContext(clock)
+    source = source_with_context(tmp_path, context, monkeypatch)
+    source._tabs = 2
+
+    def fake_steps(
+        page: PoolPage,
+        group: object,
+        policy: ScanPolicy,
+        *,
+        wait_until: str,
+    ) -> Iterator[float]:
+        if group.key == "crashed":  # type: ignore[attr-defined]
+            page.close()
+            yield 1.0
+            raise PlaywrightError("Target page, context or browser has been closed")
+        for _ in range(3):
+            yield 1.0
+        return ScanResult((), "empty", 0, False)
+
+    monkeypatch.setattr(source, "_fetch_steps", fake_steps)
+    monkeypatch.setattr(browser_module, "time", clock)
+    groups = [parse_group_ref(key) for key in ("crashed", "healthy")]
+
+    crashed, healthy = source.fetch_many(groups, ScanPolicy())
+
+    assert isinstance(crashed, TransientNavigationError)
+    assert isinstance(healthy, ScanResult)
+    assert context.open_pages() == 0
+    first_page, second_page = context.pages
+    assert first_page.waits == 0
+    assert second_page.waits > 0
+
+
+def test_tab_pool_caps_a_hung_page_so_other_tabs_finish(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = PoolClock()
+    context = PoolContext(clock)
+    source = source_with_context(tmp_path, context, monkeypatch)
+    source._tabs = 2
+
+    def fake_steps(
+        page: PoolPage,
+        group: object,
+        policy: ScanPolicy,
+        *,
+        wait_until: str,
+    ) -> Iterator[float]:
+        yield 1.0
+        if group.key == "hung":  # type: ignore[attr-defined]
+            yield from browser_module._settle_steps(
+                page,  # type: ignore[arg-type]
+                group,  # type: ignore[arg-type]
+                600,
+            )
+        for _ in range(3):
+            yield 1.0
+        return ScanResult((), "empty", 0, False)
+
+    monkeypatch.setattr(source, "_fetch_steps", fake_steps)
+    monkeypatch.setattr(browser_module, "time", clock)
+    groups = [parse_group_ref(key) for key in ("hung", "healthy", "queued")]
+    policy = ScanPolicy(navigation_timeout_seconds=5, tab_timeout_seconds=60)
+
+    hung, healthy, queued = source.fetch_many(groups, policy)
+
+    assert isinstance(hung, TransientNavigationError)
+    assert isinstance(healthy, ScanResult)
+    assert isinstance(queued, ScanResult)
+    assert context.pages[0].timeout_ms == 5_000
+    assert clock.now < 12
+    assert context.open_pages() == 0
+
+
+def test_tab_pool_caps_a_hung_call_at_the_time_the_tab_has_left(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = PoolClock()
+    context = PoolContext(clock)
+    source = source_with_context(tmp_path, context, monkeypatch)
+
+    def fake_steps(
+        page: PoolPage,
+        group: object,
+        policy: ScanPolicy,
+        *,
+        wait_until: str,
+    ) -> Iterator[float]:
+        yield 9.0
+        yield from browser_module._settle_steps(
+            page,  # type: ignore[arg-type]
+            group,  # type: ignore[arg-type]
+            600,
+        )
+        return ScanResult((), "empty", 0, False)
+
+    monkeypatch.setattr(source, "_fetch_steps", fake_steps)
+    monkeypatch.setattr(browser_module, "time", clock)
+    policy = ScanPolicy(navigation_timeout_seconds=60, tab_timeout_seconds=12)
+
+    (hung,) = source.fetch_many([parse_group_ref("hung")], policy)
+
+    assert isinstance(hung, TransientNavigationError)
+    assert "tab timeout" in str(hung)
+    remaining = 12 - 9 - browser_module.SETTLE_POLL_SECONDS
+    assert context.pages[0].timeout_ms == pytest.approx(remaining * 1_000)
+    assert clock.now == pytest.approx(12.0)
+
+
+class FakeRequest:
+    def __init__(self, resource_type: str, url: str) -> None:
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type: str, url: str) -> None:
+        self.request = FakeRequest(resource_type, url)
+        self.outcome: str | None = None
+
+    def continue_(self) -> None:
+        self.outcome = "continued"
+
+    def abort(self, error_code: str) -> None:
+        self.outcome = f"aborted:{error_code}"
+
+
+class FakeHeadersResponse:
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.headers = headers
+
+
+def test_scan_request_filter_blocks_heavy_and_third_party_requests() -> None:
+    page = FakePage()
+    requests = browser_module._RequestFilter(("facebook.com", "fbcdn.net"))
+    requests.install(page)  # type: ignore[arg-type]
+    ((_, route_handler),) = page.routes
+    cases = {
+        ("document", "https://www.facebook.com/groups/example/"): "continued",
+        ("script", "https://static.xx.fbcdn.net/rsrc.php/app.js"): "continued",
+        ("xhr", "https://www.facebook.com/api/graphql/"): "continued",
+        ("image", "https://scontent.xx.fbcdn.net/photo.jpg"): "aborted",
+        ("font", "https://static.xx.fbcdn.net/font.woff2"): "aborted",
+        ("media", "https://video.xx.fbcdn.net/clip.mp4"): "aborted",
+        ("ping", "https://www.facebook.com/ajax/bz"): "aborted",
+        ("script", "https://tracker.example.com/pixel.js"): "aborted",
+        ("script", "https://facebook.com.example.com/lookalike.js"): "aborted",
+    }
+
+    for (resource_type, url), expected in cases.items():
+        route = FakeRoute(resource_type, url)
+        route_handler(route)
+        assert route.outcome is not None
+        assert route.outcome.startswith(expected), (resource_type, url)
+    for handler in page.handlers["response"]:
+        handler(FakeHeadersResponse({"content-length": "2048"}))
+        handler(FakeHeadersResponse({}))
+
+    assert requests.allowed == 3
+    assert requests.blocked == 6
+    assert requests.allowed_bytes == 2048
+
+
+def test_scan_page_skips_request_filter_when_disabled() -> None:
+    context = FakeContext(())
+
+    page, requests = PlaywrightPostSource._new_scan_page(
+        context,  # type: ignore[arg-type]
+        ScanPolicy(block_resources=False),
+    )
+
+    assert requests is None
+    assert page.routes == []  # type: ignore[attr-defined]
+
+
+class FakeHandle:
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.disposed = False
+
+    def json_value(self) -> object:
+        return self.value
+
+    def dispose(self) -> None:
+        self.disposed = True
+
+
+class SettlePage:
+    def __init__(self, results: list[dict[str, object]]) -> None:
+        self.results = list(results)
+        self.polls = 0
+
+    def wait_for_function(self, expression: str, *, arg: object = None) -> FakeHandle:
+        assert browser_module.SETTLE_POLL_SCRIPT in expression
+        self.polls += 1
+        return FakeHandle([self.results.pop(0)])
+
+
+def test_settle_ends_as_soon_as_the_feed_observer_reports_new_items(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = PoolClock()
+    monkeypatch.setattr(browser_module, "time", clock)
+    page = SettlePage(
+        [
+            {"settled": False, "addedItems": 0},
+            {"settled": True, "addedItems": 2},
+        ]
+    )
+    steps = browser_module._settle_steps(
+        page,  # type: ignore[arg-type]
+        parse_group_ref("example"),
+        10.0,
+    )
+
+    delays = []
+    for delay in steps:
+        delays.append(delay)
+        clock.now += delay
+
+    assert delays == [browser_module.SETTLE_POLL_SECONDS] * 2
+    assert page.polls == 2
+
+
+def test_settle_is_bounded_by_settle_seconds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = PoolClock()
+    monkeypatch.setattr(browser_module, "time", clock)
+    page = SettlePage([{"settled": False, "addedItems": 0}] * 10)
+    steps = browser_module._settle_steps(
+        page,  # type: ignore[arg-type]
+        parse_group_ref("example"),
+        0.12,
+    )
+
+    delays = []
+    for delay in steps:
+        delays.append(delay)
+        clock.now += delay
+
+    assert sum(delays) == pytest.approx(0.12)
+    assert page.polls == 3
+    unbounded = browser_module._settle_steps(
+        page,  # type: ignore[arg-type]
+        parse_group_ref("example"),
+        0,
+    )
+    assert list(unbounded) == []
+
+
+def scan_with_known_posts(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    known: set[str],
+    policy: ScanPolicy,
+) -> tuple[ScanResult, list[list[str]]]:
+    group = parse_group_ref("test-group")
+    probes: list[list[str]] = []
+
+    def fake_snapshot_steps(page: object, **kwargs: object) -> Iterator[float]:
+        snapshot = browser_module.PageSnapshot(
+            PageSignals(url=group.url, has_feed=True),
+            payloads=tuple(synthetic_payloads(4)),
+        )
+        return (PageState.FEED, snapshot)
+        yield
+
+    def probe(probed_group: object, post_ids: Sequence[str]) -> set[str]:
+        assert probed_group == group
+        probes.append(list(post_ids))
+        return known & set(post_ids)
+
+    monkeypatch.setattr(browser_module, "_terminal_snapshot_steps", fake_snapshot_steps)
+    source = PlaywrightPostSource(
+        BrowserSettings(browser="chromium", profile_dir=tmp_path / "profile"),
+        known_posts=probe,
+    )
+    steps = source._scan_feed(
+        object(),  # type: ignore[arg-type]
+        group,
+        policy,
+        datetime(2026, 7, 28, 12, tzinfo=timezone.utc),
+    )
+    with pytest.raises(StopIteration) as stop:
+        next(steps)
+    return stop.value.value, probes
+
+
+def test_scan_stops_at_a_run_of_known_posts_without_scrolling(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    result, probes = scan_with_known_posts(
+        tmp_path,
+        monkeypatch,
+        {"2", "3"},
+        ScanPolicy(stop_after_known=2),
+    )
+
+    assert [post.post_id for post in result.posts] == ["1", "2", "3"]
+    assert result.scrolls == 0
+    assert result.bounded is True
+    assert probes == [["1", "2", "3", "4"]]
+
+
+def test_scan_ignores_known_posts_when_early_stop_is_disabled(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    result, probes = scan_with_known_posts(
+        tmp_path,
+        monkeypatch,
+        {"1", "2", "3", "4"},
+        ScanPolicy(sample_count=4),
+    )
+
+    assert [post.post_id for post in result.posts] == ["1", "2", "3", "4"]
+    assert probes == []
@@ -135,3 +135,125 @@ def test_terminal_page_preserves_auth_error_after_redirect(
             timeout_seconds=1,
             expected_group=parse_group_ref("expected-group"),
         )
+
+
+class OneScriptPage:
+    def __init__(self, url: str, result: object) -> None:
+        self.url = url
+        self.result = result
+        self.evaluations: list[tuple[str, object]] = []
+
+    def wait_for_function(self, expression: str, *, arg: object = None) -> object:
+        self.evaluations.append((expression, arg))
+        return OneScriptHandle([self.result])
+
+
+class OneScriptHandle:
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def json_value(self) -> object:
+        return self.value
+
+    def dispose(self) -> None:
+        pass
+
+
+def test_page_signals_are_read_in_one_evaluation() -> None:
+    page = OneScriptPage(
+        "https://www.facebook.com/groups/example/",
+        {
+            "hasFeed": True,
+            "itemCount": 3,
+            "postCount": 2,
+            "hasLoginForm": False,
+            "hasAccountAction": False,
+            "hasRateLimit": False,
+            "hasAccessDenied": False,
+            "hasExplicitEmpty": False,
+        },
+    )
+
+    result = browser_module.read_page_signals(page, status=200)  # type: ignore[arg-type]
+
+    assert result == signals(
+        status=200,
+        feed_item_count=3,
+        post_count=2,
+        has_feed=True,
+    )
+    ((script, markers),) = page.evaluations
+    assert browser_module.PAGE_SIGNALS_SCRIPT in script
+    assert markers == {
+        "rateLimitMarkers": browser_module.RATE_LIMIT_TEXT_MARKERS,
+        "accessDeniedMarkers": browser_module.ACCESS_DENIED_TEXT_MARKERS,
+        "emptyTexts": browser_module.EMPTY_FEED_TEXTS,
+        "feedOptions": False,
+        "includeAliases": False,
+    }
+
+
+def test_page_snapshot_extracts_aliases_and_payloads_in_the_same_evaluation() -> None:
+    payload = {"href": "/groups/example/posts/1/", "text": "Hello"}
+    page = OneScriptPage(
+        "https://www.facebook.com/groups/123456/",
+        {
+            "hasFeed": True,
+            "itemCount": 1,
+            "postCount": 1,
+            "payloads": [payload, "not a payload"],
+            "aliasHrefs": ["/groups/example/", 7],
+        },
+    )
+
+    snapshot = browser_module.read_page_snapshot(page, extract=True)  # type: ignore[arg-type]
+
+    assert classify_page(snapshot.signals) is PageState.FEED
+    assert snapshot.payloads == (payload,)
+    assert snapshot.alias_hrefs == ("/groups/example/",)
+    ((_, argument),) = page.evaluations
+    assert isinstance(argument, dict)
+    assert argument["feedOptions"] == {"includeContent": True, "incremental": True}
+    assert argument["includeAliases"] is True
+
+
+@pytest.mark.parametrize(
+    ("hrefs", "expected"),
+    [
+        (["/groups/example/"], {"123456", "example"}),
+        (["https://www.facebook.com/groups/example"], {"123456", "example"}),
+        (["/groups/example/", "/groups/other/"], {"123456"}),
+        (["https://example.com/groups/example/"], {"123456"}),
+        (["/groups/example/members/"], {"123456"}),
+        (["http://[invalid/groups/example/"], {"123456"}),
+    ],
+)
+def test_group_aliases_require_one_facebook_group_path(
+    hrefs: list[str],
+    expected: set[str],
+) -> None:
+    assert (
+        browser_module.group_aliases_from_hrefs(
+            "https://www.facebook.com/groups/123456/",
+            hrefs,
+            parse_group_ref("123456"),
+        )
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    ("url", "error"),
+    [
+        ("https://www.facebook.com/checkpoint/123/", AccountActionRequiredError),
+        ("https://www.facebook.com/login/?next=x", AuthenticationRequiredError),
+    ],
+)
+def test_page_signal_paths_fail_closed_when_the_script_returns_nothing(
+    url: str,
+    error: type[Exception],
+) -> None:
+    page = OneScriptPage(url, None)
+
+    with pytest.raises(error):
+        classify_page(browser_module.read_page_signals(page))  # type: ignore[arg-type]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
@@ -11,13 +12,17 @@ from pathlib import Path
 
 import pytest
 
+from fbn.bench import synthetic_feed_html, synthetic_payloads
 from fbn.browser import (
+    SCROLL_AND_OBSERVE_SCRIPT,
     PageState,
     PlaywrightPostSource,
+    _drive,
+    _settle_steps,
     classify_page,
-    collect_dom_payloads,
-    collect_group_aliases,
+    group_aliases_from_hrefs,
     read_page_signals,
+    read_page_snapshot,
     wait_for_terminal_page,
 )
 from fbn.config import BrowserSettings
@@ -30,6 +35,7 @@ from fbn.exceptions import (
     TransientNavigationError,
 )
 from fbn.extractor import extract_posts, parse_group_ref
+from fbn.models import GroupRef
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -38,6 +44,18 @@ def _fixture(name: str) -> str:
     return (FIXTURES / name).read_text(encoding="utf-8")
 
 
+def _payloads_and_aliases(
+    page: object,
+    group: GroupRef,
+) -> tuple[list[dict[str, object]], frozenset[str]]:
+    # One extracting snapshot per page: later ones return only changed items.
+    snapshot = read_page_snapshot(page, extract=True)  # type: ignore[arg-type]
+    aliases = group_aliases_from_hrefs(
+        snapshot.signals.url, snapshot.alias_hrefs, group
+    )
+    return list(snapshot.payloads), aliases
+
+
 @contextmanager
 def _local_context(
     tmp_path: Path,
@@ -134,7 +152,7 @@ def test_headless_browser_extracts_ordered_visible_posts(tmp_path: Path) -> None
         page = context.new_page()
         try:
             page.set_content(_fixture("feed.html"))
-            payloads = collect_dom_payloads(page)
+            payloads = list(read_page_snapshot(page, extract=True).payloads)
         finally:
             page.close()
 
@@ -151,6 +169,100 @@ def test_headless_browser_extracts_ordered_visible_posts(tmp_path: Path) -> None
     assert posts[1].partial is True
 
 
+def test_synthetic_benchmark_feed_scans_like_its_payloads(tmp_path: Path) -> None:
+    with _local_context(tmp_path) as context:
+        page = context.new_page()
+        try:
+            page.set_content(synthetic_feed_html(12))
+            payloads = list(read_page_snapshot(page, extract=True).payloads)
+        finally:
+            page.close()
+
+    group = parse_group_ref("test-group")
+    observed_at = datetime(2026, 7, 28, 12, tzinfo=timezone.utc)
+    scanned = extract_posts(payloads, group, observed_at, limit=20)
+    expected = extract_posts(synthetic_payloads(12), group, observed_at, limit=20)
+
+    assert [post.post_id for post in scanned] == [post.post_id for post in expected]
+    assert [post.author for post in scanned] == [post.author for post in expected]
+    assert [post.published_at for post in scanned] == [
+        post.published_at for post in expected
+    ]
+
+
+def test_incremental_extraction_returns_only_newly_rendered_items(
+    tmp_path: Path,
+) -> None:
+    with _local_context(tmp_path) as context:
+        page = context.new_page()
+        try:
+            page.set_content(_fixture("feed.html"))
+            first = read_page_snapshot(page, extract=True).payloads
+            repeated = read_page_snapshot(page, extract=True).payloads
+            page.evaluate(
+                """
+                () => {
+                  const item = document.createElement('article');
+                  item.setAttribute('role', 'article');
+                  item.setAttribute('aria-posinset', '4');
+                  item.innerHTML = '<div>Newly loaded post</div>' +
+                    '<a href="https://www.facebook.com/groups/test-group/' +
+                    'posts/404/">1 minute ago</a>';
+                  document.querySelector('[role="feed"]').append(item);
+                }
+                """
+            )
+            appended = read_page_snapshot(page, extract=True).payloads
+            page.evaluate(
+                """
+                () => {
+                  const item = document.querySelector('[aria-posinset="4"] div');
+                  item.textContent = 'Newly loaded post, now fully rendered';
+                }
+                """
+            )
+            changed = read_page_snapshot(page, extract=True)
+        finally:
+            page.close()
+
+    assert len(first) == 2
+    assert repeated == ()
+    assert [payload["href"] for payload in appended] == [
+        "https://www.facebook.com/groups/test-group/posts/404/"
+    ]
+    assert len(changed.payloads) == 1
+    assert "now fully rendered" in changed.payloads[0]["text"]
+    assert changed.signals.post_count == 3
+
+
+def test_scroll_settle_observes_new_feed_items_before_the_upper_bound(
+    tmp_path: Path,
+) -> None:
+    group = parse_group_ref("test-group")
+
+    with _local_context(tmp_path) as context:
+        page = context.new_page()
+        try:
+            page.set_content(_fixture("feed.html"))
+            page.evaluate(SCROLL_AND_OBSERVE_SCRIPT)
+            page.evaluate(
+                """
+                () => setTimeout(() => {
+                  const item = document.createElement('div');
+                  item.setAttribute('aria-posinset', '4');
+                  document.querySelector('[role="feed"]').append(item);
+                }, 100)
+                """
+            )
+            started = time.monotonic()
+            _drive(page, _settle_steps(page, group, 5.0))
+            elapsed = time.monotonic() - started
+        finally:
+            page.close()
+
+    assert elapsed < 2.0
+
+
 def test_headless_browser_accepts_one_article_inside_positioned_feed_item(
     tmp_path: Path,
 ) -> None:
@@ -161,7 +273,7 @@ def test_headless_browser_accepts_one_article_inside_positioned_feed_item(
         page = context.new_page()
         try:
             page.set_content(_fixture("positioned_wrapper_feed.html"))
-            payloads = collect_dom_payloads(page)
+            payloads = list(read_page_snapshot(page, extract=True).payloads)
         finally:
             page.close()
 
@@ -186,7 +298,7 @@ def test_headless_browser_extracts_photo_only_group_post(tmp_path: Path) -> None
         page = context.new_page()
         try:
             page.set_content(_fixture("photo_feed.html"))
-            payloads = collect_dom_payloads(page)
+            payloads = list(read_page_snapshot(page, extract=True).payloads)
         finally:
             page.close()
 
@@ -215,14 +327,13 @@ def test_headless_browser_rejects_links_outside_direct_feed_items(
         page = context.new_page()
         try:
             page.set_content(_fixture(fixture_name))
-            payloads = collect_dom_payloads(page)
-            signals = read_page_signals(page)
+            snapshot = read_page_snapshot(page, extract=True)
         finally:
             page.close()
 
-    assert payloads == []
+    assert snapshot.payloads == ()
     with pytest.raises(LayoutChangedError):
-        classify_page(signals)
+        classify_page(snapshot.signals)
 
 
 def test_headless_browser_accepts_one_group_header_alias(
@@ -233,8 +344,7 @@ def test_headless_browser_accepts_one_group_header_alias(
         page = context.new_page()
         try:
             page.set_content(_fixture("alias_feed.html"))
-            payloads = collect_dom_payloads(page)
-            aliases = collect_group_aliases(page, group)
+            payloads, aliases = _payloads_and_aliases(page, group)
         finally:
             page.close()
 
@@ -250,6 +360,30 @@ def test_headless_browser_accepts_one_group_header_alias(
     assert posts[0].group_key == "1663189947098862"
 
 
+def test_snapshot_reads_signals_aliases_and_payloads_in_one_pass(
+    tmp_path: Path,
+) -> None:
+    group = parse_group_ref("1663189947098862")
+    with _local_context(tmp_path) as context:
+        page = context.new_page()
+        try:
+            page.set_content(_fixture("alias_feed.html"))
+            signals = read_page_signals(page)
+            snapshot = read_page_snapshot(page, extract=True)
+            repeated = read_page_snapshot(page, extract=True)
+        finally:
+            page.close()
+
+    assert snapshot.signals == signals
+    assert group_aliases_from_hrefs(signals.url, snapshot.alias_hrefs, group) == (
+        frozenset({"1663189947098862", "custom-alias"})
+    )
+    assert snapshot.payloads
+    assert repeated.alias_hrefs == snapshot.alias_hrefs
+    assert repeated.payloads == ()
+    assert repeated.signals.post_count == signals.post_count
+
+
 def test_headless_browser_rejects_unrelated_group_link_as_alias(
     tmp_path: Path,
 ) -> None:
@@ -258,8 +392,7 @@ def test_headless_browser_rejects_unrelated_group_link_as_alias(
         page = context.new_page()
         try:
             page.set_content(_fixture("related_group_feed.html"))
-            payloads = collect_dom_payloads(page)
-            aliases = collect_group_aliases(page, group)
+            payloads, aliases = _payloads_and_aliases(page, group)
         finally:
             page.close()
 
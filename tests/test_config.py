@@ -9,7 +9,10 @@ import pytest
 
 from fbn.config import (
     BrowserSettings,
+    DeliveryRetrySettings,
+    RetentionSettings,
     ScheduleSettings,
+    SessionSettings,
     ensure_private_directory,
     parse_duration,
     parse_interval_range,
@@ -73,6 +76,9 @@ def test_schedule_defaults_to_one_through_three_hours() -> None:
         timedelta(hours=3),
     )
     assert ScheduleSettings.from_values() == ScheduleSettings()
+    assert ScheduleSettings.from_values(adaptive=True).adaptive is True
+    with pytest.raises(ConfigurationError, match="boolean"):
+        ScheduleSettings(adaptive="yes")  # type: ignore[arg-type]
 
 
 def test_schedule_normalizes_mixed_units_and_fixed_intervals() -> None:
@@ -201,6 +207,72 @@ def test_browser_settings_validate_choice_and_executable_pairing(
         )
 
 
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("max_checks", 0),
+        ("max_checks", True),
+        ("max_rss_bytes", -1),
+        ("max_rss_bytes", 1.5),
+    ],
+)
+def test_session_settings_reject_nonpositive_limits(
+    field: str,
+    value: object,
+) -> None:
+    with pytest.raises(ConfigurationError, match=field):
+        SessionSettings(**{field: value})
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("post_days", 0),
+        ("post_days", True),
+        ("outbox_days", -1),
+        ("max_posts", 49),
+        ("max_posts", 100.0),
+        ("interval", timedelta(0)),
+        ("interval", 3600),
+    ],
+)
+def test_retention_settings_reject_limits_that_could_break_deduplication(
+    field: str,
+    value: object,
+) -> None:
+    with pytest.raises(ConfigurationError, match=field):
+        RetentionSettings(**{field: value})
+
+
+def test_delivery_retry_delay_doubles_with_attempts_up_to_the_cap() -> None:
+    retry = DeliveryRetrySettings(
+        base_delay=timedelta(minutes=1),
+        max_delay=timedelta(minutes=10),
+    )
+
+    delays = [retry.delay(attempts) for attempts in (0, 1, 2, 3, 4, 5, 10_000)]
+
+    assert delays == [timedelta(minutes=minutes) for minutes in (1, 1, 2, 4, 8, 10, 10)]
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("base_delay", timedelta(0)),
+        ("base_delay", 60),
+        ("max_delay", timedelta(seconds=59)),
+        ("max_attempts", 0),
+        ("max_attempts", True),
+    ],
+)
+def test_delivery_retry_settings_reject_invalid_limits(
+    field: str,
+    value: object,
+) -> None:
+    with pytest.raises(ConfigurationError, match=field):
+        DeliveryRetrySettings(**{field: value})
+
+
 @pytest.mark.parametrize(
     ("field", "value"),
     [
@@ -209,15 +281,25 @@ def test_browser_settings_validate_choice_and_executable_pairing(
         ("sample_count", True),
         ("max_scrolls", -1),
         ("stagnant_scrolls", 0),
+        ("stop_after_known", -1),
+        ("stop_after_known", 51),
+        ("stop_after_known", True),
         ("navigation_timeout_seconds", 0),
         ("navigation_timeout_seconds", float("nan")),
         ("navigation_timeout_seconds", float("inf")),
         ("settle_seconds", -0.1),
         ("settle_seconds", float("nan")),
+        ("tab_timeout_seconds", 0),
+        ("tab_timeout_seconds", float("inf")),
         ("timezone_name", ""),
         ("timezone_name", " America/New_York"),
         ("timezone_name", "Mars/Olympus_Mons"),
         ("timezone_name", 123),
+        ("block_resources", "yes"),
+        ("allowed_hosts", ()),
+        ("allowed_hosts", ["facebook.com"]),
+        ("allowed_hosts", ("https://facebook.com",)),
+        ("allowed_hosts", ("Facebook.com",)),
     ],
 )
 def test_scan_policy_rejects_unbounded_or_invalid_values(
@@ -235,3 +317,10 @@ def test_scan_policy_is_frozen_and_has_no_instance_dictionary() -> None:
     assert policy.timezone_name == "America/New_York"
     with pytest.raises(FrozenInstanceError):
         policy.sample_count = 20
+
+
+def test_scan_policy_keeps_the_positional_meaning_of_its_original_fields() -> None:
+    policy = ScanPolicy(12, 3, 2, 20, 0.5, "America/New_York")
+
+    assert policy.timezone_name == "America/New_York"
+    assert policy.tab_timeout_seconds == ScanPolicy().tab_timeout_seconds
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from fbn.config import DeliveryRetrySettings
+from fbn.delivery import DeliveryWorker
+from fbn.exceptions import DeliveryError
+from fbn.models import GroupRef, Post
+from fbn.notifications import Notification
+from fbn.state import SQLiteStateRepository
+
+T0 = datetime(2026, 7, 28, 12, tzinfo=timezone.utc)
+HEALTHY = GroupRef("healthy", "https://www.facebook.com/groups/healthy/")
+BROKEN = GroupRef("broken", "https://www.facebook.com/groups/broken/")
+
+
+def post(group: GroupRef, post_id: str) -> Post:
+    return Post(
+        group_key=group.key,
+        post_id=post_id,
+        url=f"https://www.facebook.com/groups/{group.key}/posts/{post_id}/",
+        text=f"body {post_id}",
+        author="Author",
+        observed_at=T0,
+        position=0,
+        published_at=T0,
+    )
+
+
+class GroupFailingSink:
+    def __init__(self, failing_group: str) -> None:
+        self.failing_group = failing_group
+        self.sent: list[str] = []
+
+    def send(self, notification: Notification) -> None:
+        self.sent.append(notification.title)
+        if notification.title.endswith(f"from {self.failing_group}"):
+            raise DeliveryError("Apprise did not deliver the notification.")
+
+
+def queue_one_post_per_group(state: SQLiteStateRepository) -> None:
+    for group in (HEALTHY, BROKEN):
+        state.observe(group, (post(group, "1"),), observed_at=T0)
+        state.observe(
+            group,
+            (post(group, "2"),),
+            observed_at=T0 + timedelta(minutes=1),
+            same_day_only=True,
+        )
+
+
+def test_worker_delivers_healthy_groups_and_waits_out_a_failing_ones_retry(
+    tmp_path: Path,
+) -> None:
+    now = [T0]
+    sink = GroupFailingSink("broken")
+    retry = DeliveryRetrySettings(base_delay=timedelta(minutes=1))
+    with SQLiteStateRepository(
+        tmp_path / "state.sqlite3",
+        clock=lambda: now[0],
+        retry=retry,
+    ) as state:
+        queue_one_post_per_group(state)
+        worker = DeliveryWorker(state, sink, clock=lambda: now[0])
+
+        first = worker.drain()
+        now[0] += timedelta(seconds=30)
+        skipped = worker.drain()
+        now[0] += timedelta(seconds=31)
+        sink.failing_group = "nobody"
+        retried = worker.drain()
+
+        assert state.pending_group_keys() == ()
+
+    assert (first.delivered, first.pending, first.failed_groups) == (1, 1, ("broken",))
+    assert (skipped.delivered, skipped.pending, skipped.failed_groups) == (0, 1, ())
+    assert (retried.delivered, retried.pending) == (1, 0)
+    assert sink.sent == [
+        "1 new post from broken",
+        "1 new post from healthy",
+        "1 new post from broken",
+    ]
+
+
+def test_worker_rejects_a_nonpositive_poll_interval(tmp_path: Path) -> None:
+    with (
+        SQLiteStateRepository(tmp_path / "state.sqlite3") as state,
+        pytest.raises(ValueError, match="poll_interval"),
+    ):
+        DeliveryWorker(state, GroupFailingSink("x"), poll_interval=timedelta(0))
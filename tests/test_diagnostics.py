@@ -169,7 +169,7 @@ def test_doctor_command_succeeds_with_fake_playwright(
             playwright_factory=factory,
         )
 
-    monkeypatch.setattr(cli, "run_doctor", run_with_fake)
+    monkeypatch.setattr(diagnostics, "run_doctor", run_with_fake)
     profile_dir = tmp_path / "profile"
     state_file = tmp_path / "state.sqlite3"
 
@@ -214,7 +214,7 @@ def test_doctor_command_fails_nonzero_with_fake_playwright(
             playwright_factory=factory,
         )
 
-    monkeypatch.setattr(cli, "run_doctor", run_with_fake)
+    monkeypatch.setattr(diagnostics, "run_doctor", run_with_fake)
     result = CliRunner().invoke(
         cli.main,
         [
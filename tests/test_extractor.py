@@ -5,6 +5,8 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
+import fbn.extractor as extractor_module
+from fbn.bench import bench_timestamp_parsing, synthetic_payloads
 from fbn.exceptions import ConfigurationError
 from fbn.extractor import (
     chronological_group_url,
@@ -224,6 +226,88 @@ def test_parse_facebook_timestamp_rejects_unknown_values(value: object) -> None:
     assert parse_facebook_timestamp(value, OBSERVED_AT) is None
 
 
+def _timestamp_corpus() -> list[str]:
+    corpus = ["Just now", "1w", "0m", "99999999 days ago"]
+    for amount in (1, 2, 25, 61, 1000):
+        corpus += [f"{amount}s", f"{amount} m", f"{amount}h", f"{amount}d"]
+        corpus += [
+            f"{amount} {unit}{'' if amount == 1 else 's'} ago"
+            for unit in ("second", "minute", "hour", "day", "week")
+        ]
+    for clock in ("0:05", "01:30", "02:30", "13:00", "23:59"):
+        corpus += [f"Today at {clock}", f"Yesterday at {clock}"]
+        corpus += [
+            f"{day} {month} at {clock}"
+            for day, month in (
+                ("1", "January"),
+                ("29", "Feb"),
+                ("30", "February"),
+                ("29", "March"),
+                ("12", "Sept"),
+                ("25", "oct"),
+                ("31", "December"),
+                ("5", "Mai"),
+                ("00", "March"),
+            )
+        ]
+    return corpus
+
+
+@pytest.mark.parametrize(
+    ("observed_at", "timezone_name"),
+    [
+        (datetime(2026, 3, 8, 7, 20, tzinfo=timezone.utc), "America/New_York"),
+        (datetime(2026, 11, 1, 6, 20, tzinfo=timezone.utc), "America/New_York"),
+        (datetime(2026, 10, 25, 1, 0, tzinfo=timezone.utc), "Europe/Dublin"),
+        (datetime(2027, 3, 28, 1, 40, tzinfo=timezone.utc), "Europe/Dublin"),
+        (datetime(2026, 4, 4, 15, 10, tzinfo=timezone.utc), "Australia/Lord_Howe"),
+        (datetime(2028, 2, 1, 23, 30, tzinfo=timezone.utc), "Asia/Kolkata"),
+        (OBSERVED_AT, "UTC"),
+    ],
+)
+def test_fast_timestamp_parser_matches_dateparser_on_a_generated_corpus(
+    observed_at: datetime,
+    timezone_name: str,
+) -> None:
+    parser = extractor_module._TimestampParser(observed_at, timezone_name)
+
+    for value in _timestamp_corpus():
+        fast = parser(value)
+        expected = parser._parse_with_dateparser(value)
+        if expected is None:
+            assert fast is None, value
+            continue
+        assert fast is not None, value
+        # Same-zone datetimes compare by wall time, so also compare instants.
+        assert fast.astimezone(timezone.utc) == expected.astimezone(timezone.utc)
+        assert (fast.replace(tzinfo=None), fast.utcoffset()) == (
+            expected.replace(tzinfo=None),
+            expected.utcoffset(),
+        ), value
+        assert fast.tzinfo is expected.tzinfo, value
+
+
+def test_timestamp_benchmark_reports_both_parsers() -> None:
+    fast, fallback = bench_timestamp_parsing(rounds=1, repeat=1)
+
+    assert fast.calls == fallback.calls > 0
+    assert fast.seconds > 0
+    assert fallback.microseconds_per_call > 0
+
+
+def test_synthetic_benchmark_payloads_extract_as_distinct_dated_posts() -> None:
+    posts = extract_posts(
+        synthetic_payloads(40),
+        parse_group_ref("test-group"),
+        OBSERVED_AT,
+        limit=100,
+    )
+
+    assert len({post.post_id for post in posts}) == 40
+    assert all(post.published_at is not None for post in posts)
+    assert [post.position for post in posts] == list(range(40))
+
+
 def test_parse_facebook_timestamp_rejects_invalid_timezone() -> None:
     with pytest.raises(ValueError, match="IANA timezone"):
         parse_facebook_timestamp(
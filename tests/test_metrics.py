@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from fbn.exceptions import ConfigurationError
+from fbn.metrics import MetricsRegistry, export_metrics, write_textfile
+
+
+def test_histograms_are_cumulative_and_counters_keep_label_series() -> None:
+    registry = MetricsRegistry()
+
+    for seconds in (0.004, 0.3, 0.3, 200.0):
+        registry.observe("fbn_navigation_seconds", seconds)
+    registry.increment("fbn_scans_total", result="feed")
+    registry.increment("fbn_scans_total", result="feed")
+    registry.increment("fbn_scans_total", result="LayoutChangedError")
+    rendered = registry.render().splitlines()
+
+    assert "# TYPE fbn_navigation_seconds histogram" in rendered
+    assert 'fbn_navigation_seconds_bucket{le="0.005"} 1' in rendered
+    assert 'fbn_navigation_seconds_bucket{le="0.5"} 3' in rendered
+    assert 'fbn_navigation_seconds_bucket{le="120"} 3' in rendered
+    assert 'fbn_navigation_seconds_bucket{le="+Inf"} 4' in rendered
+    assert "fbn_navigation_seconds_count 4" in rendered
+    assert "fbn_navigation_seconds_sum 200.604" in rendered
+    assert 'fbn_scans_total{result="LayoutChangedError"} 1' in rendered
+    assert 'fbn_scans_total{result="feed"} 2' in rendered
+    assert "fbn_browser_launch_seconds_count 0" in rendered
+    assert not any(line.startswith("fbn_delivery_chunk_seconds") for line in rendered)
+
+
+@pytest.mark.parametrize(
+    ("call", "message"),
+    [
+        (lambda r: r.observe("fbn_unknown_seconds", 1.0), "not a declared"),
+        (lambda r: r.increment("fbn_navigation_seconds"), "not a declared"),
+        (lambda r: r.increment("fbn_scans_total"), "requires labels"),
+        (lambda r: r.observe("fbn_navigation_seconds", 1, group="x"), "labels"),
+        (lambda r: r.observe("fbn_navigation_seconds", float("nan")), "finite"),
+        (lambda r: r.increment("fbn_scans_total", -1, result="feed"), "negative"),
+    ],
+)
+def test_only_declared_families_and_labels_can_be_recorded(
+    call: object,
+    message: str,
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        call(MetricsRegistry())  # type: ignore[operator]
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+
+    registry.increment("fbn_scans_total", result='a"b\\c\nd')
+
+    assert 'fbn_scans_total{result="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_textfile_is_replaced_atomically(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    path = tmp_path / "fbn.prom"
+    path.write_text("stale\n")
+
+    registry.observe("fbn_state_observe_seconds", 0.01)
+    write_textfile(registry, path)
+
+    assert "fbn_state_observe_seconds_count 1" in path.read_text()
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["fbn.prom"]
+
+
+def test_export_serves_metrics_on_loopback_and_writes_a_final_textfile(
+    tmp_path: Path,
+) -> None:
+    registry = MetricsRegistry()
+    path = tmp_path / "fbn.prom"
+
+    with export_metrics(registry, port=0, textfile=path) as port:
+        assert port is not None
+        registry.increment("fbn_scans_total", result="feed")
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+        with pytest.raises(urllib.error.HTTPError) as missing:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/")
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert 'fbn_scans_total{result="feed"} 1' in body
+    assert missing.value.code == 404
+    assert 'fbn_scans_total{result="feed"} 1' in path.read_text()
+
+
+def test_export_rejects_a_missing_textfile_directory(tmp_path: Path) -> None:
+    with (
+        pytest.raises(ConfigurationError, match="directory"),
+        export_metrics(MetricsRegistry(), textfile=tmp_path / "missing" / "f.prom"),
+    ):
+        pass
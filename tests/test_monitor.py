@@ -2,23 +2,30 @@ from __future__ import annotations
 
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime, timezone
+from pathlib import Path
 
 import pytest
 from loguru import logger
 
-from fbn.exceptions import DeliveryError
+from fbn.delivery import DeliveryWorker
+from fbn.exceptions import DeliveryError, TransientNavigationError
 from fbn.logging import configure_logging
+from fbn.metrics import MetricsRegistry
 from fbn.models import (
     GroupRef,
     ObservationBatch,
     PendingNotification,
     Post,
+    RunSummary,
     ScanPolicy,
     ScanResult,
 )
 from fbn.monitor import MonitorService
-from fbn.notifications import render_digest_chunks
+from fbn.notifications import Notification, render_digest_chunks
+from fbn.profiling import TraceRecorder
+from fbn.state import SQLiteStateRepository
 
 NOW = datetime(2026, 7, 28, tzinfo=timezone.utc)
 GROUP = GroupRef("group", "https://www.facebook.com/groups/group/")
@@ -56,6 +63,8 @@ class FakeState:
         self.current_pending = list(batch.pending)
         self.delivered: list[str] = []
         self.failed: list[tuple[list[str], str]] = []
+        self.destination_delivered: list[tuple[str, list[str]]] = []
+        self.destination_failed: list[tuple[str, list[str]]] = []
         self.observe_kwargs: dict[str, object] = {}
         self.lock_events: list[str] = []
 
@@ -67,6 +76,10 @@ class FakeState:
         finally:
             self.lock_events.append("released")
 
+    @contextmanager
+    def delivery_lock(self) -> Iterator[None]:
+        yield
+
     def observe(self, *args: object, **kwargs: object) -> ObservationBatch:
         self.observe_kwargs = kwargs
         return self.batch
@@ -75,19 +88,45 @@ class FakeState:
         assert group is GROUP
         return tuple(self.current_pending)
 
+    def iter_pending(
+        self,
+        group: GroupRef,
+        *,
+        due_at: datetime | None = None,
+    ) -> Iterator[PendingNotification]:
+        return iter(self.pending(group))
+
+    def pending_count(self, group: GroupRef) -> int:
+        return len(self.pending(group))
+
     def mark_delivered(
         self,
         event_ids: Sequence[str],
         delivered_at: datetime | None = None,
+        *,
+        destination: str | None = None,
     ) -> None:
+        if destination is not None:
+            self.destination_delivered.append((destination, list(event_ids)))
+            return
         self.lock_events.append("marked")
         self.delivered.extend(event_ids)
         self.current_pending = [
             item for item in self.current_pending if item.event_id not in event_ids
         ]
 
-    def mark_delivery_failed(self, event_ids: Sequence[str], error: str) -> None:
+    def mark_delivery_failed(
+        self,
+        event_ids: Sequence[str],
+        error: str,
+        *,
+        destination: str | None = None,
+    ) -> int:
+        if destination is not None:
+            self.destination_failed.append((destination, list(event_ids)))
+            return 0
         self.failed.append((list(event_ids), error))
+        return 0
 
 
 class FakeSink:
@@ -99,10 +138,12 @@ class FakeSink:
     ) -> None:
         self.error = error
         self.fail_on_call = fail_on_call
+        self.calls = 0
         self.sent = []
 
     def send(self, notification: object) -> None:
-        if self.error and len(self.sent) + 1 == self.fail_on_call:
+        self.calls += 1
+        if self.error and self.calls == self.fail_on_call:
             raise self.error
         self.sent.append(notification)
 
@@ -226,6 +267,16 @@ def test_delivery_failure_is_recorded_and_remains_pending() -> None:
     assert state.pending(GROUP) == (PENDING,)
 
 
+def test_without_a_sink_posts_are_recorded_and_left_for_the_worker() -> None:
+    state = FakeState(ObservationBatch(False, 1, 1, (PENDING,)))
+
+    summary = MonitorService(FakeSource(), state, None).run_once(GROUP, ScanPolicy())
+
+    assert state.delivered == []
+    assert state.failed == []
+    assert (summary.new_posts, summary.delivered, summary.pending) == (1, 0, 1)
+
+
 def test_dry_run_does_not_mark_delivery() -> None:
     state = FakeState(ObservationBatch(False, 1, 1, (PENDING,)))
     sink = FakeSink()
@@ -275,18 +326,197 @@ def test_oversized_batch_delivers_and_marks_every_chunk() -> None:
     assert summary.pending == 0
 
 
-def test_later_chunk_failure_marks_only_that_chunk_and_keeps_rest_pending() -> None:
+def test_scan_results_and_chunk_delivery_timings_are_recorded() -> None:
+    pending = oversized_pending()
+    chunks = render_digest_chunks(GROUP.key, pending)
+    state = FakeState(ObservationBatch(False, len(pending), len(pending), pending))
+    sink = FakeSink(DeliveryError("redacted"), fail_on_call=2)
+    metrics = MetricsRegistry()
+
+    with pytest.raises(DeliveryError):
+        MonitorService(FakeSource(), state, sink, metrics=metrics).run_once(
+            GROUP,
+            ScanPolicy(),
+        )
+    rendered = metrics.render().splitlines()
+
+    assert 'fbn_scans_total{result="feed"} 1' in rendered
+    assert 'fbn_delivery_chunk_seconds_count{outcome="failed"} 1' in rendered
+    assert (
+        f'fbn_delivery_chunk_seconds_count{{outcome="delivered"}} {len(chunks) - 1}'
+        in rendered
+    )
+
+
+def test_profiled_runs_record_observe_and_delivery_spans() -> None:
+    pending = oversized_pending()
+    chunks = render_digest_chunks(GROUP.key, pending)
+    state = FakeState(ObservationBatch(False, len(pending), len(pending), pending))
+    tracer = TraceRecorder()
+
+    MonitorService(
+        FakeSource(),
+        state,
+        FakeSink(),
+        metrics=MetricsRegistry(tracer=tracer),
+    ).run_once(GROUP, ScanPolicy())
+    spans = [
+        event["name"] for event in tracer.trace()["traceEvents"] if event["ph"] == "X"
+    ]
+
+    assert spans == ["observe", *["deliver chunk"] * len(chunks), "deliver"]
+
+
+def test_chunk_failure_marks_only_that_chunk_and_still_sends_the_rest() -> None:
     pending = oversized_pending()
     chunks = render_digest_chunks(GROUP.key, pending)
+    assert len(chunks) > 2
     state = FakeState(ObservationBatch(False, len(pending), len(pending), pending))
     sink = FakeSink(DeliveryError("redacted later failure"), fail_on_call=2)
 
     with pytest.raises(DeliveryError, match="redacted later"):
         MonitorService(FakeSource(), state, sink).run_once(GROUP, ScanPolicy())
 
-    assert state.delivered == list(chunks[0].event_ids)
+    assert len(sink.sent) == len(chunks) - 1
     assert state.failed == [(list(chunks[1].event_ids), "redacted later failure")]
     remaining = state.pending(GROUP)
-    assert [item.event_id for item in remaining] == [
-        item.event_id for item in pending if item.event_id not in chunks[0].event_ids
+    assert [item.event_id for item in remaining] == list(chunks[1].event_ids)
+
+
+class FakeFanoutSink:
+    def __init__(self, failing: frozenset[str] = frozenset()) -> None:
+        self.failing = failing
+        self.sent: list[tuple[str, ...]] = []
+
+    @property
+    def destinations(self) -> tuple[str, ...]:
+        return ("chat", "mail")
+
+    def send(self, notification: Notification) -> None:
+        raise AssertionError("fan-out delivery must use send_each")
+
+    def send_each(
+        self,
+        notification: Notification,
+        destinations: Sequence[str],
+    ) -> dict[str, DeliveryError | None]:
+        self.sent.append(tuple(destinations))
+        return {
+            name: DeliveryError(f"Delivery to {name} timed out.")
+            if name in self.failing
+            else None
+            for name in destinations
+        }
+
+
+def test_fanout_records_each_destination_and_retries_only_the_failed_one() -> None:
+    state = FakeState(ObservationBatch(False, 1, 1, (PENDING,)))
+    sink = FakeFanoutSink(frozenset({"mail"}))
+
+    with pytest.raises(DeliveryError, match=r"failed for mail\.$"):
+        MonitorService(FakeSource(), state, sink).run_once(GROUP, ScanPolicy())
+
+    assert sink.sent == [("chat", "mail")]
+    assert state.destination_delivered == [("chat", ["event-123"])]
+    assert state.destination_failed == [("mail", ["event-123"])]
+    assert state.failed == [(["event-123"], "Delivery failed for mail.")]
+    assert state.delivered == []
+
+    retried = replace(PENDING, delivered_to=frozenset({"chat"}))
+    state = FakeState(ObservationBatch(False, 0, 0, (retried,)))
+    sink = FakeFanoutSink()
+
+    summary = MonitorService(FakeSource(), state, sink).run_once(GROUP, ScanPolicy())
+
+    assert sink.sent == [("mail",)]
+    assert state.destination_delivered == [("mail", ["event-123"])]
+    assert state.delivered == ["event-123"]
+    assert summary.delivered == 1
+
+
+def test_chunks_skipped_for_an_already_failed_destination_are_backed_off() -> None:
+    pending = oversized_pending()
+    chunks = render_digest_chunks(GROUP.key, pending)
+    state = FakeState(ObservationBatch(False, len(pending), len(pending), pending))
+    sink = FakeFanoutSink(frozenset({"mail"}))
+
+    with pytest.raises(DeliveryError, match=r"failed for mail\.$"):
+        MonitorService(FakeSource(), state, sink).run_once(GROUP, ScanPolicy())
+
+    assert sink.sent == [("chat", "mail"), *[("chat",)] * (len(chunks) - 1)]
+    assert state.destination_failed == [
+        ("mail", list(chunk.event_ids)) for chunk in chunks
+    ]
+    assert state.failed == [
+        (list(chunk.event_ids), "Delivery failed for mail.") for chunk in chunks
     ]
+    assert state.delivered == []
+
+
+def test_batch_uses_concurrent_source_and_returns_per_group_outcomes() -> None:
+    state = FakeState(ObservationBatch(False, 1, 1, (PENDING,)))
+    other = GroupRef("other", "https://www.facebook.com/groups/other/")
+    failure = TransientNavigationError("timed out")
+
+    class PoolSource(FakeSource):
+        def fetch_many(
+            self,
+            groups: Sequence[GroupRef],
+            policy: ScanPolicy,
+        ) -> tuple[ScanResult | TransientNavigationError, ...]:
+            state.lock_events.append("fetched")
+            assert tuple(groups) == (GROUP, other)
+            return (ScanResult((POST,), "feed", 0, False), failure)
+
+    summary, error = MonitorService(PoolSource(), state, FakeSink()).run_batch(
+        (GROUP, other),
+        ScanPolicy(),
+    )
+
+    assert isinstance(summary, RunSummary)
+    assert summary.delivered == 1
+    assert error is failure
+    assert state.lock_events == ["acquired", "fetched", "marked", "released"]
+
+
+def test_batch_falls_back_to_sequential_fetches() -> None:
+    state = FakeState(ObservationBatch(True, 1, 0, ()))
+
+    outcomes = MonitorService(FakeSource(), state, FakeSink()).run_batch(
+        (GROUP, GROUP),
+        ScanPolicy(),
+    )
+
+    assert [type(outcome) for outcome in outcomes] == [RunSummary, RunSummary]
+    assert state.lock_events == ["acquired", "released"]
+
+
+def test_in_band_delivery_leaves_events_to_a_running_delivery_worker(
+    tmp_path: Path,
+) -> None:
+    state_path = tmp_path / "state.sqlite3"
+    in_band = FakeSink()
+    check_summaries: list[RunSummary] = []
+
+    class CheckDuringSend(FakeSink):
+        def send(self, notification: Notification) -> None:
+            with SQLiteStateRepository(state_path) as other:
+                check_summaries.append(
+                    MonitorService(FakeSource(), other, in_band).run_once(
+                        GROUP,
+                        ScanPolicy(),
+                    )
+                )
+            super().send(notification)
+
+    worker_sink = CheckDuringSend()
+    with SQLiteStateRepository(state_path) as state:
+        state.observe(GROUP, (POST,), notify_initial=True, observed_at=NOW)
+        with state.delivery_lock():
+            summary = DeliveryWorker(state, worker_sink).drain()
+
+    assert summary.delivered == 1
+    assert len(worker_sink.sent) == 1
+    assert in_band.calls == 0
+    assert check_summaries[0].delivered == 0
+    assert check_summaries[0].pending == 1
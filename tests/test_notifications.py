@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 
 import apprise
@@ -11,7 +15,10 @@ from fbn.notifications import (
     MAX_DIGEST_CHARS,
     AppriseSink,
     ConsoleSink,
+    FanoutSink,
     Notification,
+    apprise_destination_name,
+    iter_digest_chunks,
     render_digest,
     render_digest_chunks,
 )
@@ -92,6 +99,36 @@ def test_render_digest_chunks_include_every_pending_post_once() -> None:
         render_digest("group", items)
 
 
+def test_iter_digest_chunks_streams_the_same_chunks_one_at_a_time() -> None:
+    items = [
+        pending(str(index), position=index, body="x" * 4_000) for index in range(50)
+    ]
+    consumed: list[str] = []
+
+    def source() -> Iterator[PendingNotification]:
+        for item in items:
+            consumed.append(item.event_id)
+            yield item
+
+    chunks = iter_digest_chunks("group", source())
+    first = next(chunks)
+    assert len(consumed) == len(first.event_ids) + 1
+    streamed = [first, *chunks]
+
+    rendered = render_digest_chunks("group", items)
+    assert [chunk.event_ids for chunk in streamed] == [
+        chunk.event_ids for chunk in rendered
+    ]
+    assert [chunk.notification.body for chunk in streamed] == [
+        chunk.notification.body for chunk in rendered
+    ]
+    assert streamed[0].notification.title.endswith("from group (part 1)")
+    assert rendered[0].notification.title.endswith(f"(1/{len(rendered)})")
+    (single,) = iter_digest_chunks("group", items[:1])
+    assert single.notification.title == "1 new post from group"
+    assert list(iter_digest_chunks("group", ())) == []
+
+
 def test_console_sink_uses_injected_writer() -> None:
     output: list[str] = []
     ConsoleSink(output.append).send(Notification("Title", "Body"))
@@ -110,9 +147,11 @@ class FakeApprise:
         self.notify_result = notify_result
         self.error = error
         self.notify_kwargs: dict[str, object] = {}
+        self.added = 0
 
     def add(self, url: str) -> bool:
         assert url == "secret://notification-url"
+        self.added += 1
         if self.error:
             raise self.error
         return self.add_result
@@ -151,6 +190,72 @@ def test_apprise_false_results_raise(app: FakeApprise, message: str) -> None:
         )
 
 
+def test_apprise_sink_reuses_one_validated_app_until_a_failure() -> None:
+    apps = [FakeApprise(), FakeApprise()]
+    built: list[FakeApprise] = []
+
+    def factory() -> FakeApprise:
+        built.append(apps[len(built)])
+        return built[-1]
+
+    sink = AppriseSink("secret://notification-url", app_factory=factory)
+    sink.send(Notification("Title", "First chunk"))
+    sink.send(Notification("Title", "Second chunk"))
+
+    assert built == [apps[0]]
+    assert apps[0].added == 1
+    assert apps[0].notify_kwargs["body"] == "Second chunk"
+
+    apps[0].notify_result = False
+    with pytest.raises(DeliveryError, match="did not deliver"):
+        sink.send(Notification("Title", "Third chunk"))
+    sink.send(Notification("Title", "Retried chunk"))
+
+    assert built == apps
+    assert apps[1].added == 1
+    assert apps[1].notify_kwargs["body"] == "Retried chunk"
+
+
+def test_apprise_sink_never_shares_an_app_with_an_abandoned_send() -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingApprise(FakeApprise):
+        def notify(self, **kwargs: object) -> bool:
+            started.set()
+            release.wait(5)
+            return super().notify(**kwargs)
+
+    apps: list[FakeApprise] = [FakeApprise(), BlockingApprise(), FakeApprise()]
+    built: list[FakeApprise] = []
+
+    def factory() -> FakeApprise:
+        built.append(apps[len(built)])
+        return built[-1]
+
+    sink = AppriseSink("secret://notification-url", app_factory=factory)
+    sink.send(Notification("Title", "First chunk"))
+    apps[0].notify_result = False
+    with pytest.raises(DeliveryError):
+        sink.send(Notification("Title", "Failed chunk"))
+    abandoned = threading.Thread(
+        target=sink.send,
+        args=(Notification("Title", "Timed-out chunk"),),
+    )
+    abandoned.start()
+    try:
+        assert started.wait(5)
+        sink.send(Notification("Title", "Next chunk"))
+    finally:
+        release.set()
+        abandoned.join(5)
+    sink.send(Notification("Title", "Last chunk"))
+
+    assert built == apps
+    assert apps[1].notify_kwargs["body"] == "Timed-out chunk"
+    assert apps[2].notify_kwargs["body"] == "Last chunk"
+
+
 def test_apprise_exception_is_redacted() -> None:
     app = FakeApprise(error=RuntimeError("secret://notification-url"))
     with pytest.raises(DeliveryError) as raised:
@@ -160,3 +265,97 @@ def test_apprise_exception_is_redacted() -> None:
 
     assert "secret://notification-url" not in str(raised.value)
     assert "RuntimeError" in str(raised.value)
+
+
+class RecordingSink:
+    def __init__(
+        self,
+        error: Exception | None = None,
+        *,
+        release: threading.Event | None = None,
+    ) -> None:
+        self.error = error
+        self.release = release
+        self.sent: list[Notification] = []
+
+    def send(self, notification: Notification) -> None:
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error:
+            raise self.error
+        self.sent.append(notification)
+
+
+def test_fanout_reports_each_destination_without_blocking_the_others() -> None:
+    release = threading.Event()
+    healthy = RecordingSink()
+    sinks = {
+        "chat": healthy,
+        "mail": RecordingSink(DeliveryError("Apprise did not deliver.")),
+        "hook": RecordingSink(RuntimeError("secret://token")),
+        "slow": RecordingSink(release=release),
+    }
+    notification = Notification("Title", "Body")
+
+    try:
+        outcomes = FanoutSink(sinks, timeout=0.2).send_each(
+            notification,
+            ("chat", "mail", "hook", "slow", "chat"),
+        )
+    finally:
+        release.set()
+
+    assert list(outcomes) == ["chat", "mail", "hook", "slow"]
+    assert outcomes["chat"] is None
+    assert healthy.sent == [notification]
+    assert str(outcomes["mail"]) == "Apprise did not deliver."
+    assert str(outcomes["hook"]) == "Delivery to hook failed (RuntimeError)."
+    assert str(outcomes["slow"]) == "Delivery to slow timed out."
+
+
+def test_hung_fanout_destination_does_not_block_interpreter_exit() -> None:
+    script = """
+import threading
+from fbn.notifications import FanoutSink, Notification
+
+class HungSink:
+    def send(self, notification):
+        threading.Event().wait()
+
+outcomes = FanoutSink({"hung": HungSink()}, timeout=0.1).send_each(
+    Notification("Title", "Body"), ("hung",)
+)
+print(outcomes["hung"])
+"""
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert completed.stdout.strip() == "Delivery to hung timed out."
+
+
+def test_fanout_send_raises_only_with_destination_names() -> None:
+    sink = FanoutSink(
+        {"chat": RecordingSink(), "mail": RecordingSink(RuntimeError("secret"))}
+    )
+
+    with pytest.raises(DeliveryError, match=r"^Delivery failed for mail\.$"):
+        sink.send(Notification("Title", "Body"))
+    with pytest.raises(ValueError, match="unknown destinations"):
+        sink.send_each(Notification("Title", "Body"), ("pager",))
+    with pytest.raises(ValueError, match="destination name"):
+        FanoutSink({"Discord://token": RecordingSink()})
+
+
+def test_apprise_destination_names_are_stable_and_secret_free() -> None:
+    name = apprise_destination_name("discord://webhook-id/secret-token")
+
+    assert name == apprise_destination_name(" discord://webhook-id/secret-token ")
+    assert name.startswith("discord-")
+    assert "secret" not in name
+    assert name != apprise_destination_name("discord://webhook-id/other-token")
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import pstats
+import threading
+from pathlib import Path
+
+import pytest
+
+from fbn.exceptions import ConfigurationError
+from fbn.metrics import MetricsRegistry
+from fbn.profiling import TraceRecorder, profile_run
+
+
+def _spans(trace: dict[str, object]) -> list[dict[str, object]]:
+    events = trace["traceEvents"]
+    assert isinstance(events, list)
+    return [event for event in events if event["ph"] == "X"]
+
+
+def test_spans_nest_on_named_tracks_and_record_failure_classes() -> None:
+    recorder = TraceRecorder()
+
+    with recorder.span("fetch_recent", group_key="one"):
+        with recorder.span("page.goto", track="one"):
+            pass
+        with pytest.raises(RuntimeError), recorder.span("scan_feed", track="one"):
+            raise RuntimeError("layout")
+    trace = recorder.trace()
+    spans = {span["name"]: span for span in _spans(trace)}
+    tracks = {
+        event["args"]["name"]: event["tid"]
+        for event in trace["traceEvents"]
+        if event["name"] == "thread_name"
+    }
+
+    outer, goto = spans["fetch_recent"], spans["page.goto"]
+    assert outer["tid"] == tracks[threading.current_thread().name]
+    assert goto["tid"] == spans["scan_feed"]["tid"] == tracks["one"]
+    assert outer["ts"] <= goto["ts"]
+    assert goto["ts"] + goto["dur"] <= outer["ts"] + outer["dur"]
+    assert outer["args"] == {"group_key": "one"}
+    assert spans["scan_feed"]["args"] == {"error": "RuntimeError"}
+
+
+def test_registry_spans_are_noops_without_a_tracer() -> None:
+    tracer = TraceRecorder()
+
+    with MetricsRegistry().span("observe", post_count=1):
+        pass
+    with MetricsRegistry(tracer=tracer).span("observe", post_count=1):
+        pass
+
+    assert [span["args"] for span in _spans(tracer.trace())] == [{"post_count": 1}]
+
+
+def test_profile_run_writes_the_trace_and_python_stats_even_on_failure(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "check.trace.json"
+
+    with (
+        pytest.raises(RuntimeError),
+        profile_run(path, python=True) as recorder,
+        recorder.span("deliver"),
+    ):
+        raise RuntimeError("delivery")
+
+    assert [span["name"] for span in _spans(json.loads(path.read_text()))] == [
+        "deliver"
+    ]
+    assert pstats.Stats(str(tmp_path / "check.trace.json.pstats")).total_calls > 0
+    assert sorted(item.name for item in tmp_path.iterdir()) == [
+        "check.trace.json",
+        "check.trace.json.pstats",
+    ]
+
+
+def test_profile_run_rejects_a_missing_directory(tmp_path: Path) -> None:
+    with (
+        pytest.raises(ConfigurationError, match="directory"),
+        profile_run(tmp_path / "missing" / "trace.json"),
+    ):
+        pass
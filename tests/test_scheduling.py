@@ -1,19 +1,28 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from fbn.config import ScheduleSettings
 from fbn.exceptions import (
+    AccessDeniedError,
+    AuthenticationRequiredError,
     ConfigurationError,
     DeliveryError,
+    FbnError,
+    LayoutChangedError,
     MonitorInUseError,
     TransientNavigationError,
 )
 from fbn.models import GroupRef, RunSummary, ScanPolicy
-from fbn.scheduling import MAX_BACKOFF, MonitorLoop, backoff_for_failure
+from fbn.scheduling import (
+    MAX_BACKOFF,
+    MonitorLoop,
+    adaptive_window,
+    backoff_for_failure,
+)
 
 GROUP = GroupRef("group", "https://www.facebook.com/groups/group/")
 POLICY = ScanPolicy()
@@ -67,9 +76,12 @@ class FakeState:
         *,
         next_at: datetime | None = None,
         failures: int = 0,
+        arrival_rate: float | None = None,
     ) -> None:
         self.next_at = next_at
         self.failures = failures
+        self.arrival_rate = arrival_rate
+        self.rate_updates: list[datetime | None] = []
         self.set_history: list[datetime | None] = []
         self.failure_history: list[tuple[datetime, datetime]] = []
 
@@ -104,6 +116,16 @@ class FakeState:
         self.failure_history.append((at, next_eligible_at))
         return self.failures
 
+    def update_arrival_rate(
+        self,
+        group: GroupRef,
+        *,
+        at: datetime | None = None,
+    ) -> float | None:
+        assert group is GROUP
+        self.rate_updates.append(at)
+        return self.arrival_rate
+
 
 class FakeService:
     def __init__(
@@ -186,6 +208,69 @@ def test_honors_persisted_eligibility_then_persists_guard_and_success_jitter() -
     assert summaries == [SUMMARY]
 
 
+@pytest.mark.parametrize(
+    ("arrival_rate", "window_hours"),
+    [
+        (None, (1, 3)),
+        (0.0, (2.4, 3)),
+        (0.1, (2.4, 3)),
+        (0.5, (1.6, 2.4)),
+        (1.0, (1, 1.2)),
+        (12.0, (1, 1.2)),
+    ],
+)
+def test_adaptive_window_targets_the_expected_time_to_the_next_post(
+    arrival_rate: float | None,
+    window_hours: tuple[float, float],
+) -> None:
+    schedule = ScheduleSettings(timedelta(hours=1), timedelta(hours=3), True)
+
+    assert adaptive_window(schedule, arrival_rate) == tuple(
+        timedelta(hours=hours) for hours in window_hours
+    )
+
+
+def test_adaptive_schedule_learns_after_each_recorded_scan() -> None:
+    clock = FakeClock()
+    state = FakeState(arrival_rate=0.5)
+    service = FakeService(state, clock, [None])
+    event = FakeEvent(clock, [True])
+    uniform_calls: list[tuple[float, float]] = []
+
+    def lowest(lower: float, upper: float) -> float:
+        uniform_calls.append((lower, upper))
+        return lower
+
+    MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(hours=1), timedelta(hours=3), adaptive=True),
+        clock=clock,
+        uniform=lowest,
+    ).run(GROUP, POLICY, stop_event=event)
+
+    assert state.rate_updates == [START]
+    assert uniform_calls == [(1.6 * 60 * 60, 2.4 * 60 * 60)]
+    assert state.next_at == START + timedelta(hours=1.6)
+
+
+def test_fixed_schedule_never_learns_arrival_rates() -> None:
+    clock = FakeClock()
+    state = FakeState(arrival_rate=12.0)
+    event = FakeEvent(clock, [True])
+
+    MonitorLoop(
+        FakeService(state, clock, [None]),
+        state,
+        ScheduleSettings(),
+        clock=clock,
+        uniform=lambda lower, upper: upper,
+    ).run(GROUP, POLICY, stop_event=event)
+
+    assert state.rate_updates == []
+    assert state.next_at == START + timedelta(hours=3)
+
+
 def test_long_persisted_wait_is_split_into_interruptible_day_chunks() -> None:
     clock = FakeClock()
     state = FakeState(next_at=START + timedelta(days=3))
@@ -206,9 +291,9 @@ def test_long_persisted_wait_is_split_into_interruptible_day_chunks() -> None:
 def test_pre_attempt_guard_survives_nontransient_crash_and_error_propagates() -> None:
     clock = FakeClock()
     state = FakeState()
-    service = FakeService(state, clock, [DeliveryError("not retryable")])
+    service = FakeService(state, clock, [ConfigurationError("not retryable")])
 
-    with pytest.raises(DeliveryError, match="not retryable"):
+    with pytest.raises(ConfigurationError, match="not retryable"):
         MonitorLoop(
             service,
             state,
@@ -222,6 +307,24 @@ def test_pre_attempt_guard_survives_nontransient_crash_and_error_propagates() ->
     assert state.failure_history == []
 
 
+def test_delivery_failure_keeps_monitoring_on_the_normal_interval() -> None:
+    clock = FakeClock()
+    state = FakeState()
+    service = FakeService(state, clock, [DeliveryError("send failed"), None])
+    event = FakeEvent(clock, [False, True])
+
+    MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(),
+        clock=clock,
+    ).run(GROUP, POLICY, stop_event=event)
+
+    assert service.calls == 2
+    assert 3600 <= event.waits[0] <= 3 * 3600
+    assert state.failure_history == []
+
+
 def test_active_peer_defers_without_changing_shared_schedule() -> None:
     clock = FakeClock()
     state = FakeState()
@@ -435,3 +538,343 @@ def test_scheduler_rejects_invalid_injected_uniform_results(value: float) -> Non
 
     assert service.calls == 1
     assert state.next_at == START + timedelta(hours=1)
+
+
+class MultiGroupState:
+    def __init__(self, next_at: dict[str, datetime | None]) -> None:
+        self.next_at = dict(next_at)
+        self.failures: dict[str, int] = {}
+
+    def next_eligible(self, group: GroupRef) -> datetime | None:
+        return self.next_at[group.key]
+
+    def set_next_eligible(
+        self,
+        group: GroupRef,
+        when: datetime | None,
+    ) -> None:
+        self.next_at[group.key] = when
+
+    def consecutive_failures(self, group: GroupRef) -> int:
+        return self.failures.get(group.key, 0)
+
+    def record_failure(
+        self,
+        group: GroupRef,
+        *,
+        next_eligible_at: datetime,
+        at: datetime | None = None,
+    ) -> int:
+        self.failures[group.key] = self.consecutive_failures(group) + 1
+        self.next_at[group.key] = next_eligible_at
+        return self.failures[group.key]
+
+
+class MultiGroupService:
+    def __init__(
+        self,
+        clock: FakeClock,
+        outcomes: dict[str, list[BaseException | None]],
+    ) -> None:
+        self.clock = clock
+        self.outcomes = {key: list(values) for key, values in outcomes.items()}
+        self.attempts: list[tuple[str, datetime]] = []
+        self.batches: list[tuple[str, ...]] = []
+
+    def run_once(
+        self,
+        group: GroupRef,
+        policy: ScanPolicy,
+        *,
+        notify_initial: bool = False,
+        commit_delivery: bool = True,
+    ) -> RunSummary:
+        self.attempts.append((group.key, self.clock()))
+        outcome = self.outcomes[group.key].pop(0)
+        if outcome is not None:
+            raise outcome
+        return RunSummary(group.key, 1, 0, 0, 0, False)
+
+    def run_batch(
+        self,
+        groups: Sequence[GroupRef],
+        policy: ScanPolicy,
+        *,
+        notify_initial: bool = False,
+        commit_delivery: bool = True,
+    ) -> tuple[RunSummary | FbnError, ...]:
+        self.batches.append(tuple(group.key for group in groups))
+        outcomes: list[RunSummary | FbnError] = []
+        for group in groups:
+            try:
+                outcomes.append(self.run_once(group, policy))
+            except FbnError as exc:
+                outcomes.append(exc)
+        return tuple(outcomes)
+
+
+def test_multiple_groups_are_checked_in_persisted_due_order() -> None:
+    clock = FakeClock()
+    first = GroupRef("first", "https://www.facebook.com/groups/first/")
+    second = GroupRef("second", "https://www.facebook.com/groups/second/")
+    third = GroupRef("third", "https://www.facebook.com/groups/third/")
+    state = MultiGroupState(
+        {
+            "first": START + timedelta(minutes=30),
+            "second": None,
+            "third": START + timedelta(minutes=10),
+        }
+    )
+    service = MultiGroupService(
+        clock,
+        {"first": [None], "second": [None], "third": [None]},
+    )
+    event = FakeEvent(clock, [False, False, True])
+    loop = MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(hours=1), timedelta(hours=1)),
+        clock=clock,
+    )
+
+    loop.run_many((first, second, third), POLICY, stop_event=event)
+
+    assert service.attempts == [
+        ("second", START),
+        ("third", START + timedelta(minutes=10)),
+        ("first", START + timedelta(minutes=30)),
+    ]
+    assert event.waits == [10 * 60, 20 * 60, 30 * 60]
+    assert loop.current_group is first
+
+
+def test_active_peer_defers_only_the_contended_group() -> None:
+    clock = FakeClock()
+    busy = GroupRef("busy", "https://www.facebook.com/groups/busy/")
+    free = GroupRef("free", "https://www.facebook.com/groups/free/")
+    state = MultiGroupState({"busy": None, "free": START + timedelta(minutes=5)})
+    service = MultiGroupService(
+        clock,
+        {"busy": [MonitorInUseError("already active"), None], "free": [None]},
+    )
+    event = FakeEvent(clock, [False, False, True])
+
+    MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(minutes=15), timedelta(minutes=15)),
+        clock=clock,
+        uniform=lambda lower, upper: lower,
+    ).run_many((busy, free), POLICY, stop_event=event)
+
+    assert service.attempts == [
+        ("busy", START),
+        ("free", START + timedelta(minutes=5)),
+        ("busy", START + timedelta(minutes=15)),
+    ]
+    assert state.next_at["busy"] == START + timedelta(minutes=30)
+
+
+def test_run_many_requires_a_group() -> None:
+    clock = FakeClock()
+    with pytest.raises(ValueError, match="at least one group"):
+        MonitorLoop(
+            MultiGroupService(clock, {}),
+            MultiGroupState({}),
+            ScheduleSettings(),
+            clock=clock,
+        ).run_many((), POLICY, stop_event=FakeEvent(clock))
+
+
+def test_batch_checks_due_groups_together_and_keeps_per_group_outcomes() -> None:
+    clock = FakeClock()
+    groups = tuple(
+        GroupRef(key, f"https://www.facebook.com/groups/{key}/")
+        for key in ("first", "second", "third", "later")
+    )
+    state = MultiGroupState(
+        {
+            "first": None,
+            "second": None,
+            "third": None,
+            "later": START + timedelta(minutes=30),
+        }
+    )
+    service = MultiGroupService(
+        clock,
+        {
+            "first": [None],
+            "second": [TransientNavigationError("slow tab")],
+            "third": [None],
+            "later": [AuthenticationRequiredError("signed out")],
+        },
+    )
+    loop = MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(hours=1), timedelta(hours=1)),
+        clock=clock,
+        batch_size=2,
+    )
+
+    with pytest.raises(AuthenticationRequiredError):
+        loop.run_many(groups, POLICY, stop_event=FakeEvent(clock, [False]))
+
+    assert service.batches == [("first", "second")]
+    assert service.attempts[2] == ("third", START)
+    assert state.failures == {"second": 1}
+    assert state.next_at["first"] == START + timedelta(hours=1)
+    assert state.next_at["third"] == START + timedelta(hours=1)
+    assert loop.current_group is groups[3]
+
+
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_group_scoped_failures_back_off_one_group_and_others_keep_running(
+    batch_size: int,
+) -> None:
+    clock = FakeClock()
+    groups = tuple(
+        GroupRef(key, f"https://www.facebook.com/groups/{key}/")
+        for key in ("denied", "changed", "healthy")
+    )
+    state = MultiGroupState({group.key: None for group in groups})
+    service = MultiGroupService(
+        clock,
+        {
+            "denied": [AccessDeniedError("no access")] * 2,
+            "changed": [LayoutChangedError("unknown page")] * 2,
+            "healthy": [None, None],
+        },
+    )
+    reported: list[tuple[str, str]] = []
+
+    MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(hours=1), timedelta(hours=1)),
+        clock=clock,
+        on_group_failure=lambda group, error: reported.append(
+            (group.key, type(error).__name__)
+        ),
+        batch_size=batch_size,
+    ).run_many(groups, POLICY, stop_event=FakeEvent(clock, [False, True]))
+
+    later = START + timedelta(hours=1)
+    assert [key for key, _ in service.attempts] == [
+        "denied",
+        "changed",
+        "healthy",
+    ] * 2
+    assert service.attempts[-1] == ("healthy", later)
+    assert state.failures == {"denied": 2, "changed": 2}
+    assert state.next_at["denied"] == later + timedelta(hours=2)
+    assert state.next_at["healthy"] == later + timedelta(hours=1)
+    assert (
+        reported
+        == [
+            ("denied", "AccessDeniedError"),
+            ("changed", "LayoutChangedError"),
+        ]
+        * 2
+    )
+
+
+@pytest.mark.parametrize(
+    "error",
+    [AccessDeniedError("no access"), LayoutChangedError("unknown page")],
+)
+def test_group_scoped_failure_stops_a_single_group_monitor(error: FbnError) -> None:
+    clock = FakeClock()
+    group = GroupRef("only", "https://www.facebook.com/groups/only/")
+    state = MultiGroupState({"only": None})
+    service = MultiGroupService(clock, {"only": [error]})
+    loop = MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(hours=1), timedelta(hours=1)),
+        clock=clock,
+    )
+
+    with pytest.raises(type(error)):
+        loop.run(group, POLICY, stop_event=FakeEvent(clock, [False, False]))
+
+    assert state.failures == {}
+    assert loop.current_group is group
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_monitor_stops_once_every_group_has_a_group_scoped_failure(
+    batch_size: int,
+) -> None:
+    clock = FakeClock()
+    groups = tuple(
+        GroupRef(key, f"https://www.facebook.com/groups/{key}/")
+        for key in ("denied", "changed")
+    )
+    state = MultiGroupState({group.key: None for group in groups})
+    service = MultiGroupService(
+        clock,
+        {
+            "denied": [AccessDeniedError("no access")],
+            "changed": [LayoutChangedError("unknown page")],
+        },
+    )
+    loop = MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(hours=1), timedelta(hours=1)),
+        clock=clock,
+        batch_size=batch_size,
+    )
+
+    with pytest.raises(LayoutChangedError):
+        loop.run_many(groups, POLICY, stop_event=FakeEvent(clock, [False] * 3))
+
+    assert [key for key, _ in service.attempts] == ["denied", "changed"]
+    assert state.failures == {"denied": 1}
+    assert loop.current_group is groups[1]
+
+
+@pytest.mark.parametrize("batch_size", [0, True])
+def test_scheduler_rejects_invalid_batch_size(batch_size: int) -> None:
+    clock = FakeClock()
+    with pytest.raises(ValueError, match="batch_size"):
+        MonitorLoop(
+            MultiGroupService(clock, {}),
+            MultiGroupState({}),
+            ScheduleSettings(),
+            clock=clock,
+            batch_size=batch_size,
+        )
+
+
+def test_maintenance_runs_between_checks_at_most_once_per_interval() -> None:
+    clock = FakeClock()
+    state = FakeState()
+    service = FakeService(state, clock, [None, None, None])
+    maintained_at: list[datetime] = []
+
+    MonitorLoop(
+        service,
+        state,
+        ScheduleSettings(timedelta(hours=1), timedelta(hours=1)),
+        clock=clock,
+        uniform=lambda lower, upper: lower,
+        maintenance=lambda: maintained_at.append(clock()),
+        maintenance_interval=timedelta(minutes=90),
+    ).run(GROUP, POLICY, stop_event=FakeEvent(clock, [False, False, True]))
+
+    assert service.calls == 3
+    assert maintained_at == [START, START + timedelta(hours=2)]
+
+
+def test_scheduler_rejects_a_nonpositive_maintenance_interval() -> None:
+    clock = FakeClock()
+    with pytest.raises(ValueError, match="maintenance_interval"):
+        MonitorLoop(
+            MultiGroupService(clock, {}),
+            MultiGroupState({}),
+            ScheduleSettings(),
+            clock=clock,
+            maintenance_interval=timedelta(0),
+        )
@@ -11,6 +11,7 @@ from zoneinfo import ZoneInfo
 import pytest
 
 import fbn.state as state_module
+from fbn.config import DeliveryRetrySettings, RetentionSettings
 from fbn.models import GroupRef, Post
 from fbn.state import SQLiteStateRepository
 
@@ -87,7 +88,351 @@ def test_restart_safe_deduplication_queues_only_unseen_posts(
     assert [item.post_id for item in observation.pending] == ["new"]
 
 
-def test_run_lock_rejects_a_competing_process(tmp_path: Path) -> None:
+def test_known_post_ids_are_scoped_to_the_group(tmp_path: Path) -> None:
+    other = GroupRef(
+        key="other-group",
+        url="https://www.facebook.com/groups/other-group/",
+    )
+    with SQLiteStateRepository(tmp_path / "state.sqlite3", clock=lambda: T0) as state:
+        state.observe(GROUP, (post("a"), post("b", position=1)))
+
+        assert state.known_post_ids(GROUP, ["b", "c", "a"]) == {"a", "b"}
+        assert state.known_post_ids(other, ["a", "b"]) == frozenset()
+        assert state.known_post_ids(GROUP, []) == frozenset()
+
+
+def test_seen_index_answers_known_scans_without_staging_them(
+    tmp_path: Path,
+) -> None:
+    state_path = tmp_path / "state.sqlite3"
+    later = T0 + timedelta(hours=1)
+    with SQLiteStateRepository(state_path) as repository:
+        repository.observe(GROUP, (post("a"), post("b", position=1)), observed_at=T0)
+
+    with SQLiteStateRepository(state_path, seen_index_size=2) as repository:
+        statements: list[str] = []
+        connection = repository._require_connection()
+        connection.set_trace_callback(statements.append)
+        known = repository.known_post_ids(GROUP, ["a", "b"])
+        lookups = list(statements)
+        observation = repository.observe(
+            GROUP,
+            (post("b", observed_at=later), post("a", position=1, observed_at=later)),
+            observed_at=later,
+        )
+        connection.set_trace_callback(None)
+        last_seen = connection.execute(
+            "SELECT DISTINCT last_seen_at FROM posts"
+        ).fetchall()
+
+    assert known == {"a", "b"}
+    assert lookups == []
+    assert observation.inserted == 0
+    assert observation.queued == 0
+    assert not any("scan_posts" in statement for statement in statements)
+    assert [row[0] for row in last_seen] == [later.isoformat(timespec="microseconds")]
+
+
+def test_seen_index_falls_back_to_sqlite_when_an_indexed_post_was_pruned(
+    tmp_path: Path,
+) -> None:
+    state_path = tmp_path / "state.sqlite3"
+    later = T0 + timedelta(hours=1)
+    with SQLiteStateRepository(state_path, seen_index_size=10) as repository:
+        repository.observe(GROUP, (post("a"), post("b", position=1)), observed_at=T0)
+        with sqlite3.connect(state_path) as other:
+            other.execute("DELETE FROM posts WHERE post_id = 'b'")
+        observation = repository.observe(
+            GROUP,
+            (post("a", observed_at=later), post("b", position=1, observed_at=later)),
+            observed_at=later,
+        )
+        assert repository.known_post_ids(GROUP, ["a", "b"]) == {"a", "b"}
+
+    assert observation.inserted == 1
+    assert [item.post_id for item in observation.pending] == ["b"]
+
+
+def test_seen_index_is_bounded_to_the_most_recently_seen_posts(
+    tmp_path: Path,
+) -> None:
+    state_path = tmp_path / "state.sqlite3"
+    with SQLiteStateRepository(state_path) as repository:
+        repository.observe(GROUP, (post("old"),), observed_at=T0)
+        repository.observe(
+            GROUP,
+            (post("mid"), post("new", position=1)),
+            observed_at=T0 + timedelta(hours=1),
+        )
+
+    with SQLiteStateRepository(state_path, seen_index_size=2) as repository:
+        indexed = repository._seen.known(GROUP.key, ["old", "mid", "new"])  # type: ignore[union-attr]
+
+    assert indexed == {"mid", "new"}
+    with pytest.raises(ValueError, match="seen_index_size"):
+        SQLiteStateRepository(state_path, seen_index_size=-1)
+
+
+def test_scans_with_nothing_new_within_the_granularity_write_nothing(
+    tmp_path: Path,
+) -> None:
+    state_path = tmp_path / "state.sqlite3"
+    scans = [T0 + timedelta(minutes=minutes) for minutes in (0, 15, 30, 45)]
+    with (
+        SQLiteStateRepository(
+            state_path,
+            seen_granularity=timedelta(hours=1),
+        ) as repository,
+        sqlite3.connect(state_path) as observer,
+    ):
+        repository.observe(
+            GROUP,
+            (post("a"), post("b", position=1), post("c", position=2)),
+            observed_at=scans[0],
+        )
+        versions = [observer.execute("PRAGMA data_version").fetchone()[0]]
+        idle = repository.observe(
+            GROUP,
+            (post("a"), post("b", position=1)),
+            observed_at=scans[1],
+        )
+        versions.append(observer.execute("PRAGMA data_version").fetchone()[0])
+        empty = repository.observe(GROUP, (), observed_at=scans[2])
+        versions.append(observer.execute("PRAGMA data_version").fetchone()[0])
+        repository.observe(
+            GROUP,
+            (post("new"), post("a", position=1)),
+            observed_at=scans[3],
+        )
+        versions.append(observer.execute("PRAGMA data_version").fetchone()[0])
+        staged = repository._require_connection().execute(
+            "SELECT COUNT(*) FROM temp.scan_posts"
+        )
+
+        assert staged.fetchone()[0] == 0
+    assert (idle.inserted, idle.queued, idle.baseline) == (0, 0, False)
+    assert empty.inserted == 0
+    assert versions[0] == versions[1] == versions[2] != versions[3]
+
+
+@pytest.mark.parametrize(
+    ("scanned", "later"),
+    [
+        # "b" was not in the latest written scan, so its row must be refreshed.
+        (("a", "b"), timedelta(minutes=15)),
+        # The latest written scan is older than the granularity.
+        (("a",), timedelta(hours=2)),
+    ],
+)
+def test_scans_that_would_leave_stale_rows_still_write(
+    tmp_path: Path,
+    scanned: tuple[str, ...],
+    later: timedelta,
+) -> None:
+    state_path = tmp_path / "state.sqlite3"
+    with SQLiteStateRepository(
+        state_path,
+        seen_granularity=timedelta(hours=1),
+    ) as repository:
+        repository.observe(GROUP, (post("a"), post("b", position=1)), observed_at=T0)
+        repository.observe(
+            GROUP,
+            (post("a"), post("c", position=1)),
+            observed_at=T0 + timedelta(minutes=5),
+        )
+        scan_time = T0 + timedelta(minutes=5) + later
+        repository.observe(
+            GROUP,
+            tuple(post(post_id, position=at) for at, post_id in enumerate(scanned)),
+            observed_at=scan_time,
+        )
+        last_seen = dict(
+            repository._require_connection()
+            .execute("SELECT post_id, last_seen_at FROM posts")
+            .fetchall()
+        )
+
+    assert [last_seen[post_id] for post_id in scanned] == [
+        scan_time.isoformat(timespec="microseconds")
+    ] * len(scanned)
+
+
+def test_a_failure_streak_is_reset_even_when_nothing_is_new(tmp_path: Path) -> None:
+    with SQLiteStateRepository(
+        tmp_path / "state.sqlite3",
+        seen_granularity=timedelta(hours=1),
+    ) as repository:
+        repository.observe(GROUP, (post("a"),), observed_at=T0)
+        repository.record_failure(
+            GROUP,
+            next_eligible_at=T0 + timedelta(minutes=30),
+            at=T0 + timedelta(minutes=1),
+        )
+        repository.observe(GROUP, (post("a"),), observed_at=T0 + timedelta(minutes=2))
+
+        assert repository.consecutive_failures(GROUP) == 0
+    with pytest.raises(ValueError, match="seen_granularity"):
+        SQLiteStateRepository(
+            tmp_path / "state.sqlite3",
+            seen_granularity=timedelta(seconds=-1),
+        )
+
+
+def test_rescan_updates_seen_posts_in_place_and_clears_the_staging_table(
+    tmp_path: Path,
+) -> None:
+    later = T0 + timedelta(hours=1)
+    moved = Post(
+        group_key=GROUP.key,
+        post_id="seen",
+        url=f"https://www.facebook.com/groups/{GROUP.key}/permalink/seen/",
+        text="body seen",
+        author="Author",
+        observed_at=later,
+        position=1,
+    )
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        repository.observe(
+            GROUP, (post("seen"), post("kept", position=1)), observed_at=T0
+        )
+        observation = repository.observe(
+            GROUP,
+            (post("new", observed_at=later), moved),
+            observed_at=later,
+        )
+        connection = repository._require_connection()
+        rows = connection.execute(
+            """
+            SELECT post_id, canonical_url, first_seen_at, last_seen_at
+            FROM posts
+            ORDER BY post_id
+            """
+        ).fetchall()
+        staged = connection.execute("SELECT COUNT(*) FROM temp.scan_posts").fetchone()
+
+    assert observation.inserted == 1
+    assert [item.post_id for item in observation.pending] == ["new"]
+    assert [tuple(row) for row in rows] == [
+        (
+            "kept",
+            post("kept").url,
+            T0.isoformat(timespec="microseconds"),
+            T0.isoformat(timespec="microseconds"),
+        ),
+        (
+            "new",
+            post("new").url,
+            later.isoformat(timespec="microseconds"),
+            later.isoformat(timespec="microseconds"),
+        ),
+        (
+            "seen",
+            moved.url,
+            T0.isoformat(timespec="microseconds"),
+            later.isoformat(timespec="microseconds"),
+        ),
+    ]
+    assert staged[0] == 0
+
+
+def _post_ids(repository: SQLiteStateRepository) -> list[str]:
+    rows = (
+        repository._require_connection()
+        .execute("SELECT post_id FROM posts ORDER BY post_id")
+        .fetchall()
+    )
+    return [row["post_id"] for row in rows]
+
+
+def test_compaction_prunes_expired_history_but_keeps_the_latest_scan(
+    tmp_path: Path,
+) -> None:
+    later = T0 + timedelta(days=100)
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        repository.observe(GROUP, (post("old-one"), post("old-two")), observed_at=T0)
+        repository.observe(
+            GROUP, (post("recent", observed_at=later),), observed_at=later
+        )
+        (event,) = repository.pending(GROUP)
+
+        pruned = repository.compact(RetentionSettings(), now=later)
+        kept_while_pending = _post_ids(repository)
+        repository.mark_delivered([event.event_id], delivered_at=later)
+        delivered = repository.compact(
+            RetentionSettings(),
+            now=later + timedelta(days=8),
+        )
+        remaining = _post_ids(repository)
+
+    assert pruned.deleted_posts == 2
+    assert pruned.deleted_events == 0
+    assert kept_while_pending == ["recent"]
+    assert delivered.deleted_events == 1
+    assert delivered.deleted_posts == 0
+    assert remaining == ["recent"]
+
+
+def test_compaction_never_prunes_a_group_whose_only_scan_is_old(
+    tmp_path: Path,
+) -> None:
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        repository.observe(GROUP, (post("one"), post("two")), observed_at=T0)
+        summary = repository.compact(
+            RetentionSettings(post_days=1),
+            now=T0 + timedelta(days=365),
+        )
+        remaining = _post_ids(repository)
+
+    assert summary.deleted_posts == 0
+    assert remaining == ["one", "two"]
+
+
+def test_compaction_count_limit_keeps_the_most_recently_seen_posts(
+    tmp_path: Path,
+) -> None:
+    later = T0 + timedelta(hours=1)
+    history = tuple(post(f"old-{index:02d}", position=index) for index in range(55))
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        repository.observe(GROUP, history, observed_at=T0)
+        repository.observe(GROUP, (post("new", observed_at=later),), observed_at=later)
+        summary = repository.compact(RetentionSettings(max_posts=50), now=later)
+        remaining = _post_ids(repository)
+
+    assert summary.deleted_posts == 6
+    assert len(remaining) == 50
+    assert "new" in remaining
+
+
+def test_new_state_files_use_incremental_vacuum_and_full_compaction_converts(
+    tmp_path: Path,
+) -> None:
+    legacy_path = tmp_path / "legacy.sqlite3"
+    with sqlite3.connect(legacy_path) as legacy:
+        legacy.execute("CREATE TABLE legacy_marker (value INTEGER)")
+    legacy.close()
+
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        created_mode = (
+            repository._require_connection().execute("PRAGMA auto_vacuum").fetchone()
+        )
+    with SQLiteStateRepository(legacy_path) as repository:
+        connection = repository._require_connection()
+        legacy_mode = connection.execute("PRAGMA auto_vacuum").fetchone()
+        repository.compact(RetentionSettings(), full=True)
+        converted_mode = connection.execute("PRAGMA auto_vacuum").fetchone()
+        wal_bytes = legacy_path.with_name(f"{legacy_path.name}-wal").stat().st_size
+
+    assert created_mode[0] == 2
+    assert legacy_mode[0] == 0
+    assert converted_mode[0] == 2
+    assert wal_bytes == 0
+
+
+@pytest.mark.parametrize("purpose", ["run", "delivery"])
+def test_run_and_delivery_locks_reject_a_competing_process(
+    tmp_path: Path,
+    purpose: str,
+) -> None:
     state_path = tmp_path / "state.sqlite3"
     script = """
 import sys
@@ -97,7 +442,7 @@ from fbn.state import SQLiteStateRepository
 
 repository = SQLiteStateRepository(sys.argv[1])
 try:
-    with repository.run_lock():
+    with getattr(repository, f"{sys.argv[2]}_lock")():
         pass
 except MonitorInUseError:
     raise SystemExit(0)
@@ -108,10 +453,10 @@ raise SystemExit(1)
 
     with (
         SQLiteStateRepository(state_path, clock=lambda: T0) as repository,
-        repository.run_lock(),
+        getattr(repository, f"{purpose}_lock")(),
     ):
         result = subprocess.run(
-            [sys.executable, "-c", script, str(state_path)],
+            [sys.executable, "-c", script, str(state_path), purpose],
             check=False,
             cwd=Path(__file__).parents[1],
             stdout=subprocess.DEVNULL,
@@ -120,7 +465,7 @@ raise SystemExit(1)
 
     assert result.returncode == 0
     if os.name != "nt":
-        lock_path = state_path.with_name(f".{state_path.name}.run.lock")
+        lock_path = state_path.with_name(f".{state_path.name}.{purpose}.lock")
         assert lock_path.stat().st_mode & 0o777 == 0o600
 
 
@@ -312,6 +657,207 @@ def test_failed_pending_delivery_survives_restart_and_success_erases_content(
     assert row["attempts"] == 1
 
 
+def test_failed_events_wait_out_a_doubling_delay_and_are_dead_lettered(
+    tmp_path: Path,
+) -> None:
+    now = [T0]
+    retry = DeliveryRetrySettings(
+        base_delay=timedelta(minutes=1),
+        max_delay=timedelta(hours=1),
+        max_attempts=3,
+    )
+    with SQLiteStateRepository(
+        tmp_path / "state.sqlite3",
+        clock=lambda: now[0],
+        retry=retry,
+    ) as repository:
+        repository.observe(GROUP, (post("baseline"),))
+        event_id = (
+            repository.observe(
+                GROUP,
+                (post("new"),),
+                observed_at=T0,
+            )
+            .pending[0]
+            .event_id
+        )
+
+        assert repository.mark_delivery_failed((event_id,), "first") == 0
+        assert repository.pending(GROUP, due_at=now[0] + timedelta(seconds=59)) == ()
+        assert len(repository.pending(GROUP, due_at=now[0] + timedelta(minutes=1))) == 1
+        assert len(repository.pending(GROUP)) == 1
+
+        now[0] += timedelta(minutes=1)
+        assert repository.mark_delivery_failed((event_id,), "second") == 0
+        assert repository.pending(GROUP, due_at=now[0] + timedelta(seconds=119)) == ()
+        rescan = repository.observe(
+            GROUP,
+            (post("new"),),
+            observed_at=now[0] + timedelta(minutes=1),
+        )
+        assert rescan.pending == ()
+
+        now[0] += timedelta(minutes=2)
+        assert repository.mark_delivery_failed((event_id,), "third") == 1
+        assert repository.mark_delivery_failed((event_id,), "after death") == 0
+        assert repository.pending(GROUP) == ()
+        assert repository.pending_group_keys() == ()
+        row = (
+            repository._require_connection()
+            .execute(
+                "SELECT attempts, last_error, dead_at FROM outbox WHERE event_id = ?",
+                (event_id,),
+            )
+            .fetchone()
+        )
+
+    assert (row["attempts"], row["last_error"]) == (3, "third")
+    assert row["dead_at"] is not None
+
+
+def test_state_files_without_retry_columns_are_migrated_in_place(
+    tmp_path: Path,
+) -> None:
+    state_path = tmp_path / "state.sqlite3"
+    with SQLiteStateRepository(state_path, clock=lambda: T0) as repository:
+        repository.observe(GROUP, (post("baseline"),))
+        repository.observe(GROUP, (post("new"),), observed_at=T0)
+        connection = repository._require_connection()
+        connection.execute("ALTER TABLE outbox DROP COLUMN next_attempt_at")
+        connection.execute("ALTER TABLE outbox DROP COLUMN dead_at")
+        connection.execute("ALTER TABLE groups DROP COLUMN arrival_rate")
+        connection.execute("ALTER TABLE groups DROP COLUMN arrival_rate_at")
+        connection.execute("PRAGMA user_version = 2")
+
+    with SQLiteStateRepository(state_path, clock=lambda: T0) as repository:
+        connection = repository._require_connection()
+        columns = {
+            row["name"]
+            for table in ("outbox", "groups")
+            for row in connection.execute(f"PRAGMA table_info({table})")
+        }
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        assert [item.post_id for item in repository.pending(GROUP)] == ["new"]
+
+    assert {"next_attempt_at", "dead_at", "arrival_rate", "arrival_rate_at"} <= columns
+    assert version == 4
+
+
+def test_arrival_rate_excludes_the_baseline_and_decays_with_elapsed_time(
+    tmp_path: Path,
+) -> None:
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        repository.observe(
+            GROUP,
+            tuple(post(f"baseline-{index}", position=index) for index in range(30)),
+            observed_at=T0,
+        )
+        first = repository.update_arrival_rate(GROUP, at=T0)
+        repository.observe(
+            GROUP,
+            (post("a"), post("b", position=1), post("baseline-0", position=2)),
+            observed_at=T0 + timedelta(hours=1),
+        )
+        learned = repository.update_arrival_rate(GROUP, at=T0 + timedelta(hours=2))
+        decayed = repository.update_arrival_rate(
+            GROUP, at=T0 + timedelta(days=4, hours=2)
+        )
+        repeated = repository.update_arrival_rate(
+            GROUP, at=T0 + timedelta(days=4, hours=2)
+        )
+
+    assert first is None
+    assert learned == 1.0
+    assert decayed == pytest.approx(0.25)
+    assert repeated == decayed
+
+
+def test_iter_pending_pages_by_key_while_events_are_being_delivered(
+    tmp_path: Path,
+) -> None:
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        repository.observe(GROUP, (post("baseline"),), observed_at=T0)
+        batch = repository.observe(
+            GROUP,
+            tuple(post(str(index), position=index) for index in range(5)),
+            observed_at=T0 + timedelta(minutes=1),
+            load_pending=False,
+        )
+        assert (batch.queued, batch.pending) == (5, ())
+        repository.observe(
+            GROUP,
+            (post("later", position=0),),
+            observed_at=T0 + timedelta(minutes=2),
+        )
+        expected = [item.event_id for item in repository.pending(GROUP)]
+        assert repository.pending_count(GROUP) == len(expected)
+
+        streamed = []
+        for item in repository.iter_pending(GROUP, page_size=2):
+            streamed.append(item.event_id)
+            repository.mark_delivered((item.event_id,), delivered_at=T0)
+
+        assert streamed == expected
+        assert repository.pending(GROUP) == ()
+        assert repository.pending_count(GROUP) == 0
+        with pytest.raises(ValueError, match="page_size"):
+            next(repository.iter_pending(GROUP, page_size=0))
+
+    assert len(expected) == 6
+
+
+def test_destination_deliveries_are_tracked_separately_until_complete(
+    tmp_path: Path,
+) -> None:
+    with SQLiteStateRepository(tmp_path / "state.sqlite3") as repository:
+        repository.observe(GROUP, (post("baseline"),), observed_at=T0)
+        event_id = (
+            repository.observe(
+                GROUP,
+                (post("new"),),
+                observed_at=T0 + timedelta(hours=1),
+            )
+            .pending[0]
+            .event_id
+        )
+
+        repository.mark_delivered((event_id,), destination="chat-1")
+        repository.mark_delivery_failed((event_id,), "timed out", destination="mail-2")
+        repository.mark_delivery_failed((event_id,), "timed out", destination="mail-2")
+
+        (pending,) = repository.pending(GROUP)
+        assert pending.delivered_to == frozenset({"chat-1"})
+        assert pending.body == "body new"
+        assert pending.attempts == 0
+        rows = {
+            row["destination"]: (row["attempts"], row["last_error"])
+            for row in repository._require_connection().execute(
+                "SELECT destination, attempts, last_error FROM deliveries"
+            )
+        }
+        assert rows == {"chat-1": (0, None), "mail-2": (2, "timed out")}
+
+        repository.mark_delivered((event_id,), destination="mail-2")
+        assert repository.pending(GROUP)[0].delivered_to == {"chat-1", "mail-2"}
+        repository.mark_delivered((event_id,), delivered_at=T0 + timedelta(hours=2))
+        assert repository.pending(GROUP) == ()
+
+        with pytest.raises(ValueError, match="destination"):
+            repository.mark_delivered((event_id,), destination="mailto://secret")
+        summary = repository.compact(
+            RetentionSettings(outbox_days=0),
+            now=T0 + timedelta(days=1),
+        )
+        remaining = (
+            repository._require_connection()
+            .execute("SELECT COUNT(*) FROM deliveries")
+            .fetchone()[0]
+        )
+
+    assert summary.deleted_events == 1
+    assert remaining == 0
+
+
 def test_pending_order_remains_deterministic_across_scans(tmp_path: Path) -> None:
     state_path = tmp_path / "state.sqlite3"
     with SQLiteStateRepository(state_path, clock=lambda: T0) as repository: